@@ -1 +0,0 @@
-from checkov.arm.checks import *
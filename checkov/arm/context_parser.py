@@ -3,6 +3,9 @@ import operator
 from functools import reduce
 import re
 
+from checkov.common.comment.suppression_index import parse_skip_comment, to_skipped_checks
+from checkov.common.util.line_store import get_code_block
+
 #COMMENT_REGEX = re.compile(r'(checkov:skip=) *([A-Z_\d]+)(:[^\n]+)?')
 COMMENT_REGEX = re.compile(r'([A-Z_\d]+)(:[^\n]+)?')
 
@@ -89,7 +92,7 @@ class ContextParser(object):
 
             entity_lines_range = [start_line, end_line]
 
-            entity_code_lines = self.arm_template_lines[start_line - 1: end_line]
+            entity_code_lines = get_code_block(self.arm_template_lines, start_line - 1, end_line)
             return entity_lines_range, entity_code_lines
         return None, None
 
@@ -108,32 +111,18 @@ class ContextParser(object):
 
     @staticmethod
     def collect_skip_comments(resource):
-        skipped_checks = []
+        skip_infos = []
         if "metadata" in resource:
             if "checkov" in resource["metadata"]:
-                if isinstance(resource["metadata"]["checkov"], list):
-                    for index, item in enumerate(resource["metadata"]["checkov"]):
-                        skip_search = re.search(COMMENT_REGEX, str(item))
-                        if skip_search:
-                            skipped_checks.append(
-                                {
-                                    'id': skip_search.group(1),
-                                    'suppress_comment': skip_search.group(2)[1:] if skip_search.group(
-                                        2) else "No comment provided"
-                                }
-                            )
-                else:
-                    skip_search = re.search(COMMENT_REGEX, str(resource["metadata"]["checkov"]))
-                    if skip_search:
-                        skipped_checks.append(
-                            {
-                                'id': skip_search.group(1),
-                                'suppress_comment': skip_search.group(2)[1:] if skip_search.group(
-                                    2) else "No comment provided"
-                            }
-                        )
-
-        return skipped_checks
+                skip_comments = resource["metadata"]["checkov"]
+                if not isinstance(skip_comments, list):
+                    skip_comments = [skip_comments]
+                for item in skip_comments:
+                    skip_info = parse_skip_comment(str(item), COMMENT_REGEX, check_id_group=1)
+                    if skip_info:
+                        skip_infos.append(skip_info)
+
+        return to_skipped_checks(skip_infos)
 
     @staticmethod
     def search_deep_keys(search_text, arm_dict, path):
@@ -8,6 +8,8 @@ from json.decoder import WHITESPACE, WHITESPACE_STR, BACKSLASH, STRINGCHUNK
 from json.scanner import NUMBER_RE
 
 from checkov.arm.parser.node import str_node, dict_node, list_node
+from checkov.common.util.document_store import document_store
+from checkov.common.util.parse_cache import parse_cache
 
 LOGGER = logging.getLogger(__name__)
 
@@ -332,18 +334,13 @@ def get_beg_end_mark(s, start, end):
     return beg_mark, end_mark
 
 
+@parse_cache.cached(__name__)
 def load(filename):
     """
     Load the given JSON file
     """
 
-    content = ''
-
-    with open(filename) as fp:
-        content = fp.read()
-        fp.seek(0)
-        file_lines = [(ind + 1, line) for (ind, line) in
-                      list(enumerate(fp.readlines()))]
+    content, file_lines = document_store.read(filename)
 
     return (json.loads(content, cls=CfnJSONDecoder), file_lines)
 
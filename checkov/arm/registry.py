@@ -1,3 +1,3 @@
 from checkov.arm.base_registry import Registry
 
-arm_registry = Registry()
+arm_registry = Registry(checks_manifest_key='arm')
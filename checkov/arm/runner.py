@@ -4,8 +4,10 @@ import os
 from checkov.arm.registry import arm_registry
 from checkov.arm.parser import parse
 from checkov.common.output.record import Record
-from checkov.common.output.report import Report
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_directories
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.runners.framework_sniffer import framework_sniffer
+from checkov.common.util.line_store import line_store
 from checkov.runner_filter import RunnerFilter
 from checkov.arm.parser.node import dict_node
 from checkov.arm.context_parser import ContextParser
@@ -16,11 +18,10 @@ ARM_POSSIBLE_ENDINGS = [".json"]
 class Runner(BaseRunner):
     check_type = "arm"
 
-    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True):
-        report = Report(self.check_type)
+    def run_records(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+                    collect_skip_comments=True, file_discovery=None, parsing_errors=None):
         definitions = {}
         definitions_raw = {}
-        parsing_errors = {}
         files_list = []
         if external_checks_dir:
             for directory in external_checks_dir:
@@ -29,18 +30,19 @@ class Runner(BaseRunner):
         if files:
             for file in files:
                 (definitions[file], definitions_raw[file]) = parse(file)
+                definitions_raw[file] = line_store.bind(file, definitions_raw[file])
 
         if root_folder:
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_directories(d_names)
-                for file in f_names:
-                    file_ending = os.path.splitext(file)[1]
-                    if file_ending in ARM_POSSIBLE_ENDINGS:
-                        files_list.append(os.path.join(root, file))
+            file_discovery = file_discovery or FileDiscovery(root_folder)
+            files_list = file_discovery.get_files(extensions=ARM_POSSIBLE_ENDINGS)
 
             for file in files_list:
+                if not framework_sniffer.may_match(file, self.check_type):
+                    continue
                 relative_file_path = f'/{os.path.relpath(file, os.path.commonprefix((root_folder, file)))}'
                 (definitions[relative_file_path], definitions_raw[relative_file_path]) = parse(file)
+                definitions_raw[relative_file_path] = line_store.bind(file, definitions_raw[relative_file_path])
+                framework_sniffer.audit(file, self.check_type, definitions[relative_file_path] is not None)
 
         # Filter out empty files that have not been parsed successfully, and filter out non-CF template files
         definitions = {k: v for k, v in definitions.items() if v and v.__contains__("resources")}
@@ -82,11 +84,14 @@ class Runner(BaseRunner):
 
                         results = arm_registry.scan(arm_file, {resource_name: resource}, skipped_checks,
                                                     runner_filter)
+                        results, result_counts = self.split_results(results, runner_filter, arm_file,
+                                                                    entity_lines_range)
                         for check, check_result in results.items():
                             record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                             code_block=entity_code_lines, file_path=arm_file,
                                             file_line_range=entity_lines_range,
                                             resource=resource_id, evaluations=variable_evaluations,
                                             check_class=check.__class__.__module__)
-                            report.add_record(record=record)
-        return report
+                            yield record
+                        if result_counts is not None:
+                            yield result_counts
@@ -1 +0,0 @@
-from checkov.cloudformation.checks.resource.aws import *
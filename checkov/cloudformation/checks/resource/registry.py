@@ -1,3 +1,3 @@
 from checkov.cloudformation.checks.resource.base_registry import Registry
 
-cfn_registry = Registry()
+cfn_registry = Registry(checks_manifest_key='cloudformation')
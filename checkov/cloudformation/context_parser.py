@@ -1,9 +1,8 @@
 import logging
 import operator
 from functools import reduce
-import re
-from checkov.common.comment.enum import COMMENT_REGEX
 
+from checkov.common.util.line_store import get_code_block
 
 
 class ContextParser(object):
@@ -58,7 +57,7 @@ class ContextParser(object):
 
             entity_lines_range = [start_line, end_line - 1]
 
-            entity_code_lines = self.cf_template_lines[start_line - 1: end_line - 1]
+            entity_code_lines = get_code_block(self.cf_template_lines, start_line - 1, end_line - 1)
             return entity_lines_range, entity_code_lines
         return None, None
 
@@ -75,21 +74,6 @@ class ContextParser(object):
                 for x in ContextParser.find_lines(j, kv):
                     yield x
 
-    @staticmethod
-    def collect_skip_comments(entity_code_lines):
-        skipped_checks = []
-        for line in entity_code_lines:
-            skip_search = re.search(COMMENT_REGEX, str(line))
-            if skip_search:
-                skipped_checks.append(
-                    {
-                        'id': skip_search.group(2),
-                        'suppress_comment': skip_search.group(3)[1:] if skip_search.group(
-                            3) else "No comment provided"
-                    }
-                )
-        return skipped_checks
-
     @staticmethod
     def search_deep_keys(search_text, cfn_dict, path):
         """Search deep for keys and get their values"""
@@ -4,6 +4,7 @@ SPDX-License-Identifier: MIT-0
 """
 import logging
 import six
+import yaml
 from yaml import MappingNode
 from yaml import ScalarNode
 from yaml import SequenceNode
@@ -15,6 +16,8 @@ from yaml.resolver import Resolver
 from yaml.scanner import Scanner
 
 from checkov.cloudformation.parser.node import str_node, dict_node, list_node
+from checkov.common.util.document_store import document_store
+from checkov.common.util.parse_cache import parse_cache
 
 try:
     from yaml.cyaml import CParser as Parser  # pylint: disable=ungrouped-imports
@@ -200,17 +203,27 @@ def loads(yaml_string, fname=None):
     return template
 
 
+def construct(node, fname=None):
+    """
+    Construct the template of the given composed YAML node
+    """
+    loader = MarkedLoader('', fname)
+    loader.add_multi_constructor('!', multi_constructor)
+
+    template = loader.construct_document(node) if node is not None else None
+    # Convert an empty file to an empty dict
+    if template is None:
+        template = {}
+
+    return template
+
+
+@parse_cache.cached(__name__, yaml.__version__)
 def load(filename):
     """
     Load the given YAML file
     """
 
-    content = ''
-
-    with open(filename) as fp:
-        content = fp.read()
-        fp.seek(0)
-        file_lines = [(ind + 1, line) for (ind, line) in
-                      list(enumerate(fp.readlines()))]
+    _, file_lines = document_store.read(filename)
 
-    return (loads(content, filename), file_lines)
+    return (construct(document_store.compose(filename).get_single_node(), filename), file_lines)
@@ -46,7 +46,12 @@ def create_str_node_class(cls):
         def __copy__(self):
             return self
 
+        def __getnewargs__(self):
+            return cls(self), self.start_mark, self.end_mark
+
     node_class.__name__ = '%s_node' % cls.__name__
+    # Allow nodes to be pickled by reference to their module level name (e.g. dict_node)
+    node_class.__qualname__ = node_class.__name__
     return node_class
 
 
@@ -156,6 +161,8 @@ def create_dict_node_class(cls):
             raise TemplateAttributeError('%s.%s is invalid' % (self.__class__.__name__, name))
 
     node_class.__name__ = '%s_node' % cls.__name__
+    # Allow nodes to be pickled by reference to their module level name (e.g. dict_node)
+    node_class.__qualname__ = node_class.__name__
     return node_class
 
 
@@ -202,6 +209,8 @@ def create_dict_list_class(cls):
             raise TemplateAttributeError('%s.%s is invalid' % (self.__class__.__name__, name))
 
     node_class.__name__ = '%s_node' % cls.__name__
+    # Allow nodes to be pickled by reference to their module level name (e.g. dict_node)
+    node_class.__qualname__ = node_class.__name__
     return node_class
 
 
@@ -3,9 +3,12 @@ import os
 
 from checkov.cloudformation.checks.resource.registry import cfn_registry
 from checkov.cloudformation.parser import parse
+from checkov.common.comment.suppression_index import SuppressionIndex
 from checkov.common.output.record import Record
-from checkov.common.output.report import Report
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_directories
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.runners.framework_sniffer import framework_sniffer
+from checkov.common.util.line_store import line_store
 from checkov.runner_filter import RunnerFilter
 from checkov.cloudformation.parser.node import dict_node
 from checkov.cloudformation.context_parser import ContextParser
@@ -16,11 +19,10 @@ CF_POSSIBLE_ENDINGS = [".yml", ".yaml", ".json", ".template"]
 class Runner(BaseRunner):
     check_type = "cloudformation"
 
-    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True):
-        report = Report(self.check_type)
+    def run_records(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+                    collect_skip_comments=True, file_discovery=None, parsing_errors=None):
         definitions = {}
         definitions_raw = {}
-        parsing_errors = {}
         files_list = []
         if external_checks_dir:
             for directory in external_checks_dir:
@@ -29,19 +31,22 @@ class Runner(BaseRunner):
         if files:
             for file in files:
                 (definitions[file], definitions_raw[file]) = parse(file)
+                definitions_raw[file] = line_store.bind(file, definitions_raw[file])
 
         if root_folder:
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_directories(d_names)
-                for file in f_names:
-                    file_ending = os.path.splitext(file)[1]
-                    if file_ending in CF_POSSIBLE_ENDINGS:
-                        files_list.append(os.path.join(root, file))
+            file_discovery = file_discovery or FileDiscovery(root_folder)
+            files_list = file_discovery.get_files(extensions=CF_POSSIBLE_ENDINGS)
 
             for file in files_list:
+                if not framework_sniffer.may_match(file, self.check_type):
+                    continue
                 relative_file_path = f'/{os.path.relpath(file, os.path.commonprefix((root_folder, file)))}'
                 try:
                     (definitions[relative_file_path], definitions_raw[relative_file_path]) = parse(file)
+                    definitions_raw[relative_file_path] = line_store.bind(file, definitions_raw[relative_file_path])
+                    template = definitions[relative_file_path]
+                    framework_sniffer.audit(file, self.check_type,
+                                            isinstance(template, dict) and 'Resources' in template)
                 except TypeError:
                     logging.info(f'CloudFormation skipping {file} as it is not a valid CF template')
 
@@ -54,6 +59,7 @@ class Runner(BaseRunner):
                 cf_context_parser = ContextParser(cf_file, definitions[cf_file], definitions_raw[cf_file])
                 logging.debug("Template Dump for {}: {}".format(cf_file, definitions[cf_file], indent=2))
                 cf_context_parser.evaluate_default_refs()
+                suppression_index = SuppressionIndex(definitions_raw[cf_file])
                 for resource_name, resource in definitions[cf_file]['Resources'].items():
                     resource_id = cf_context_parser.extract_cf_resource_id(resource, resource_name)
                     # check that the resource can be parsed as a CF resource
@@ -63,15 +69,18 @@ class Runner(BaseRunner):
                             # TODO - Variable Eval Message!
                             variable_evaluations = {}
 
-                            skipped_checks = ContextParser.collect_skip_comments(entity_code_lines)
+                            skipped_checks = suppression_index.get_skipped_checks(*entity_lines_range)
 
                             results = cfn_registry.scan(cf_file, {resource_name: resource}, skipped_checks,
                                                         runner_filter)
+                            results, result_counts = self.split_results(results, runner_filter, cf_file,
+                                                                        entity_lines_range)
                             for check, check_result in results.items():
                                 record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                                 code_block=entity_code_lines, file_path=cf_file,
                                                 file_line_range=entity_lines_range,
                                                 resource=resource_id, evaluations=variable_evaluations,
                                                 check_class=check.__class__.__module__)
-                                report.add_record(record=record)
-        return report
\ No newline at end of file
+                                yield record
+                            if result_counts is not None:
+                                yield result_counts
\ No newline at end of file
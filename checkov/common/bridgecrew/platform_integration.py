@@ -4,24 +4,33 @@ import os
 from json import JSONDecodeError
 from time import sleep
 
-import boto3
 import dpath.util
-import urllib3
-from botocore.exceptions import ClientError
-from urllib3.exceptions import HTTPError
 
 from checkov.common.bridgecrew.platform_errors import BridgecrewAuthError
 from checkov.common.models.consts import SUPPORTED_FILE_EXTENSIONS
+from checkov.common.runners.file_discovery import FileDiscovery
 from .wrapper import reduce_scan_reports, persist_checks_results, enrich_and_persist_checks_metadata
 
 UNAUTHORIZED_MESSAGE = 'User is not authorized to access this resource with an explicit deny'
 
 DEFAULT_REGION = "us-west-2"
 
-try:
-    http = urllib3.ProxyManager(os.environ['https_proxy'])
-except KeyError:
-    http = urllib3.PoolManager()
+_http = None
+
+
+def get_http():
+    """
+    :return: the urllib3 pool manager of the requests to Bridgecrew's platform, created on the first request
+    """
+    global _http
+    if _http is None:
+        # urllib3 (and boto3) are imported when the platform is used, as they are slow to import
+        import urllib3
+        try:
+            _http = urllib3.ProxyManager(os.environ['https_proxy'])
+        except KeyError:
+            _http = urllib3.PoolManager()
+    return _http
 
 
 class BcPlatformIntegration(object):
@@ -45,11 +54,15 @@ class BcPlatformIntegration(object):
         :param repo_id: Identity string of the scanned repository, of the form <repo_owner>/<repo_name>
         :param bc_api_key: Bridgecrew issued API key
         """
+        import boto3
+        from botocore.exceptions import ClientError
+        from urllib3.exceptions import HTTPError
+
         self.bc_api_key = bc_api_key
         self.repo_id = repo_id
         try:
-            request = http.request("POST", self.integrations_api_url, body=json.dumps({"repoId": repo_id}),
-                                   headers={"Authorization": bc_api_key, "Content-Type": "application/json"})
+            request = get_http().request("POST", self.integrations_api_url, body=json.dumps({"repoId": repo_id}),
+                                         headers={"Authorization": bc_api_key, "Content-Type": "application/json"})
             response = json.loads(request.data.decode("utf8"))
             if 'Message' in response:
                 if response['Message'] == UNAUTHORIZED_MESSAGE:
@@ -82,18 +95,17 @@ class BcPlatformIntegration(object):
         """
         return all([self.repo_path, self.credentials, self.s3_client])
 
-    def persist_repository(self, root_dir):
+    def persist_repository(self, root_dir, file_discovery=None):
         """
         Persist the repository found on root_dir path to Bridgecrew's platform
         :param root_dir: Absolute path of the directory containing the repository root level
+        :param file_discovery: FileDiscovery of root_dir, when it was already walked by the scan
         """
-        for root_path, d_names, f_names in os.walk(root_dir):
-            for file_path in f_names:
-                _, file_extension = os.path.splitext(file_path)
-                if file_extension in SUPPORTED_FILE_EXTENSIONS:
-                    full_file_path = os.path.join(root_path, file_path)
-                    relative_file_path = os.path.relpath(full_file_path, root_dir)
-                    self._persist_file(full_file_path, relative_file_path)
+        file_discovery = file_discovery or FileDiscovery(root_dir)
+        for full_file_path in file_discovery.get_files(extensions=SUPPORTED_FILE_EXTENSIONS,
+                                                       include_ignored_directories=True):
+            relative_file_path = os.path.relpath(full_file_path, root_dir)
+            self._persist_file(full_file_path, relative_file_path)
 
     def persist_scan_results(self, scan_reports):
         """
@@ -112,11 +124,13 @@ class BcPlatformIntegration(object):
         :param branch: branch to be persisted
         Finalize the repository's scanning in bridgecrew's platform.
         """
+        from urllib3.exceptions import HTTPError
+
         request = None
         try:
-            request = http.request("PUT", f"{self.integrations_api_url}?source={self.bc_source}",
-                                   body=json.dumps({"path": self.repo_path, "branch": branch}),
-                                   headers={"Authorization": self.bc_api_key, "Content-Type": "application/json"})
+            request = get_http().request("PUT", f"{self.integrations_api_url}?source={self.bc_source}",
+                                         body=json.dumps({"path": self.repo_path, "branch": branch}),
+                                         headers={"Authorization": self.bc_api_key, "Content-Type": "application/json"})
             response = json.loads(request.data.decode("utf8"))
         except HTTPError as e:
             logging.error(f"Failed to commit repository {self.repo_path}\n{e}")
@@ -131,6 +145,8 @@ class BcPlatformIntegration(object):
                 raise Exception(f"Failed to finalize repository {self.repo_id} in bridgecrew's platform\n{response}")
 
     def _persist_file(self, full_file_path, relative_file_path):
+        from botocore.exceptions import ClientError
+
         tries = 4
         curr_try = 0
         file_object_key = os.path.join(self.repo_path, relative_file_path)
@@ -153,7 +169,7 @@ class BcPlatformIntegration(object):
 
     def get_guidelines(self) -> dict:
         try:
-            request = http.request("GET", self.guidelines_api_url)
+            request = get_http().request("GET", self.guidelines_api_url)
             response = json.loads(request.data.decode("utf8"))
             guidelines_map = response["guidelines"]
             logging.debug(f"Got guidelines form Bridgecrew BE")
@@ -2,8 +2,8 @@ import logging
 import os
 import json
 import itertools
-import dpath.util
 from checkov.common.models.consts import SUPPORTED_FILE_EXTENSIONS
+from checkov.common.util.data_path import new_path
 
 checkov_results_prefix = 'checkov_results'
 check_reduced_keys = (
@@ -31,6 +31,13 @@ def _extract_checks_metadata(report, full_repo_object_key):
             list(itertools.chain(report.passed_checks, report.failed_checks, report.skipped_checks))}
 
 
+def _reduce_check(check):
+    reduced_check = {k: getattr(check, k) for k in check_reduced_keys}
+    # the record's check result is a mapping backed by the record, it is copied to a dict
+    reduced_check['check_result'] = dict(check.check_result)
+    return reduced_check
+
+
 def reduce_scan_reports(scan_reports):
     """
     Transform checkov reports objects into compact dictionaries
@@ -42,15 +49,9 @@ def reduce_scan_reports(scan_reports):
         reduced_scan_reports[report.check_type] = \
             {
                 "checks": {
-                    "passed_checks": [
-                        {k: getattr(check, k) for k in check_reduced_keys}
-                        for check in report.passed_checks],
-                    "failed_checks": [
-                        {k: getattr(check, k) for k in check_reduced_keys}
-                        for check in report.failed_checks],
-                    "skipped_checks": [
-                        {k: getattr(check, k) for k in check_reduced_keys}
-                        for check in report.skipped_checks]}}
+                    "passed_checks": [_reduce_check(check) for check in report.passed_checks],
+                    "failed_checks": [_reduce_check(check) for check in report.failed_checks],
+                    "skipped_checks": [_reduce_check(check) for check in report.skipped_checks]}}
     return reduced_scan_reports
 
 
@@ -77,6 +78,6 @@ def enrich_and_persist_checks_metadata(scan_reports, s3_client, bucket, full_rep
         check_type = scan_report.check_type
         checks_metadata_object = _extract_checks_metadata(scan_report, full_repo_object_key)
         checks_metadata_object_path = f'{full_repo_object_key}/{checkov_results_prefix}/{check_type}/checks_metadata.json'
-        dpath.new(checks_metadata_paths, f"{check_type}/checks_metadata_path", checks_metadata_object_path)
+        new_path(checks_metadata_paths, (check_type, 'checks_metadata_path'), checks_metadata_object_path)
         _put_json_object(s3_client, checks_metadata_object, bucket, checks_metadata_object_path)
     return checks_metadata_paths
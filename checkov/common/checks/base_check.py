@@ -3,6 +3,7 @@ from abc import abstractmethod
 
 from checkov.common.models.enums import CheckResult
 from checkov.common.multi_signature import MultiSignatureMeta, multi_signature
+from checkov.common.util.check_result_cache import check_result_cache
 
 
 class BaseCheck(metaclass=MultiSignatureMeta):
@@ -36,7 +37,7 @@ class BaseCheck(metaclass=MultiSignatureMeta):
             self.logger.debug(message)
         else:
             try:
-                check_result['result'] = self.scan_entity_conf(entity_configuration, entity_type)
+                check_result['result'] = check_result_cache.get_or_scan(self, entity_configuration, entity_type)
                 message = "File {}, {}  \"{}.{}\" check \"{}\" Result: {} ".format(
                     scanned_file,
                     self.block_type,
@@ -58,6 +59,58 @@ class BaseCheck(metaclass=MultiSignatureMeta):
                 raise e
         return check_result
 
+    def run_batch(self, confs, skip_infos):
+        """
+        Run the check on the configurations of entities of the same type at once, with scan_batch
+        :param confs: ConfColumns of the entities' configurations
+        :param skip_infos: skip info of each entity, like run's
+        :return: list of the check result of each entity, like run's
+        """
+        check_results = [None] * len(confs)
+        scanned_indexes = []
+        for index, skip_info in enumerate(skip_infos):
+            if skip_info:
+                check_results[index] = {'result': CheckResult.SKIPPED,
+                                        'suppress_comment': skip_info['suppress_comment']}
+            else:
+                scanned_indexes.append(index)
+        if scanned_indexes:
+            scanned_confs = confs if len(scanned_indexes) == len(confs) else confs.select(scanned_indexes)
+            try:
+                results = check_result_cache.get_or_scan_batch(self, scanned_confs)
+            except Exception as e:
+                self.logger.error("Failed to run check: {} for {} configurations of {}".format(
+                    self.name, len(scanned_confs), confs.entity_type))
+                raise e
+            for index, result in zip(scanned_indexes, results):
+                check_results[index] = {'result': result}
+        self.logger.debug("{} \"{}\" check \"{}\" scanned {} configurations, {} skipped".format(
+            self.block_type, confs.entity_type, self.name, len(scanned_indexes),
+            len(confs) - len(scanned_indexes)))
+        return check_results
+
+    def scan_entity_batch(self, confs):
+        """
+        :return: the results of scan_batch, checked to have a result per configuration
+        """
+        results = self.scan_batch(confs)
+        if len(results) != len(confs):
+            raise ValueError(f'{type(self).__name__}.scan_batch returned {len(results)} results for {len(confs)} '
+                             f'configurations')
+        return results
+
+    def scan_batch(self, confs):
+        """
+        Scan the configurations of entities of the same type at once. Optional, the checks which don't implement it
+        scan each entity with scan_entity_conf.
+        :param confs: ConfColumns of the configurations
+        :return: list of the CheckResult of each configuration
+        """
+        raise NotImplementedError()
+
+    def implements_scan_batch(self):
+        return type(self).scan_batch is not BaseCheck.scan_batch
+
     @multi_signature()
     @abstractmethod
     def scan_entity_conf(self, conf, entity_type):
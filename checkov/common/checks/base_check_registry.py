@@ -8,6 +8,9 @@ from itertools import chain
 from typing import Generator, Tuple
 
 from checkov.common.checks.base_check import BaseCheck
+from checkov.common.checks.check_manifest import get_check_manifest, import_check_module, is_wildcard
+from checkov.common.checks.check_plan import get_check_plan
+from checkov.common.checks.conf_columns import ConfColumns
 
 from collections import defaultdict
 
@@ -19,15 +22,39 @@ class BaseCheckRegistry(object):
     #       checks aren't registered. (This happens with Serverless, for example.)
     __loading_external_checks = False
 
-    def __init__(self):
+    def __init__(self, checks_manifest_key=None):
+        """
+        :param checks_manifest_key: key of the registry's built-in checks in the check manifest, which are loaded on
+                                    demand, None if the registry has no built-in checks
+        """
         self.logger = logging.getLogger(__name__)
         # IMPLEMENTATION NOTE: Checks is used to directly access checks based on an specific entity
-        self.checks = defaultdict(list)
+        self._checks = defaultdict(list)
         # IMPLEMENTATION NOTE: When using a wildcard, every pattern needs to be checked. To reduce the
         #                      number of checks checks with the same pattern are grouped, which is the
         #                      reason to use a dict for this too.
-        self.wildcard_checks = defaultdict(list)
+        self._wildcard_checks = defaultdict(list)
         self.check_id_allowlist = None
+        self.checks_manifest_key = checks_manifest_key
+        # entity type to the (check id, module) of its built-in checks which aren't loaded yet
+        self._unloaded_checks = {}
+        self._all_checks_loaded = checks_manifest_key is None
+
+    @property
+    def checks(self):
+        """
+        Checks of the specific entities, with all the built-in checks loaded
+        """
+        self.load_all_checks()
+        return self._checks
+
+    @property
+    def wildcard_checks(self):
+        """
+        Checks of the entity wildcards, with all the built-in checks loaded
+        """
+        self.load_all_checks()
+        return self._wildcard_checks
 
     def register(self, check):
         # IMPLEMENTATION NOTE: Checks are registered when the script is loaded
@@ -40,28 +67,68 @@ class BaseCheckRegistry(object):
         if BaseCheckRegistry.__loading_external_checks:
             RunnerFilter.notify_external_check(check.id)
 
+        # the checks are kept in the order of the manifest, whichever order their modules are loaded in
+        manifest_ranks = get_check_manifest(self.checks_manifest_key).ranks
+        rank = manifest_ranks.get(check.id, len(manifest_ranks))
         for entity in check.supported_entities:
-            checks = self.wildcard_checks if self._is_wildcard(entity) else self.checks
-            checks[entity].append(check)
+            checks = self._wildcard_checks if self._is_wildcard(entity) else self._checks
+            entity_checks = checks[entity]
+            index = len(entity_checks)
+            while index and manifest_ranks.get(entity_checks[index - 1].id, len(manifest_ranks)) > rank:
+                index -= 1
+            entity_checks.insert(index, check)
 
     @staticmethod
     def _is_wildcard(entity):
-        return ('*' in entity
-                or '?' in entity
-                or ('[' in entity and ']' in entity))
+        return is_wildcard(entity)
+
+    def load_checks(self, entity, runner_filter=None):
+        """
+        Load the built-in checks of an entity type
+        :param runner_filter: RunnerFilter (or CheckPlan) of the checks to load, None to load all of the entity type's
+                              checks
+        """
+        unloaded_checks = self._unloaded_checks.get(entity)
+        if unloaded_checks is None:
+            if self._all_checks_loaded:
+                return
+            unloaded_checks = get_check_manifest(self.checks_manifest_key).get_entity_modules(entity)
+        if unloaded_checks:
+            filtered_checks = []
+            for check_id, module in unloaded_checks:
+                if runner_filter is None or runner_filter.should_run_check(check_id):
+                    import_check_module(module)
+                else:
+                    filtered_checks.append((check_id, module))
+            unloaded_checks = filtered_checks
+        self._unloaded_checks[entity] = unloaded_checks
+
+    def load_all_checks(self):
+        """
+        Load all the built-in checks of the registry
+        """
+        if not self._all_checks_loaded:
+            self._all_checks_loaded = True
+            for _, _, module, _ in get_check_manifest(self.checks_manifest_key).entries:
+                import_check_module(module)
+            self._unloaded_checks.clear()
 
     def get_check_by_id(self, check_id):
+        module = get_check_manifest(self.checks_manifest_key).modules.get(check_id)
+        if module:
+            import_check_module(module)
         return next(
             filter(
                 lambda c: c.id == check_id,
-                chain(*self.checks.values(), *self.wildcard_checks.values())
+                chain(*self._checks.values(), *self._wildcard_checks.values())
             ), None)
 
     def all_checks(self) -> Generator[Tuple[str, BaseCheck], None, None]:
-        for entity, checks in self.checks.items():
+        self.load_all_checks()
+        for entity, checks in self._checks.items():
             for check in checks:
                 yield entity, check
-        for entity, checks in self.wildcard_checks.items():
+        for entity, checks in self._wildcard_checks.items():
             for check in checks:
                 yield entity, check
 
@@ -69,18 +136,30 @@ class BaseCheckRegistry(object):
     def contains_wildcard(self) -> bool:
         return bool(self.wildcard_checks)
 
-    def get_checks(self, entity):
-        if not self.wildcard_checks:
+    def get_checks(self, entity, runner_filter=None):
+        """
+        :param runner_filter: RunnerFilter (or CheckPlan) of the checks to run, the built-in checks it filters out may
+                              be left out
+        """
+        self.load_checks(entity, runner_filter)
+        if not self._wildcard_checks:
             # Optimisation: When no wildcards are used, we can use the list in self.checks
-            return self.checks.get(entity) or []
+            return self._checks.get(entity) or []
         else:
-            res = self.checks[entity].copy() if entity in self.checks.keys() else []
+            res = self._checks[entity].copy() if entity in self._checks.keys() else []
             # check wildcards
-            for pattern, checks in self.wildcard_checks.items():
+            for pattern, checks in self._wildcard_checks.items():
                 if fnmatch.fnmatchcase(entity, pattern):
                     res += checks
             return res
 
+    def compile_checks(self, entity_type, check_plan):
+        """
+        :return: tuple of the checks of the entity type which the check plan runs
+        """
+        return tuple(check for check in self.get_checks(entity_type, check_plan) if
+                     check_plan.should_run_check(check.id))
+
     def set_checks_allowlist(self, runner_filter):
         if runner_filter.checks:
             self.check_id_allowlist = runner_filter.checks
@@ -89,21 +168,59 @@ class BaseCheckRegistry(object):
     def extract_entity_details(self, entity):
         raise NotImplementedError()
 
-    def scan(self, scanned_file, entity, skipped_checks, runner_filter):
+    def scan(self, scanned_file, entity, skipped_checks, runner_filter, check_results=None):
+        """
+        :param check_results: results of the checks which already ran on the entity (e.g. with scan_batch), by check
+        """
         (entity_type, entity_name, entity_configuration) = self.extract_entity_details(entity)
         results = {}
-        checks = self.get_checks(entity_type)
+        checks = get_check_plan(runner_filter).get_checks(self, entity_type)
         for check in checks:
-            skip_info = {}
-            if skipped_checks:
-                if check.id in [x['id'] for x in skipped_checks]:
-                    skip_info = [x for x in skipped_checks if x['id'] == check.id][0]
-
-            if runner_filter.should_run_check(check.id):
-                result = self.run_check(check, entity_configuration, entity_name, entity_type, scanned_file, skip_info)
-                results[check] = result
+            if check_results and check in check_results:
+                results[check] = check_results[check]
+                continue
+            skip_info = skipped_checks.get(check.id, {}) if skipped_checks else {}
+            result = self.run_check(check, entity_configuration, entity_name, entity_type, scanned_file, skip_info)
+            results[check] = result
         return results
 
+    def scan_entities(self, entities, runner_filter):
+        """
+        Scan entities together: the checks which implement scan_batch scan all the entities of an entity type at once,
+        the other checks scan each entity
+        :param entities: list of the (scanned file, entity, skipped checks) of the entities
+        :return: list of the results of each entity, like scan's
+        """
+        check_plan = get_check_plan(runner_filter)
+        entity_indexes = defaultdict(list)
+        entity_configurations = []
+        for index, (_, entity, _) in enumerate(entities):
+            (entity_type, _, entity_configuration) = self.extract_entity_details(entity)
+            entity_indexes[entity_type].append(index)
+            entity_configurations.append(entity_configuration)
+
+        batch_results = [{} for _ in entities]
+        # whether all the checks of the entity's type ran on it with scan_batch, by entity
+        batch_scanned = [False] * len(entities)
+        for entity_type, indexes in entity_indexes.items():
+            confs = None
+            checks = check_plan.get_checks(self, entity_type)
+            for check in checks:
+                if not check.implements_scan_batch():
+                    continue
+                if confs is None:
+                    confs = ConfColumns([entity_configurations[index] for index in indexes], entity_type)
+                skip_infos = [entities[index][2].get(check.id, {}) if entities[index][2] else {} for index in indexes]
+                for index, result in zip(indexes, check.run_batch(confs, skip_infos)):
+                    batch_results[index][check] = result
+            if all(check.implements_scan_batch() for check in checks):
+                for index in indexes:
+                    batch_scanned[index] = True
+
+        return [batch_results[index] if batch_scanned[index] else
+                self.scan(scanned_file, entity, skipped_checks, runner_filter, batch_results[index]) for
+                index, (scanned_file, entity, skipped_checks) in enumerate(entities)]
+
     def run_check(self, check, entity_configuration, entity_name, entity_type, scanned_file, skip_info):
         self.logger.debug("Running check: {} on file {}".format(check.name, scanned_file))
         result = check.run(scanned_file=scanned_file, entity_configuration=entity_configuration,
@@ -136,7 +253,9 @@ class BaseCheckRegistry(object):
         """
         directory = os.path.expanduser(directory)
         self.logger.debug("Loading external checks from {}".format(directory))
-        sys.path.insert(1, directory)
+        # the directory is loaded again by each scan of a served or watched run, it is added to the path once
+        if directory not in sys.path:
+            sys.path.insert(1, directory)
 
         with os.scandir(directory) as directory_content:
             if not self._directory_has_init_py(directory):
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+"""
+Manifest of the built-in checks: the id, name, module and supported entities of the checks of each registry. The
+registries import the check modules from it on demand, for the entity types they scan, instead of importing all the
+checks at start up.
+
+The manifest is generated, run this module after adding, renaming or removing a check:
+    python -m checkov.common.checks.check_manifest
+"""
+import fnmatch
+import importlib
+import logging
+import os
+import pkgutil
+from collections import defaultdict
+
+# Registries of the built-in checks: manifest key -> (registry module, registry variable)
+CHECK_REGISTRIES = {
+    'terraform_resource': ('checkov.terraform.checks.resource.registry', 'resource_registry'),
+    'terraform_data': ('checkov.terraform.checks.data.registry', 'data_registry'),
+    'terraform_provider': ('checkov.terraform.checks.provider.registry', 'provider_registry'),
+    'terraform_module': ('checkov.terraform.checks.module.registry', 'module_registry'),
+    'cloudformation': ('checkov.cloudformation.checks.resource.registry', 'cfn_registry'),
+    'kubernetes': ('checkov.kubernetes.registry', 'registry'),
+    'serverless_complete': ('checkov.serverless.checks.complete.registry', 'complete_registry'),
+    'serverless_custom': ('checkov.serverless.checks.custom.registry', 'custom_registry'),
+    'serverless_function': ('checkov.serverless.checks.function.registry', 'function_registry'),
+    'serverless_layer': ('checkov.serverless.checks.layer.registry', 'layer_registry'),
+    'serverless_package': ('checkov.serverless.checks.package.registry', 'package_registry'),
+    'serverless_plugin': ('checkov.serverless.checks.plugin.registry', 'plugin_registry'),
+    'serverless_provider': ('checkov.serverless.checks.provider.registry', 'provider_registry'),
+    'serverless_service': ('checkov.serverless.checks.service.registry', 'service_registry'),
+    'arm': ('checkov.arm.registry', 'arm_registry'),
+}
+
+# Packages the built-in check modules are found in
+CHECK_PACKAGES = ['checkov.terraform.checks', 'checkov.cloudformation.checks', 'checkov.kubernetes.checks',
+                  'checkov.serverless.checks', 'checkov.arm.checks']
+
+GENERATE_COMMAND = 'python -m checkov.common.checks.check_manifest'
+MANIFEST_DATA_FILE = os.path.join(os.path.dirname(__file__), 'check_manifest_data.py')
+
+# Fields of a manifest entry
+CHECK_ID, CHECK_NAME, CHECK_MODULE, SUPPORTED_ENTITIES = range(4)
+
+
+def is_wildcard(entity):
+    return ('*' in entity
+            or '?' in entity
+            or ('[' in entity and ']' in entity))
+
+
+class CheckManifest(object):
+    """
+    Index of the manifest of a registry's checks, by supported entity and by check id
+    """
+
+    def __init__(self, entries):
+        """
+        :param entries: manifest entries of the registry's checks: (id, name, module, supported entities)
+        """
+        self.entries = entries
+        self.ranks = {}
+        self.modules = {}
+        self.entity_modules = defaultdict(list)
+        self.wildcard_modules = defaultdict(list)
+        for rank, (check_id, _, module, supported_entities) in enumerate(entries):
+            self.ranks[check_id] = rank
+            self.modules[check_id] = module
+            for entity in supported_entities:
+                modules = self.wildcard_modules if is_wildcard(entity) else self.entity_modules
+                modules[entity].append((check_id, module))
+
+    def get_entity_modules(self, entity):
+        """
+        :return: list of the (check id, module) of the checks supporting the entity type, directly or with a wildcard
+        """
+        modules = list(self.entity_modules.get(entity, []))
+        for pattern, pattern_modules in self.wildcard_modules.items():
+            if fnmatch.fnmatchcase(entity, pattern):
+                modules.extend(pattern_modules)
+        return modules
+
+
+_manifests = None
+_empty_manifest = CheckManifest([])
+
+
+def get_check_manifest(key):
+    """
+    :param key: manifest key of a registry, see CHECK_REGISTRIES
+    :return: CheckManifest of the registry's checks
+    """
+    global _manifests
+    if _manifests is None:
+        from checkov.common.checks.check_manifest_data import CHECKS_MANIFEST
+        _manifests = {registry_key: CheckManifest(entries) for registry_key, entries in CHECKS_MANIFEST.items()}
+    return _manifests.get(key, _empty_manifest)
+
+
+def import_check_module(module):
+    """
+    Import the module of a built-in check, which registers the check in its registry
+    """
+    try:
+        importlib.import_module(module)
+    except ImportError as e:
+        logging.getLogger(__name__).error(f'Failed to load check module {module}, the check manifest may be out of '
+                                          f'date (regenerate it with {GENERATE_COMMAND})', exc_info=e)
+
+
+def load_all_checks():
+    """
+    Import all the built-in check modules, without the manifest
+    """
+    for package_name in CHECK_PACKAGES:
+        package = importlib.import_module(package_name)
+        for module_info in pkgutil.walk_packages(package.__path__, prefix=f'{package_name}.'):
+            importlib.import_module(module_info.name)
+
+
+def generate_manifest():
+    """
+    :return: the manifest of all the built-in checks, by registry manifest key, in the order of their modules
+    """
+    global _manifests
+    load_all_checks()
+    # the registries are read as they are, without loading the checks of the current manifest
+    _manifests = {}
+    manifest = {}
+    for key, (registry_module, registry_variable) in CHECK_REGISTRIES.items():
+        registry = getattr(importlib.import_module(registry_module), registry_variable)
+        entries = {}
+        for entity, check in registry.all_checks():
+            module = check.__class__.__module__
+            if not module.startswith('checkov.'):
+                # a custom check
+                continue
+            if check.id not in entries:
+                entries[check.id] = (check.id, check.name, module, tuple(check.supported_entities))
+        manifest[key] = sorted(entries.values(), key=lambda entry: (entry[CHECK_MODULE], entry[CHECK_ID]))
+    _manifests = None
+    return manifest
+
+
+def write_manifest(manifest):
+    lines = [f'# Generated by {GENERATE_COMMAND}, do not edit', '', 'CHECKS_MANIFEST = {']
+    for key, entries in manifest.items():
+        lines.append(f'    {key!r}: [')
+        lines.extend(f'        {entry!r},' for entry in entries)
+        lines.append('    ],')
+    lines.append('}')
+    with open(MANIFEST_DATA_FILE, 'w') as fp:
+        fp.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    write_manifest(generate_manifest())
+    print(f'Wrote {MANIFEST_DATA_FILE}')
@@ -0,0 +1,352 @@
+# Generated by python -m checkov.common.checks.check_manifest, do not edit
+
+CHECKS_MANIFEST = {
+    'terraform_resource': [
+        ('CKV_AWS_2', 'Ensure ALB protocol is HTTPS', 'checkov.terraform.checks.resource.aws.ALBListenerHTTPS', ('aws_alb_listener', 'aws_lb_listener')),
+        ('CKV_AWS_76', 'Ensure API Gateway has Access Logging enabled', 'checkov.terraform.checks.resource.aws.APIGatewayAccessLogging', ('aws_api_gateway_stage', 'aws_apigatewayv2_stage')),
+        ('CKV_AWS_59', 'Ensure there is no open access to back-end resources through API', 'checkov.terraform.checks.resource.aws.APIGatewayAuthorization', ('aws_api_gateway_method',)),
+        ('CKV_AWS_73', 'Ensure API Gateway has X-Ray Tracing enabled', 'checkov.terraform.checks.resource.aws.APIGatewayXray', ('aws_api_gateway_stage',)),
+        ('CKV_AWS_77', 'Ensure Athena Database is encrypted at rest (default is unencrypted)', 'checkov.terraform.checks.resource.aws.AthenaDatabaseEncryption', ('aws_athena_database',)),
+        ('CKV_AWS_82', 'Ensure Athena Workgroup should enforce configuration to prevent client disabling encryption', 'checkov.terraform.checks.resource.aws.AthenaWorkgroupConfiguration', ('aws_athena_workgroup',)),
+        ('CKV_AWS_34', 'Ensure cloudfront distribution ViewerProtocolPolicy is set to HTTPS', 'checkov.terraform.checks.resource.aws.CloudfrontDistributionEncryption', ('aws_cloudfront_distribution',)),
+        ('CKV_AWS_86', 'Ensure Cloudfront distribution has Access Logging enabled', 'checkov.terraform.checks.resource.aws.CloudfrontDistributionLogging', ('aws_cloudfront_distribution',)),
+        ('CKV_AWS_35', 'Ensure CloudTrail logs are encrypted at rest using KMS CMKs', 'checkov.terraform.checks.resource.aws.CloudtrailEncryption', ('aws_cloudtrail',)),
+        ('CKV_AWS_36', 'Ensure CloudTrail log file validation is enabled', 'checkov.terraform.checks.resource.aws.CloudtrailLogValidation', ('aws_cloudtrail',)),
+        ('CKV_AWS_67', 'Ensure CloudTrail is enabled in all Regions', 'checkov.terraform.checks.resource.aws.CloudtrailMultiRegion', ('aws_cloudtrail',)),
+        ('CKV_AWS_78', 'Ensure that CodeBuild Project encryption is not disabled', 'checkov.terraform.checks.resource.aws.CodeBuildProjectEncryption', ('aws_codebuild_project',)),
+        ('CKV_AWS_47', 'Ensure DAX is encrypted at rest (default is unencrypted)', 'checkov.terraform.checks.resource.aws.DAXEncryption', ('aws_dax_cluster',)),
+        ('CKV_AWS_74', 'Ensure DocDB is encrypted at rest (default is unencrypted)', 'checkov.terraform.checks.resource.aws.DocDBEncryption', ('aws_docdb_cluster', 'aws_docdb_cluster_instance')),
+        ('CKV_AWS_85', 'Ensure DocDB Logging is enabled', 'checkov.terraform.checks.resource.aws.DocDBLogging', ('aws_docdb_cluster',)),
+        ('CKV_AWS_28', 'Ensure Dynamodb point in time recovery (backup) is enabled', 'checkov.terraform.checks.resource.aws.DynamodbRecovery', ('aws_dynamodb_table',)),
+        ('CKV_AWS_3', 'Ensure all data stored in the EBS is securely encrypted', 'checkov.terraform.checks.resource.aws.EBSEncryption', ('aws_ebs_volume',)),
+        ('CKV_AWS_46', 'Ensure no hard coded AWS access key and secret key exists in EC2 user data', 'checkov.terraform.checks.resource.aws.EC2Credentials', ('aws_instance',)),
+        ('CKV_AWS_33', 'Ensure ECR image scanning on push is enabled', 'checkov.terraform.checks.resource.aws.ECRImageScanning', ('aws_ecr_repository',)),
+        ('CKV_AWS_51', 'Ensure ECR Image Tags are immutable', 'checkov.terraform.checks.resource.aws.ECRImmutableTags', ('aws_ecr_repository',)),
+        ('CKV_AWS_32', 'Ensure ECR policy is not set to public', 'checkov.terraform.checks.resource.aws.ECRPolicy', ('aws_ecr_repository_policy',)),
+        ('CKV_AWS_65', 'Ensure container insights are enabled on ECS cluster', 'checkov.terraform.checks.resource.aws.ECSClusterContainerInsights', ('aws_ecs_cluster',)),
+        ('CKV_AWS_42', 'Ensure EFS is securely encrypted', 'checkov.terraform.checks.resource.aws.EFSEncryptionEnabled', ('aws_efs_file_system',)),
+        ('CKV_AWS_37', 'Ensure Amazon EKS control plane logging enabled for all log types', 'checkov.terraform.checks.resource.aws.EKSControlPlaneLogging', ('aws_eks_cluster',)),
+        ('CKV_AWS_39', 'Ensure Amazon EKS public endpoint disabled', 'checkov.terraform.checks.resource.aws.EKSPublicAccess', ('aws_eks_cluster',)),
+        ('CKV_AWS_38', 'Ensure Amazon EKS public endpoint not accessible to 0.0.0.0/0', 'checkov.terraform.checks.resource.aws.EKSPublicAccessCIDR', ('aws_eks_cluster',)),
+        ('CKV_AWS_58', 'Ensure EKS Cluster has Secrets Encryption Enabled', 'checkov.terraform.checks.resource.aws.EKSSecretsEncryption', ('aws_eks_cluster',)),
+        ('CKV_AWS_29', 'Ensure all data stored in the Elasticache Replication Group  is securely encrypted at rest', 'checkov.terraform.checks.resource.aws.ElasticacheReplicationGroupEncryptionAtRest', ('aws_elasticache_replication_group',)),
+        ('CKV_AWS_30', 'Ensure all data stored in the Elasticache Replication Group  is securely encrypted at transit', 'checkov.terraform.checks.resource.aws.ElasticacheReplicationGroupEncryptionAtTransit', ('aws_elasticache_replication_group',)),
+        ('CKV_AWS_31', 'Ensure all data stored in the Elasticache Replication Group  is securely encrypted at transit and has auth token', 'checkov.terraform.checks.resource.aws.ElasticacheReplicationGroupEncryptionAtTransitAuthToken', ('aws_elasticache_replication_group',)),
+        ('CKV_AWS_83', 'Ensure Elasticsearch Domain enforces HTTPS', 'checkov.terraform.checks.resource.aws.ElasticsearchDomainEnforceHTTPS', ('elasticsearch_domain',)),
+        ('CKV_AWS_84', 'Ensure Elasticsearch Domain Logging is enabled', 'checkov.terraform.checks.resource.aws.ElasticsearchDomainLogging', ('elasticsearch_domain',)),
+        ('CKV_AWS_5', 'Ensure all data stored in the Elasticsearch is securely encrypted at rest', 'checkov.terraform.checks.resource.aws.ElasticsearchEncryption', ('aws_elasticsearch_domain',)),
+        ('CKV_AWS_6', 'Ensure all Elasticsearch has node-to-node encryption enabled', 'checkov.terraform.checks.resource.aws.ElasticsearchNodeToNodeEncryption', ('aws_elasticsearch_domain',)),
+        ('CKV_AWS_75', 'Ensure Global Accelerator accelerator has flow logs enabled', 'checkov.terraform.checks.resource.aws.GlobalAcceleratorAcceleratorFlowLogs', ('aws_globalaccelerator_accelerator',)),
+        ('CKV_AWS_62', 'Ensure IAM policies that allow full "*-*" administrative privileges are not created', 'checkov.terraform.checks.resource.aws.IAMAdminPolicyDocument', ('aws_iam_role_policy', 'aws_iam_user_policy', 'aws_iam_group_policy', 'aws_iam_policy')),
+        ('CKV_AWS_40', 'Ensure IAM policies are attached only to groups or roles (Reducing access management complexity may in-turn reduce opportunity for a principal to inadvertently receive or retain excessive privileges.)', 'checkov.terraform.checks.resource.aws.IAMPolicyAttachedToGroupOrRoles', ('aws_iam_user_policy_attachment', 'aws_iam_user_policy', 'aws_iam_policy_attachment')),
+        ('CKV_AWS_61', 'Ensure IAM role allows only specific principals in account to assume it', 'checkov.terraform.checks.resource.aws.IAMRoleAllowAssumeFromAccount', ('aws_iam_role',)),
+        ('CKV_AWS_60', 'Ensure IAM role allows only specific services or principals to assume it', 'checkov.terraform.checks.resource.aws.IAMRoleAllowsPublicAssume', ('aws_iam_role',)),
+        ('CKV_AWS_63', 'Ensure no IAM policies documents allow "*" as a statement\'s actions', 'checkov.terraform.checks.resource.aws.IAMStarActionPolicyDocument', ('aws_iam_role_policy', 'aws_iam_user_policy', 'aws_iam_group_policy', 'aws_iam_policy')),
+        ('CKV_AWS_79', 'Ensure Instance Metadata Service Version 1 is not enabled', 'checkov.terraform.checks.resource.aws.IMDSv1Disabled', ('aws_instance', 'aws_launch_template')),
+        ('CKV_AWS_7', 'Ensure rotation for customer created CMKs is enabled', 'checkov.terraform.checks.resource.aws.KMSRotation', ('aws_kms_key',)),
+        ('CKV_AWS_43', 'Ensure Kinesis Stream is securely encrypted', 'checkov.terraform.checks.resource.aws.KinesisStreamEncryptionType', ('aws_kinesis_stream',)),
+        ('CKV_AWS_45', 'Ensure no hard coded AWS access key and secret key exists in lambda environment', 'checkov.terraform.checks.resource.aws.LambdaEnvironmentCredentials', ('aws_lambda_function',)),
+        ('CKV_AWS_50', 'X-ray tracing is enabled for Lambda', 'checkov.terraform.checks.resource.aws.LambdaXrayEnabled', ('aws_lambda_function',)),
+        ('CKV_AWS_8', 'Ensure all data stored in the Launch configuration EBS is securely encrypted', 'checkov.terraform.checks.resource.aws.LaunchConfigurationEBSEncryption', ('aws_launch_configuration', 'aws_instance')),
+        ('CKV_AWS_48', 'Ensure MQ Broker logging is enabled', 'checkov.terraform.checks.resource.aws.MQBrokerLogging', ('aws_mq_broker',)),
+        ('CKV_AWS_69', 'Ensure MQ Broker is not publicly exposed', 'checkov.terraform.checks.resource.aws.MQBrokerNotPubliclyExposed', ('aws_mq_broker',)),
+        ('CKV_AWS_81', 'Ensure MSK Cluster encryption in rest and transit is enabled', 'checkov.terraform.checks.resource.aws.MSKClusterEncryption', ('aws_msk_cluster',)),
+        ('CKV_AWS_80', 'Ensure MSK Cluster logging is enabled', 'checkov.terraform.checks.resource.aws.MSKClusterLogging', ('aws_msk_cluster',)),
+        ('CKV_AWS_44', 'Ensure Neptune storage is securely encrypted', 'checkov.terraform.checks.resource.aws.NeptuneClusterStorageEncrypted', ('aws_neptune_cluster',)),
+        ('CKV_AWS_9', 'Ensure IAM password policy expires passwords within 90 days or less', 'checkov.terraform.checks.resource.aws.PasswordPolicyExpiration', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_10', 'Ensure IAM password policy requires minimum length of 14 or greater', 'checkov.terraform.checks.resource.aws.PasswordPolicyLength', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_11', 'Ensure IAM password policy requires at least one lowercase letter', 'checkov.terraform.checks.resource.aws.PasswordPolicyLowercaseLetter', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_12', 'Ensure IAM password policy requires at least one number', 'checkov.terraform.checks.resource.aws.PasswordPolicyNumber', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_13', 'Ensure IAM password policy prevents password reuse', 'checkov.terraform.checks.resource.aws.PasswordPolicyReuse', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_14', 'Ensure IAM password policy requires at least one symbol', 'checkov.terraform.checks.resource.aws.PasswordPolicySymbol', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_15', 'Ensure IAM password policy requires at least one uppercase letter', 'checkov.terraform.checks.resource.aws.PasswordPolicyUppercaseLetter', ('aws_iam_account_password_policy',)),
+        ('CKV_AWS_16', 'Ensure all data stored in the RDS is securely encrypted at rest', 'checkov.terraform.checks.resource.aws.RDSEncryption', ('aws_db_instance',)),
+        ('CKV_AWS_17', 'Ensure all data stored in the RDS bucket is not public accessible', 'checkov.terraform.checks.resource.aws.RDSPubliclyAccessible', ('aws_db_instance', 'aws_rds_cluster_instance')),
+        ('CKV_AWS_64', 'Ensure all data stored in the Redshift cluster is securely encrypted at rest', 'checkov.terraform.checks.resource.aws.RedshiftClusterEncryption', ('aws_redshift_cluster',)),
+        ('CKV_AWS_71', 'Ensure Redshift Cluster logging is enabled', 'checkov.terraform.checks.resource.aws.RedshiftClusterLogging', ('aws_redshift_cluster',)),
+        ('CKV_AWS_18', 'Ensure the S3 bucket has access logging enabled', 'checkov.terraform.checks.resource.aws.S3AccessLogs', ('aws_s3_bucket',)),
+        ('CKV_AWS_70', 'Ensure S3 bucket does not allow an action with any Principal', 'checkov.terraform.checks.resource.aws.S3AllowsAnyPrincipal', ('aws_s3_bucket', 'aws_s3_bucket_policy')),
+        ('CKV_AWS_53', 'Ensure S3 bucket has block public ACLS enabled', 'checkov.terraform.checks.resource.aws.S3BlockPublicACLs', ('aws_s3_bucket_public_access_block',)),
+        ('CKV_AWS_54', 'Ensure S3 bucket has block public policy enabled', 'checkov.terraform.checks.resource.aws.S3BlockPublicPolicy', ('aws_s3_bucket_public_access_block',)),
+        ('CKV_AWS_19', 'Ensure all data stored in the S3 bucket is securely encrypted at rest', 'checkov.terraform.checks.resource.aws.S3Encryption', ('aws_s3_bucket',)),
+        ('CKV_AWS_55', 'Ensure S3 bucket has ignore public ACLs enabled', 'checkov.terraform.checks.resource.aws.S3IgnorePublicACLs', ('aws_s3_bucket_public_access_block',)),
+        ('CKV_AWS_52', 'Ensure S3 bucket has MFA delete enabled', 'checkov.terraform.checks.resource.aws.S3MFADelete', ('aws_s3_bucket',)),
+        ('CKV_AWS_20', 'S3 Bucket has an ACL defined which allows public READ access.', 'checkov.terraform.checks.resource.aws.S3PublicACLRead', ('aws_s3_bucket',)),
+        ('CKV_AWS_57', 'S3 Bucket has an ACL defined which allows public WRITE access.', 'checkov.terraform.checks.resource.aws.S3PublicACLWRITE', ('aws_s3_bucket',)),
+        ('CKV_AWS_56', "Ensure S3 bucket has 'restrict_public_bucket' enabled", 'checkov.terraform.checks.resource.aws.S3RestrictPublicBuckets', ('aws_s3_bucket_public_access_block',)),
+        ('CKV_AWS_21', 'Ensure all data stored in the S3 bucket have versioning enabled', 'checkov.terraform.checks.resource.aws.S3Versioning', ('aws_s3_bucket',)),
+        ('CKV_AWS_26', 'Ensure all data stored in the SNS topic is encrypted', 'checkov.terraform.checks.resource.aws.SNSTopicEncryption', ('aws_sns_topic',)),
+        ('CKV_AWS_72', 'Ensure SQS policy does not allow ALL (*) actions.', 'checkov.terraform.checks.resource.aws.SQSPolicy', ('aws_sqs_queue_policy',)),
+        ('CKV_AWS_27', 'Ensure all data stored in the SQS queue is encrypted', 'checkov.terraform.checks.resource.aws.SQSQueueEncryption', ('aws_sqs_queue',)),
+        ('CKV_AWS_22', 'Ensure all data stored in the Sagemaker is securely encrypted at rest', 'checkov.terraform.checks.resource.aws.SagemakerEncryption', ('aws_sagemaker_notebook_instance',)),
+        ('CKV_AWS_23', 'Ensure every security groups rule has a description', 'checkov.terraform.checks.resource.aws.SecurityGroupRuleDescription', ('aws_security_group', 'aws_security_group_rule', 'aws_db_security_group', 'aws_elasticache_security_group', 'aws_redshift_security_group')),
+        ('CKV_AWS_24', 'Ensure no security groups allow ingress from 0.0.0.0:0 to port 22', 'checkov.terraform.checks.resource.aws.SecurityGroupUnrestrictedIngress22', ('aws_security_group', 'aws_security_group_rule')),
+        ('CKV_AWS_25', 'Ensure no security groups allow ingress from 0.0.0.0:0 to port 3389', 'checkov.terraform.checks.resource.aws.SecurityGroupUnrestrictedIngress3389', ('aws_security_group', 'aws_security_group_rule')),
+        ('CKV_AWS_68', 'CloudFront Distribution should have WAF enabled', 'checkov.terraform.checks.resource.aws.WAFEnabled', ('aws_cloudfront_distribution',)),
+        ('CKV_AWS_66', 'Ensure cloudwatch log groups specify retention days', 'checkov.terraform.checks.resource.aws.cloudwatchLogGroupRetention', ('aws_cloudwatch_log_group',)),
+        ('CKV_AZURE_6', 'Ensure AKS has an API Server Authorized IP Ranges enabled', 'checkov.terraform.checks.resource.azure.AKSApiServerAuthorizedIpRanges', ('azurerm_kubernetes_cluster',)),
+        ('CKV_AZURE_8', 'Ensure Kube Dashboard is disabled', 'checkov.terraform.checks.resource.azure.AKSDashboardDisabled', ('azurerm_kubernetes_cluster',)),
+        ('CKV_AZURE_4', 'Ensure AKS logging to Azure Monitoring is Configured', 'checkov.terraform.checks.resource.azure.AKSLoggingEnabled', ('azurerm_kubernetes_cluster',)),
+        ('CKV_AZURE_7', 'Ensure AKS cluster has Network Policy configured', 'checkov.terraform.checks.resource.azure.AKSNetworkPolicy', ('azurerm_kubernetes_cluster',)),
+        ('CKV_AZURE_5', 'Ensure RBAC is enabled on AKS clusters', 'checkov.terraform.checks.resource.azure.AKSRbacEnabled', ('azurerm_kubernetes_cluster',)),
+        ('CKV_AZURE_13', 'Ensure App Service Authentication is set on Azure App Service', 'checkov.terraform.checks.resource.azure.AppServiceAuthentication', ('azurerm_app_service',)),
+        ('CKV_AZURE_14', 'Ensure web app redirects all HTTP traffic to HTTPS in Azure App Service', 'checkov.terraform.checks.resource.azure.AppServiceHTTPSOnly', ('azurerm_app_service',)),
+        ('CKV_AZURE_18', "Ensure that 'HTTP Version' is the latest if used to run the web app", 'checkov.terraform.checks.resource.azure.AppServiceHttps20Enabled', ('azurerm_app_service',)),
+        ('CKV_AZURE_15', 'Ensure web app is using the latest version of TLS encryption', 'checkov.terraform.checks.resource.azure.AppServiceMinTLSVersion', ('azurerm_app_service',)),
+        ('CKV_AZURE_17', "Ensure the web app has 'Client Certificates (Incoming client certificates)' set", 'checkov.terraform.checks.resource.azure.AppServieClientCertificate', ('azurerm_app_service',)),
+        ('CKV_AZURE_16', 'Ensure that Register with Azure Active Directory is enabled on App Service', 'checkov.terraform.checks.resource.azure.AppServieIdentity', ('azurerm_app_service',)),
+        ('CKV_AZURE_1', 'Ensure Azure Instance does not use basic authentication(Use SSH Key Instead)', 'checkov.terraform.checks.resource.azure.AzureInstancePassword', ('azurerm_virtual_machine', 'azurerm_linux_virtual_machine')),
+        ('CKV_AZURE_2', 'Ensure Azure managed disk have encryption enabled', 'checkov.terraform.checks.resource.azure.AzureManagedDiscEncryption', ('azurerm_managed_disk',)),
+        ('CKV_AZURE_39', 'Ensure that no custom subscription owner roles are created', 'checkov.terraform.checks.resource.azure.CutsomRoleDefinitionSubscriptionOwner', ('azurerm_role_definition',)),
+        ('CKV_AZURE_40', 'Ensure that the expiration date is set on all keys', 'checkov.terraform.checks.resource.azure.KeyExpirationDate', ('azurerm_key_vault_key',)),
+        ('CKV_AZURE_42', 'Ensure the key vault is recoverable', 'checkov.terraform.checks.resource.azure.KeyvaultRecoveryEnabled', ('azurerm_key_vault',)),
+        ('CKV_AZURE_38', 'Ensure audit profile captures all the activities', 'checkov.terraform.checks.resource.azure.MonitorLogProfileCategories', ('azurerm_monitor_log_profile',)),
+        ('CKV_AZURE_37', 'Ensure that Activity Log Retention is set 365 days or greater', 'checkov.terraform.checks.resource.azure.MonitorLogProfileRetentionDays', ('azurerm_monitor_log_profile',)),
+        ('CKV_AZURE_28', "Ensure 'Enforce SSL connection' is set to 'ENABLED' for MySQL Database Server", 'checkov.terraform.checks.resource.azure.MySQLServerSSLEnforcementEnabled', ('azurerm_mysql_server',)),
+        ('CKV_AZURE_9', 'Ensure that RDP access is restricted from the internet', 'checkov.terraform.checks.resource.azure.NSGRuleRDPAccessRestricted', ('azure_security_group_rule', 'azurerm_network_security_rule', 'azurerm_network_security_group')),
+        ('CKV_AZURE_10', 'Ensure that SSH access is restricted from the internet', 'checkov.terraform.checks.resource.azure.NSGRuleSSHAccessRestricted', ('azure_security_group_rule', 'azurerm_network_security_rule', 'azurerm_network_security_group')),
+        ('CKV_AZURE_12', "Ensure that Network Security Group Flow Log retention period is 'greater than 90 days'", 'checkov.terraform.checks.resource.azure.NetworkWatcherFlowLogPeriod', ('azurerm_network_watcher_flow_log',)),
+        ('CKV_AZURE_32', "Ensure server parameter 'connection_throttling' is set to 'ON' for PostgreSQL Database Server", 'checkov.terraform.checks.resource.azure.PostgreSQLServerConnectionThrottlingEnabled', ('azurerm_postgresql_configuration',)),
+        ('CKV_AZURE_30', "Ensure server parameter 'log_checkpoints' is set to 'ON' for PostgreSQL Database Server", 'checkov.terraform.checks.resource.azure.PostgreSQLServerLogCheckpointsEnabled', ('azurerm_postgresql_configuration',)),
+        ('CKV_AZURE_31', "Ensure server parameter 'log_connections' is set to 'ON' for PostgreSQL Database Server", 'checkov.terraform.checks.resource.azure.PostgreSQLServerLogConnectionsEnabled', ('azurerm_postgresql_configuration',)),
+        ('CKV_AZURE_29', "Ensure 'Enforce SSL connection' is set to 'ENABLED' for PostgreSQL Database Server", 'checkov.terraform.checks.resource.azure.PostgreSQLServerSSLEnforcementEnabled', ('azurerm_postgresql_server',)),
+        ('CKV_AZURE_23', "Ensure that 'Auditing' is set to 'On' for SQL servers", 'checkov.terraform.checks.resource.azure.SQLServerAuditingEnabled', ('azurerm_sql_server', 'azurerm_mssql_server')),
+        ('CKV_AZURE_24', "Ensure that 'Auditing' Retention is 'greater than 90 days' for SQL servers", 'checkov.terraform.checks.resource.azure.SQLServerAuditingRetention90Days', ('azurerm_sql_server', 'azurerm_mssql_server')),
+        ('CKV_AZURE_26', "Ensure that 'Send Alerts To' is enabled for MSSQL servers", 'checkov.terraform.checks.resource.azure.SQLServerEmailAlertsEnabled', ('azurerm_mssql_server_security_alert_policy',)),
+        ('CKV_AZURE_27', "Ensure that 'Email service and co-administrators' is 'Enabled' for MSSQL servers", 'checkov.terraform.checks.resource.azure.SQLServerEmailAlertsToAdminsEnabled', ('azurerm_mssql_server_security_alert_policy',)),
+        ('CKV_AZURE_11', 'Ensure no SQL Databases allow ingress from 0.0.0.0/0 (ANY IP)', 'checkov.terraform.checks.resource.azure.SQLServerNoPublicAccess', ('azurerm_mariadb_firewall_rule', 'azurerm_sql_firewall_rule', 'azurerm_postgresql_firewall_rule', 'azurerm_mysql_firewall_rule')),
+        ('CKV_AZURE_25', "Ensure that 'Threat Detection types' is set to 'All'", 'checkov.terraform.checks.resource.azure.SQLServerThreatDetectionTypes', ('azurerm_mssql_server_security_alert_policy',)),
+        ('CKV_AZURE_41', 'Ensure that the expiration date is set on all secrets', 'checkov.terraform.checks.resource.azure.SecretExpirationDate', ('azurerm_key_vault_secret',)),
+        ('CKV_AZURE_21', "Ensure that 'Send email notification for high severity alerts' is set to 'On'", 'checkov.terraform.checks.resource.azure.SecurityCenterContactEmailAlert', ('azurerm_security_center_contact',)),
+        ('CKV_AZURE_22', "Ensure that 'Send email notification for high severity alerts' is set to 'On'", 'checkov.terraform.checks.resource.azure.SecurityCenterContactEmailAlertAdmins', ('azurerm_security_center_contact',)),
+        ('CKV_AZURE_20', "Ensure that security contact 'Phone number' is set", 'checkov.terraform.checks.resource.azure.SecurityCenterContactPhone', ('azurerm_security_center_contact',)),
+        ('CKV_AZURE_19', 'Ensure that standard pricing tier is selected', 'checkov.terraform.checks.resource.azure.SecurityCenterStandardPricing', ('azurerm_security_center_subscription_pricing',)),
+        ('CKV_AZURE_36', "Ensure 'Trusted Microsoft Services' is enabled for Storage Account access", 'checkov.terraform.checks.resource.azure.StorageAccountAzureServicesAccessEnabled', ('azurerm_storage_account', 'azurerm_storage_account_network_rules')),
+        ('CKV_AZURE_35', 'Ensure default network access rule for Storage Accounts is set to deny', 'checkov.terraform.checks.resource.azure.StorageAccountDefaultNetworkAccessDeny', ('azurerm_storage_account', 'azurerm_storage_account_network_rules')),
+        ('CKV_AZURE_33', 'Ensure Storage logging is enabled for Queue service for read, write and delete requests', 'checkov.terraform.checks.resource.azure.StorageAccountLoggingQueueServiceEnabled', ('azurerm_storage_account',)),
+        ('CKV_AZURE_44', 'Ensure Storage Account is using the latest version of TLS encryption', 'checkov.terraform.checks.resource.azure.StorageAccountMinimumTlsVersion', ('azurerm_storage_account',)),
+        ('CKV_AZURE_3', "Ensure that 'Secure transfer required' is set to 'Enabled'", 'checkov.terraform.checks.resource.azure.StorageAccountsTransportEncryption', ('azurerm_storage_account',)),
+        ('CKV_AZURE_34', "Ensure that 'Public access level' is set to Private for blob containers", 'checkov.terraform.checks.resource.azure.StorageBlobServiceContainerPrivateAccess', ('azurerm_storage_container',)),
+        ('CKV_AZURE_45', 'Ensure that no sensitive credentials are exposed in VM custom_data', 'checkov.terraform.checks.resource.azure.VMCredsInCustomData', ('azurerm_virtual_machine',)),
+        ('CKV_GCP_23', 'Ensure Kubernetes Cluster is created with Alias IP ranges enabled', 'checkov.terraform.checks.resource.gcp.GKEAliasIpEnabled', ('google_container_cluster',)),
+        ('CKV_GCP_19', 'Ensure GKE basic auth is disabled', 'checkov.terraform.checks.resource.gcp.GKEBasicAuth', ('google_container_cluster',)),
+        ('CKV_GCP_13', 'Ensure a client certificate is used by clients to authenticate to Kubernetes Engine Clusters', 'checkov.terraform.checks.resource.gcp.GKEClientCertificateEnabled', ('google_container_cluster',)),
+        ('CKV_GCP_1', 'Ensure Stackdriver Logging is set to Enabled on Kubernetes Engine Clusters', 'checkov.terraform.checks.resource.gcp.GKEClusterLogging', ('google_container_cluster',)),
+        ('CKV_GCP_7', 'Ensure Legacy Authorization is set to Disabled on Kubernetes Engine Clusters', 'checkov.terraform.checks.resource.gcp.GKEDisableLegacyAuth', ('google_container_cluster',)),
+        ('CKV_GCP_21', 'Ensure Kubernetes Clusters are configured with Labels', 'checkov.terraform.checks.resource.gcp.GKEHasLabels', ('google_container_cluster',)),
+        ('CKV_GCP_20', 'Ensure master authorized networks is set to enabled in GKE clusters', 'checkov.terraform.checks.resource.gcp.GKEMasterAuthorizedNetworksEnabled', ('google_container_cluster',)),
+        ('CKV_GCP_8', 'Ensure Stackdriver Monitoring is set to Enabled on Kubernetes Engine Clusters', 'checkov.terraform.checks.resource.gcp.GKEMonitoringEnabled', ('google_container_cluster',)),
+        ('CKV_GCP_12', 'Ensure Network Policy is enabled on Kubernetes Engine Clusters', 'checkov.terraform.checks.resource.gcp.GKENetworkPolicyEnabled', ('google_container_cluster',)),
+        ('CKV_GCP_9', "Ensure 'Automatic node repair' is enabled for Kubernetes Clusters", 'checkov.terraform.checks.resource.gcp.GKENodePoolAutoRepairEnabled', ('google_container_node_pool',)),
+        ('CKV_GCP_10', "Ensure 'Automatic node upgrade' is enabled for Kubernetes Clusters", 'checkov.terraform.checks.resource.gcp.GKENodePoolAutoUpgradeEnabled', ('google_container_node_pool',)),
+        ('CKV_GCP_24', 'Ensure PodSecurityPolicy controller is enabled on the Kubernetes Engine Clusters', 'checkov.terraform.checks.resource.gcp.GKEPodSecurityPolicyEnabled', ('google_container_cluster',)),
+        ('CKV_GCP_25', 'Ensure Kubernetes Cluster is created with Private cluster enabled', 'checkov.terraform.checks.resource.gcp.GKEPrivateClusterConfig', ('google_container_cluster',)),
+        ('CKV_GCP_18', 'Ensure GKE Control Plane is not public', 'checkov.terraform.checks.resource.gcp.GKEPublicControlPlane', ('google_container_cluster',)),
+        ('CKV_GCP_22', 'Ensure Container-Optimized OS (cos) is used for Kubernetes Engine Clusters Node image', 'checkov.terraform.checks.resource.gcp.GKEUseCosImage', ('google_container_node_pool',)),
+        ('CKV_GCP_15', 'Ensure that BigQuery datasets are not anonymously or publicly accessible', 'checkov.terraform.checks.resource.gcp.GoogleBigQueryDatasetPublicACL', ('google_bigquery_dataset',)),
+        ('CKV_GCP_17', 'Ensure that RSASHA1 is not used for the zone-signing and key-signing keys in Cloud DNS DNSSEC', 'checkov.terraform.checks.resource.gcp.GoogleCloudDNSKeySpecsRSASHA1', ('google_dns_managed_zone',)),
+        ('CKV_GCP_16', 'Ensure that DNSSEC is enabled for Cloud DNS', 'checkov.terraform.checks.resource.gcp.GoogleCloudDNSSECEnabled', ('google_dns_managed_zone',)),
+        ('CKV_GCP_50', "Ensure MySQL database 'local_infile' flag is set to 'off'", 'checkov.terraform.checks.resource.gcp.GoogleCloudMySqlLocalInfileOff', ('google_sql_database_instance',)),
+        ('CKV_GCP_51', "Ensure PostgreSQL database 'log_checkpoints' flag is set to 'on'", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogCheckpoints', ('google_sql_database_instance',)),
+        ('CKV_GCP_52', "Ensure PostgreSQL database 'log_connections' flag is set to 'on'", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogConnection', ('google_sql_database_instance',)),
+        ('CKV_GCP_53', "Ensure PostgreSQL database 'log_disconnections' flag is set to 'on'", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogDisconnection', ('google_sql_database_instance',)),
+        ('CKV_GCP_54', "Ensure PostgreSQL database 'log_lock_waits' flag is set to 'on'", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogLockWaits', ('google_sql_database_instance',)),
+        ('CKV_GCP_57', "Ensure PostgreSQL database 'log_min_duration_statement' flag is set to '-1'", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogMinDuration', ('google_sql_database_instance',)),
+        ('CKV_GCP_55', "Ensure PostgreSQL database 'log_min_messages' flag is set to a valid value", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogMinMessage', ('google_sql_database_instance',)),
+        ('CKV_GCP_56', "Ensure PostgreSQL database 'log_temp_files flag is set to '0'", 'checkov.terraform.checks.resource.gcp.GoogleCloudPostgreSqlLogTemp', ('google_sql_database_instance',)),
+        ('CKV_GCP_14', 'Ensure all Cloud SQL database instance have backup configuration enabled', 'checkov.terraform.checks.resource.gcp.GoogleCloudSqlBackupConfiguration', ('google_sql_database_instance',)),
+        ('CKV_GCP_11', 'Ensure that Cloud SQL database Instances are not open to the world', 'checkov.terraform.checks.resource.gcp.GoogleCloudSqlDatabasePublicallyAccessible', ('google_sql_database_instance',)),
+        ('CKV_GCP_6', 'Ensure all Cloud SQL database instance requires all incoming connections to use SSL', 'checkov.terraform.checks.resource.gcp.GoogleCloudSqlDatabaseRequireSsl', ('google_sql_database_instance',)),
+        ('CKV_GCP_59', "Ensure SQL database 'contained database authentication' flag is set to 'off'", 'checkov.terraform.checks.resource.gcp.GoogleCloudSqlServerContainedDBAuthentication', ('google_sql_database_instance',)),
+        ('CKV_GCP_58', "Ensure SQL database 'cross db ownership chaining' flag is set to 'off'", 'checkov.terraform.checks.resource.gcp.GoogleCloudSqlServerCrossDBOwnershipChaining', ('google_sql_database_instance',)),
+        ('CKV_GCP_60', 'Ensure SQL database do not have public IP', 'checkov.terraform.checks.resource.gcp.GoogleCloudSqlServerNoPublicIP', ('google_sql_database_instance',)),
+        ('CKV_GCP_38', 'Ensure VM disks for critical VMs are encrypted with Customer Supplied Encryption Keys (CSEK)', 'checkov.terraform.checks.resource.gcp.GoogleComputeBootDiskEncryption', ('google_compute_instance',)),
+        ('CKV_GCP_30', 'Ensure that instances are not configured to use the default service account', 'checkov.terraform.checks.resource.gcp.GoogleComputeDefaultServiceAccount', ('google_compute_instance',)),
+        ('CKV_GCP_31', 'Ensure that instances are not configured to use the default service account with full access to all Cloud APIs', 'checkov.terraform.checks.resource.gcp.GoogleComputeDefaultServiceAccountFullAccess', ('google_compute_instance',)),
+        ('CKV_GCP_37', 'Ensure VM disks for critical VMs are encrypted with Customer Supplied Encryption Keys (CSEK)', 'checkov.terraform.checks.resource.gcp.GoogleComputeDiskEncryption', ('google_compute_disk',)),
+        ('CKV_GCP_40', 'Ensure that Compute instances do not have public IP addresses', 'checkov.terraform.checks.resource.gcp.GoogleComputeExternalIP', ('google_compute_instance',)),
+        ('CKV_GCP_2', 'Ensure Google compute firewall ingress does not allow unrestricted ssh access', 'checkov.terraform.checks.resource.gcp.GoogleComputeFirewallUnrestrictedIngress22', ('google_compute_firewall',)),
+        ('CKV_GCP_3', 'Ensure Google compute firewall ingress does not allow unrestricted rdp access', 'checkov.terraform.checks.resource.gcp.GoogleComputeFirewallUnrestrictedIngress3389', ('google_compute_firewall',)),
+        ('CKV_GCP_36', 'Ensure that IP forwarding is not enabled on Instances', 'checkov.terraform.checks.resource.gcp.GoogleComputeIPForward', ('google_compute_instance',)),
+        ('CKV_GCP_34', 'Ensure that no instance in the project overrides the project setting for enabling OSLogin(OSLogin needs to be enabled in prject metadata for all instances)', 'checkov.terraform.checks.resource.gcp.GoogleComputeInstanceOSLogin', ('google_compute_instance',)),
+        ('CKV_GCP_33', 'Ensure oslogin is enabled for a Project', 'checkov.terraform.checks.resource.gcp.GoogleComputeProjectOSLogin', ('google_compute_project_metadata',)),
+        ('CKV_GCP_4', 'Ensure no HTTPS or SSL proxy load balancers permit SSL policies with weak cipher suites', 'checkov.terraform.checks.resource.gcp.GoogleComputeSSLPolicy', ('google_compute_ssl_policy',)),
+        ('CKV_GCP_35', "Ensure 'Enable connecting to serial ports' is not enabled for VM Instance", 'checkov.terraform.checks.resource.gcp.GoogleComputeSerialPorts', ('google_compute_instance',)),
+        ('CKV_GCP_39', 'Ensure Compute instances are launched with Shielded VM enabled', 'checkov.terraform.checks.resource.gcp.GoogleComputeShieldedVM', ('google_compute_instance',)),
+        ('CKV_GCP_32', "Ensure 'Block Project-wide SSH keys' is enabled for VM instances", 'checkov.terraform.checks.resource.gcp.GoogleComupteBlockProjectSSH', ('google_compute_instance',)),
+        ('CKV_GCP_44', 'Ensure no roles that enable to impersonate and manage all service accounts are used at a folder level', 'checkov.terraform.checks.resource.gcp.GoogleFolderImpersonationRole', ('google_folder_iam_member', 'google_folder_iam_binding')),
+        ('CKV_GCP_48', 'Ensure Default Service account is not used at a folder level', 'checkov.terraform.checks.resource.gcp.GoogleFolderMemberDefaultServiceAccount', ('google_folder_iam_member', 'google_folder_iam_binding')),
+        ('CKV_GCP_43', 'Ensure KMS encryption keys are rotated within a period of 90 days', 'checkov.terraform.checks.resource.gcp.GoogleKMSRotationPeriod', ('google_kms_crypto_key',)),
+        ('CKV_GCP_45', 'Ensure no roles that enable to impersonate and manage all service accounts are used at an organization level', 'checkov.terraform.checks.resource.gcp.GoogleOrgImpersonationRole', ('google_organization_iam_member', 'google_organization_iam_binding')),
+        ('CKV_GCP_47', 'Ensure default service account is not used at an organization level', 'checkov.terraform.checks.resource.gcp.GoogleOrgMemberDefaultServiceAccount', ('google_organization_iam_member', 'google_organization_iam_binding')),
+        ('CKV_GCP_42', 'Ensure that Service Account has no Admin privileges', 'checkov.terraform.checks.resource.gcp.GoogleProjectAdminServiceAccount', ('google_project_iam_member',)),
+        ('CKV_GCP_27', 'Ensure that the default network does not exist in a project', 'checkov.terraform.checks.resource.gcp.GoogleProjectDefaultNetwork', ('google_project',)),
+        ('CKV_GCP_49', 'Ensure no roles that enable to impersonate and manage all service accounts are used at a project level', 'checkov.terraform.checks.resource.gcp.GoogleProjectImpersonationRole', ('google_project_iam_member', 'google_project_iam_binding')),
+        ('CKV_GCP_46', 'Ensure Default Service account is not used at a project level', 'checkov.terraform.checks.resource.gcp.GoogleProjectMemberDefaultServiceAccount', ('google_project_iam_member', 'google_project_iam_binding')),
+        ('CKV_GCP_41', 'Ensure that IAM users are not assigned the Service Account User or Service Account Token Creator roles at project level', 'checkov.terraform.checks.resource.gcp.GoogleRoleServiceAccountUser', ('google_project_iam_binding', 'google_project_iam_member')),
+        ('CKV_GCP_5', 'Ensure Google storage bucket have encryption enabled', 'checkov.terraform.checks.resource.gcp.GoogleStorageBucketEncryption', ('google_storage_bucket',)),
+        ('CKV_GCP_28', 'Ensure that Cloud Storage bucket is not anonymously or publicly accessible', 'checkov.terraform.checks.resource.gcp.GoogleStorageBucketNotPublic', ('google_storage_bucket_iam_member', 'google_storage_bucket_iam_binding')),
+        ('CKV_GCP_29', 'Ensure that Cloud Storage buckets have uniform bucket-level access enabled', 'checkov.terraform.checks.resource.gcp.GoogleStorageBucketUniformAccess', ('google_storage_bucket',)),
+        ('CKV_GCP_26', 'Ensure that VPC Flow Logs is enabled for every subnet in a VPC Network', 'checkov.terraform.checks.resource.gcp.GoogleSubnetworkLoggingEnabled', ('google_compute_subnetwork',)),
+        ('CKV_GIT_1', 'Ensure Repository is Private', 'checkov.terraform.checks.resource.github.PrivateRepo', ('github_repository',)),
+    ],
+    'terraform_data': [
+        ('CKV_AWS_1', 'Ensure IAM policies that allow full "*-*" administrative privileges are not created', 'checkov.terraform.checks.data.aws.AdminPolicyDocument', ('aws_iam_policy_document',)),
+        ('CKV_AWS_49', 'Ensure no IAM policies documents allow "*" as a statement\'s actions', 'checkov.terraform.checks.data.aws.StarActionPolicyDocument', ('aws_iam_policy_document',)),
+    ],
+    'terraform_provider': [
+        ('CKV_AWS_41', 'Ensure no hard coded AWS access key and and secret key exists in provider', 'checkov.terraform.checks.provider.aws.credentials', ('aws',)),
+    ],
+    'terraform_module': [
+    ],
+    'cloudformation': [
+        ('CKV_AWS_2', 'Ensure ALB protocol is HTTPS', 'checkov.cloudformation.checks.resource.aws.ALBListenerHTTPS', ('AWS::ElasticLoadBalancingV2::Listener',)),
+        ('CKV_AWS_34', 'Ensure cloudfront distribution ViewerProtocolPolicy is set to HTTPS', 'checkov.cloudformation.checks.resource.aws.CloudfrontDistributionEncryption', ('AWS::CloudFront::Distribution',)),
+        ('CKV_AWS_35', 'Ensure CloudTrail logs are encrypted at rest using KMS CMKs', 'checkov.cloudformation.checks.resource.aws.CloudtrailEncryption', ('AWS::CloudTrail::Trail',)),
+        ('CKV_AWS_36', 'Ensure CloudTrail log file validation is enabled', 'checkov.cloudformation.checks.resource.aws.CloudtrailLogValidation', ('AWS::CloudTrail::Trail',)),
+        ('CKV_AWS_47', 'Ensure DAX is encrypted at rest (default is unencrypted)', 'checkov.cloudformation.checks.resource.aws.DAXEncryption', ('AWS::DAX::Cluster',)),
+        ('CKV_AWS_28', 'Ensure Dynamodb point in time recovery (backup) is enabled', 'checkov.cloudformation.checks.resource.aws.DynamodbRecovery', ('AWS::DynamoDB::Table',)),
+        ('CKV_AWS_3', 'Ensure all data stored in the EBS is securely encrypted', 'checkov.cloudformation.checks.resource.aws.EBSEncryption', ('AWS::EC2::Volume',)),
+        ('CKV_AWS_32', 'Ensure ECR policy is not set to public', 'checkov.cloudformation.checks.resource.aws.ECRPolicy', ('AWS::ECR::Repository',)),
+        ('CKV_AWS_65', 'Ensure container insights are enabled on ECS cluster', 'checkov.cloudformation.checks.resource.aws.ECSClusterContainerInsights', ('AWS::ECS::Cluster',)),
+        ('CKV_AWS_42', 'Ensure EFS is securely encrypted', 'checkov.cloudformation.checks.resource.aws.EFSEncryptionEnabled', ('AWS::EFS::FileSystem',)),
+        ('CKV_AWS_58', 'Ensure EKS Cluster has Secrets Encryption Enabled', 'checkov.cloudformation.checks.resource.aws.EKSSecretsEncryption', ('AWS::EKS::Cluster',)),
+        ('CKV_AWS_29', 'Ensure all data stored in the Elasticache Replication Group  is securely encrypted at rest', 'checkov.cloudformation.checks.resource.aws.ElasticacheReplicationGroupEncryptionAtRest', ('AWS::ElastiCache::ReplicationGroup',)),
+        ('CKV_AWS_30', 'Ensure all data stored in the Elasticache Replication Group is securely encrypted at transit', 'checkov.cloudformation.checks.resource.aws.ElasticacheReplicationGroupEncryptionAtTransit', ('AWS::ElastiCache::ReplicationGroup',)),
+        ('CKV_AWS_31', 'Ensure all data stored in the Elasticache Replication Group is securely encrypted at transit and has auth token', 'checkov.cloudformation.checks.resource.aws.ElasticacheReplicationGroupEncryptionAtTransitAuthToken', ('AWS::ElastiCache::ReplicationGroup',)),
+        ('CKV_AWS_5', 'Ensure all data stored in the Elasticsearch is securely encrypted at rest', 'checkov.cloudformation.checks.resource.aws.ElasticsearchEncryption', ('AWS::Elasticsearch::Domain',)),
+        ('CKV_AWS_6', 'Ensure all Elasticsearch has node-to-node encryption enabled', 'checkov.cloudformation.checks.resource.aws.ElasticsearchNodeToNodeEncryption', ('AWS::Elasticsearch::Domain',)),
+        ('CKV_AWS_40', 'Ensure IAM policies are attached only to groups or roles (Reducing access management complexity may in-turn reduce opportunity for a principal to inadvertently receive or retain excessive privileges.)', 'checkov.cloudformation.checks.resource.aws.IAMPolicyAttachedToGroupOrRoles', ('AWS::IAM::Policy',)),
+        ('CKV_AWS_7', 'Ensure rotation for customer created CMKs is enabled', 'checkov.cloudformation.checks.resource.aws.KMSRotation', ('AWS::KMS::Key',)),
+        ('CKV_AWS_43', 'Ensure Kinesis Stream is securely encrypted', 'checkov.cloudformation.checks.resource.aws.KinesisStreamEncryptionType', ('AWS::Kinesis::Stream',)),
+        ('CKV_AWS_8', 'Ensure all data stored in the Launch configuration EBS is securely encrypted', 'checkov.cloudformation.checks.resource.aws.LaunchConfigurationEBSEncryption', ('AWS::AutoScaling::LaunchConfiguration',)),
+        ('CKV_AWS_44', 'Ensure Neptune storage is securely encrypted', 'checkov.cloudformation.checks.resource.aws.NeptuneClusterStorageEncrypted', ('AWS::Neptune::DBCluster',)),
+        ('CKV_AWS_16', 'Ensure all data stored in the RDS is securely encrypted at rest', 'checkov.cloudformation.checks.resource.aws.RDSEncryption', ('AWS::RDS::DBInstance',)),
+        ('CKV_AWS_17', 'Ensure all data stored in the RDS bucket is not public accessible', 'checkov.cloudformation.checks.resource.aws.RDSPubliclyAccessible', ('AWS::RDS::DBInstance',)),
+        ('CKV_AWS_64', 'Ensure all data stored in the Redshift cluster is securely encrypted at rest', 'checkov.cloudformation.checks.resource.aws.RedshiftClusterEncryption', ('AWS::Redshift::Cluster',)),
+        ('CKV_AWS_18', 'Ensure the S3 bucket has access logging enabled', 'checkov.cloudformation.checks.resource.aws.S3AccessLogs', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_53', 'Ensure S3 bucket has block public ACLS enabled', 'checkov.cloudformation.checks.resource.aws.S3BlockPublicACLs', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_54', 'Ensure S3 bucket has block public policy enabled', 'checkov.cloudformation.checks.resource.aws.S3BlockPublicPolicy', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_19', 'Ensure the S3 bucket has server-side-encryption enabled', 'checkov.cloudformation.checks.resource.aws.S3Encryption', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_55', 'Ensure S3 bucket has ignore public ACLs enabled', 'checkov.cloudformation.checks.resource.aws.S3IgnorePublicACLs', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_20', 'Ensure the S3 bucket does not allow READ permissions to everyone', 'checkov.cloudformation.checks.resource.aws.S3PublicACLRead', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_57', 'Ensure the S3 bucket does not allow WRITE permissions to everyone', 'checkov.cloudformation.checks.resource.aws.S3PublicACLWrite', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_56', "Ensure S3 bucket has 'restrict_public_bucket' enabled", 'checkov.cloudformation.checks.resource.aws.S3RestrictPublicBuckets', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_21', 'Ensure the S3 bucket has versioning enabled', 'checkov.cloudformation.checks.resource.aws.S3Versioning', ('AWS::S3::Bucket',)),
+        ('CKV_AWS_26', 'Ensure all data stored in the SNS topic is encrypted', 'checkov.cloudformation.checks.resource.aws.SNSTopicEncryption', ('AWS::SNS::Topic',)),
+        ('CKV_AWS_27', 'Ensure all data stored in the SQS queue is encrypted', 'checkov.cloudformation.checks.resource.aws.SQSQueueEncryption', ('AWS::SQS::Queue',)),
+        ('CKV_AWS_23', 'Ensure every security groups rule has a description', 'checkov.cloudformation.checks.resource.aws.SecurityGroupRuleDescription', ('AWS::EC2::SecurityGroup', 'AWS::EC2::SecurityGroupIngress', 'AWS::EC2::SecurityGroupEgress')),
+        ('CKV_AWS_24', 'Ensure no security groups allow ingress from 0.0.0.0:0 to port 22', 'checkov.cloudformation.checks.resource.aws.SecurityGroupUnrestrictedIngress22', ('AWS::EC2::SecurityGroup', 'AWS::EC2::SecurityGroupIngress')),
+        ('CKV_AWS_25', 'Ensure no security groups allow ingress from 0.0.0.0:0 to port 3389', 'checkov.cloudformation.checks.resource.aws.SecurityGroupUnrestrictedIngress3389', ('AWS::EC2::SecurityGroup', 'AWS::EC2::SecurityGroupIngress')),
+        ('CKV_AWS_66', 'Ensure cloudwatch log groups specify retention days', 'checkov.cloudformation.checks.resource.aws.cloudwatchLogGroupRetention', ('AWS::Logs::LogGroup',)),
+    ],
+    'kubernetes': [
+        ('CKV_K8S_20', 'Containers should not run with allowPrivilegeEscalation', 'checkov.kubernetes.checks.AllowPrivilegeEscalation', ('containers', 'initContainers')),
+        ('CKV_K8S_5', 'Containers should not run with allowPrivilegeEscalation', 'checkov.kubernetes.checks.AllowPrivilegeEscalationPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_25', 'Minimize the admission of containers with added capability', 'checkov.kubernetes.checks.AllowedCapabilities', ('containers', 'initContainers')),
+        ('CKV_K8S_24', 'Do not allow containers with added capability', 'checkov.kubernetes.checks.AllowedCapabilitiesPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_39', 'Do not use the CAP_SYS_ADMIN linux capability', 'checkov.kubernetes.checks.AllowedCapabilitiesSysAdmin', ('containers', 'initContainers')),
+        ('CKV_K8S_11', 'CPU limits should be set', 'checkov.kubernetes.checks.CPULimits', ('containers', 'initContainers')),
+        ('CKV_K8S_10', 'CPU requests should be set', 'checkov.kubernetes.checks.CPURequests', ('containers', 'initContainers')),
+        ('CKV_K8S_30', 'Apply security context to your pods and containers', 'checkov.kubernetes.checks.ContainerSecurityContext', ('containers', 'initContainers')),
+        ('CKV_K8S_21', 'The default namespace should not be used', 'checkov.kubernetes.checks.DefaultNamespace', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob', 'Service', 'Secret', 'ServiceAccount', 'Role', 'RoleBinding', 'ConfigMap', 'Ingress')),
+        ('CKV_K8S_41', 'Ensure that default service accounts are not actively used', 'checkov.kubernetes.checks.DefaultServiceAccount', ('ServiceAccount',)),
+        ('CKV_K8S_42', 'Ensure that default service accounts are not actively used', 'checkov.kubernetes.checks.DefaultServiceAccountBinding', ('RoleBinding', 'ClusterRoleBinding')),
+        ('CKV_K8S_27', 'Do not expose the docker daemon socket to containers', 'checkov.kubernetes.checks.DockerSocketVolume', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_28', 'Minimize the admission of containers with the NET_RAW capability', 'checkov.kubernetes.checks.DropCapabilities', ('containers', 'initContainers')),
+        ('CKV_K8S_7', 'Do not admit containers with the NET_RAW capability', 'checkov.kubernetes.checks.DropCapabilitiesPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_26', 'Do not specify hostPort unless absolutely necessary', 'checkov.kubernetes.checks.HostPort', ('containers', 'initContainers')),
+        ('CKV_K8S_43', 'Image should use digest', 'checkov.kubernetes.checks.ImageDigest', ('containers', 'initContainers')),
+        ('CKV_K8S_15', 'Image Pull Policy should be Always', 'checkov.kubernetes.checks.ImagePullPolicyAlways', ('containers', 'initContainers')),
+        ('CKV_K8S_14', 'Image Tag should be fixed - not latest or blank', 'checkov.kubernetes.checks.ImageTagFixed', ('containers', 'initContainers')),
+        ('CKV_K8S_33', 'Ensure the Kubernetes dashboard is not deployed', 'checkov.kubernetes.checks.KubernetesDashboard', ('containers', 'initContainers')),
+        ('CKV_K8S_8', 'Liveness Probe Should be Configured', 'checkov.kubernetes.checks.LivenessProbe', ('containers',)),
+        ('CKV_K8S_13', 'Memory limits should be set', 'checkov.kubernetes.checks.MemoryLimits', ('containers', 'initContainers')),
+        ('CKV_K8S_12', 'Memory requests should be set', 'checkov.kubernetes.checks.MemoryRequests', ('containers', 'initContainers')),
+        ('CKV_K8S_37', 'Minimize the admission of containers with capabilities assigned', 'checkov.kubernetes.checks.MinimizeCapabilities', ('containers', 'initContainers')),
+        ('CKV_K8S_36', 'Minimize the admission of containers with capabilities assigned', 'checkov.kubernetes.checks.MinimizeCapabilitiesPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_29', 'Apply security context to your pods and containers', 'checkov.kubernetes.checks.PodSecurityContext', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_16', 'Container should not be privileged', 'checkov.kubernetes.checks.PrivilegedContainers', ('containers', 'initContainers')),
+        ('CKV_K8S_2', 'Do not admit privileged containers', 'checkov.kubernetes.checks.PrivilegedContainersPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_22', 'Use read-only filesystem for containers where possible', 'checkov.kubernetes.checks.ReadOnlyFilesystem', ('containers', 'initContainers')),
+        ('CKV_K8S_9', 'Readiness Probe Should be Configured', 'checkov.kubernetes.checks.ReadinessProbe', ('containers',)),
+        ('CKV_K8S_23', 'Minimize the admission of root containers', 'checkov.kubernetes.checks.RootContainers', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_40', 'Containers should run as a high UID to avoid host conflict', 'checkov.kubernetes.checks.RootContainersHighUID', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_6', 'Do not admit root containers', 'checkov.kubernetes.checks.RootContainersPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_31', 'Ensure that the seccomp profile is set to docker/default or runtime/default', 'checkov.kubernetes.checks.Seccomp', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_32', 'Ensure default seccomp profile set to docker/default or runtime/default', 'checkov.kubernetes.checks.SeccompPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_35', 'Prefer using secrets as files over secrets as environment variables', 'checkov.kubernetes.checks.Secrets', ('containers', 'initContainers')),
+        ('CKV_K8S_38', 'Ensure that Service Account Tokens are only mounted where necessary', 'checkov.kubernetes.checks.ServiceAccountTokens', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_18', 'Containers should not share the host IPC namespace', 'checkov.kubernetes.checks.ShareHostIPC', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_3', 'Do not admit containers wishing to share the host IPC namespace', 'checkov.kubernetes.checks.ShareHostIPCPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_17', 'Containers should not share the host process ID namespace', 'checkov.kubernetes.checks.ShareHostPID', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_1', 'Do not admit containers wishing to share the host process ID namespace', 'checkov.kubernetes.checks.ShareHostPIDPSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_19', 'Containers should not share the host network namespace', 'checkov.kubernetes.checks.SharedHostNetworkNamespace', ('Pod', 'Deployment', 'DaemonSet', 'StatefulSet', 'ReplicaSet', 'ReplicationController', 'Job', 'CronJob')),
+        ('CKV_K8S_4', 'Do not admit containers wishing to share the host network namespace', 'checkov.kubernetes.checks.SharedHostNetworkNamespacePSP', ('PodSecurityPolicy',)),
+        ('CKV_K8S_34', 'Ensure that Tiller (Helm v2) is not deployed', 'checkov.kubernetes.checks.Tiller', ('containers', 'initContainers')),
+        ('CKV_K8S_45', 'Ensure the Tiller Deployment (Helm V2) is not accessible from within the cluster', 'checkov.kubernetes.checks.TillerDeploymentListener', ('containers', 'initContainers')),
+        ('CKV_K8S_44', 'Ensure that the Tiller Service (Helm v2) is deleted', 'checkov.kubernetes.checks.TillerService', ('Service',)),
+    ],
+    'serverless_complete': [
+    ],
+    'serverless_custom': [
+    ],
+    'serverless_function': [
+        ('CKV_AWS_41', 'Ensure no hard coded AWS access key and and secret key exists in provider', 'checkov.serverless.checks.function.aws.AWSCredentials', ('serverless_aws',)),
+        ('CKV_AWS_1', 'Ensure IAM policies that allow full "*-*" administrative privileges are not created', 'checkov.serverless.checks.function.aws.AdminPolicyDocument', ('serverless_aws',)),
+        ('CKV_AWS_49', 'Ensure no IAM policies documents allow "*" as a statement\'s actions', 'checkov.serverless.checks.function.aws.StarActionPolicyDocument', ('serverless_aws',)),
+    ],
+    'serverless_layer': [
+    ],
+    'serverless_package': [
+    ],
+    'serverless_plugin': [
+    ],
+    'serverless_provider': [
+    ],
+    'serverless_service': [
+    ],
+    'arm': [
+        ('CKV_AZURE_6', 'Ensure AKS has an API Server Authorized IP Ranges enabled', 'checkov.arm.checks.AKSApiServerAuthorizedIpRanges', ('Microsoft.ContainerService/managedClusters',)),
+        ('CKV_AZURE_8', 'Ensure Kubernetes Dashboard is disabled', 'checkov.arm.checks.AKSDashboardDisabled', ('Microsoft.ContainerService/managedClusters',)),
+        ('CKV_AZURE_4', 'Ensure AKS logging to Azure Monitoring is Configured', 'checkov.arm.checks.AKSLoggingEnabled', ('Microsoft.ContainerService/managedClusters',)),
+        ('CKV_AZURE_7', 'Ensure AKS cluster has Network Policy configured', 'checkov.arm.checks.AKSNetworkPolicy', ('Microsoft.ContainerService/managedClusters',)),
+        ('CKV_AZURE_5', 'Ensure RBAC is enabled on AKS clusters', 'checkov.arm.checks.AKSRbacEnabled', ('Microsoft.ContainerService/managedClusters',)),
+        ('CKV_AZURE_13', 'Ensure App Service Authentication is set on Azure App Service', 'checkov.arm.checks.AppServiceAuthentication', ('Microsoft.Web/sites/config', 'config')),
+        ('CKV_AZURE_17', "Ensure the web app has 'Client Certificates (Incoming client certificates)' set", 'checkov.arm.checks.AppServiceClientCertificate', ('Microsoft.Web/sites',)),
+        ('CKV_AZURE_14', 'Ensure web app redirects all HTTP traffic to HTTPS in Azure App Service', 'checkov.arm.checks.AppServiceHTTPSOnly', ('Microsoft.Web/sites',)),
+        ('CKV_AZURE_18', "Ensure that 'HTTP Version' is the latest if used to run the web app", 'checkov.arm.checks.AppServiceHttps20Enabled', ('Microsoft.Web/sites',)),
+        ('CKV_AZURE_16', 'Ensure that Register with Azure Active Directory is enabled on App Service', 'checkov.arm.checks.AppServiceIdentity', ('Microsoft.Web/sites',)),
+        ('CKV_AZURE_15', 'Ensure web app is using the latest version of TLS encryption', 'checkov.arm.checks.AppServiceMinTLSVersion', ('Microsoft.Web/sites',)),
+        ('CKV_AZURE_1', 'Ensure Azure Instance does not use basic authentication(Use SSH Key Instead)', 'checkov.arm.checks.AzureInstancePassword', ('Microsoft.Compute/virtualMachines',)),
+        ('CKV_AZURE_2', 'Ensure Azure managed disk have encryption enabled', 'checkov.arm.checks.AzureManagedDiscEncryption', ('Microsoft.Compute/disks',)),
+        ('CKV_AZURE_39', 'Ensure that no custom subscription owner roles are created', 'checkov.arm.checks.CustomRoleDefinitionSubscriptionOwner', ('Microsoft.Authorization/roleDefinitions',)),
+        ('CKV_AZURE_42', 'Ensure the key vault is recoverable', 'checkov.arm.checks.KeyvaultRecoveryEnabled', ('Microsoft.KeyVault/vaults',)),
+        ('CKV_AZURE_38', 'Ensure audit profile captures all the activities', 'checkov.arm.checks.MonitorLogProfileCategories', ('microsoft.insights/logprofiles',)),
+        ('CKV_AZURE_37', 'Ensure that Activity Log Retention is set 365 days or greater', 'checkov.arm.checks.MonitorLogProfileRetentionDays', ('microsoft.insights/logprofiles',)),
+        ('CKV_AZURE_28', "Ensure 'Enforce SSL connection' is set to 'ENABLED' for MySQL Database Server", 'checkov.arm.checks.MySQLServerSSLEnforcementEnabled', ('Microsoft.DBforMySQL/servers',)),
+        ('CKV_AZURE_9', 'Ensure that RDP access is restricted from the internet', 'checkov.arm.checks.NSGRuleRDPAccessRestricted', ('Microsoft.Network/networkSecurityGroups', 'Microsoft.Network/networkSecurityGroups/securityRules')),
+        ('CKV_AZURE_10', 'Ensure that SSH access is restricted from the internet', 'checkov.arm.checks.NSGRuleSSHAccessRestricted', ('Microsoft.Network/networkSecurityGroups', 'Microsoft.Network/networkSecurityGroups/securityRules')),
+        ('CKV_AZURE_12', "Ensure that Network Security Group Flow Log retention period is 'greater than 90 days'", 'checkov.arm.checks.NetworkWatcherFlowLogPeriod', ('Microsoft.Network/networkWatchers/flowLogs', 'Microsoft.Network/networkWatchers/FlowLogs', 'Microsoft.Network/networkWatchers/flowLogs/', 'Microsoft.Network/networkWatchers/FlowLogs/')),
+        ('CKV_AZURE_32', "Ensure server parameter 'connection_throttling' is set to 'ON' for PostgreSQL Database Server", 'checkov.arm.checks.PostgreSQLServerConnectionThrottlingEnabled', ('Microsoft.DBforPostgreSQL/servers/configurations', 'configurations')),
+        ('CKV_AZURE_30', "Ensure server parameter 'log_checkpoints' is set to 'ON' for PostgreSQL Database Server", 'checkov.arm.checks.PostgreSQLServerLogCheckpointsEnabled', ('Microsoft.DBforPostgreSQL/servers/configurations', 'configurations')),
+        ('CKV_AZURE_31', "Ensure configuration 'log_connections' is set to 'ON' for PostgreSQL Database Server", 'checkov.arm.checks.PostgreSQLServerLogConnectionsEnabled', ('Microsoft.DBforPostgreSQL/servers/configurations', 'configurations')),
+        ('CKV_AZURE_29', "Ensure 'Enforce SSL connection' is set to 'ENABLED' for PostgreSQL Database Server", 'checkov.arm.checks.PostgreSQLServerSSLEnforcementEnabled', ('Microsoft.DBforPostgreSQL/servers',)),
+        ('CKV_AZURE_23', "Ensure that 'Auditing' is set to 'Enabled' for SQL servers", 'checkov.arm.checks.SQLServerAuditingEnabled', ('Microsoft.Sql/servers',)),
+        ('CKV_AZURE_24', "Ensure that 'Auditing' Retention is 'greater than 90 days' for SQL servers", 'checkov.arm.checks.SQLServerAuditingRetention90Days', ('Microsoft.Sql/servers',)),
+        ('CKV_AZURE_26', "Ensure that 'Send Alerts To' is enabled for MSSQL servers", 'checkov.arm.checks.SQLServerEmailAlertsEnabled', ('Microsoft.Sql/servers/databases',)),
+        ('CKV_AZURE_27', "Ensure that 'Email service and co-administrators' is 'Enabled' for MSSQL servers", 'checkov.arm.checks.SQLServerEmailAlertsToAdminsEnabled', ('Microsoft.Sql/servers/databases',)),
+        ('CKV_AZURE_11', 'Ensure no SQL Databases allow ingress from 0.0.0.0/0 (ANY IP)', 'checkov.arm.checks.SQLServerNoPublicAccess', ('Microsoft.Sql/servers',)),
+        ('CKV_AZURE_25', "Ensure that 'Threat Detection types' is set to 'All'", 'checkov.arm.checks.SQLServerThreatDetectionTypes', ('Microsoft.Sql/servers/databases',)),
+        ('CKV_AZURE_41', 'Ensure that the expiration date is set on all secrets', 'checkov.arm.checks.SecretExpirationDate', ('Microsoft.KeyVault/vaults/secrets',)),
+        ('CKV_AZURE_21', "Ensure that 'Send email notification for high severity alerts' is set to 'On'", 'checkov.arm.checks.SecurityCenterContactEmailAlert', ('Microsoft.Security/securityContacts',)),
+        ('CKV_AZURE_22', "Ensure that 'Send email notification for high severity alerts' is set to 'On'", 'checkov.arm.checks.SecurityCenterContactEmailAlertAdmins', ('Microsoft.Security/securityContacts',)),
+        ('CKV_AZURE_20', "Ensure that security contact 'Phone number' is set", 'checkov.arm.checks.SecurityCenterContactPhone', ('Microsoft.Security/securityContacts',)),
+        ('CKV_AZURE_19', 'Ensure that standard pricing tier is selected', 'checkov.arm.checks.SecurityCenterStandardPricing', ('Microsoft.Security/pricings',)),
+        ('CKV_AZURE_36', "Ensure 'Trusted Microsoft Services' is enabled for Storage Account access", 'checkov.arm.checks.StorageAccountAzureServicesAccessEnabled', ('Microsoft.Storage/storageAccounts',)),
+        ('CKV_AZURE_35', 'Ensure default network access rule for Storage Accounts is set to deny', 'checkov.arm.checks.StorageAccountDefaultNetworkAccessDeny', ('Microsoft.Storage/storageAccounts',)),
+        ('CKV_AZURE_33', 'Ensure Storage logging is enabled for Queue service for read, write and delete requests', 'checkov.arm.checks.StorageAccountLoggingQueueServiceEnabled', ('Microsoft.Storage/storageAccounts/queueServices/providers/diagnosticsettings',)),
+        ('CKV_AZURE_3', "Ensure that 'supportsHttpsTrafficOnly' is set to 'true'", 'checkov.arm.checks.StorageAccountsTransportEncryption', ('Microsoft.Storage/storageAccounts',)),
+        ('CKV_AZURE_34', "Ensure that 'Public access level' is set to Private for blob containers", 'checkov.arm.checks.StorageBlobServiceContainerPrivateAccess', ('Microsoft.Storage/storageAccounts/blobServices/containers', 'containers', 'blobServices/containers')),
+    ],
+}
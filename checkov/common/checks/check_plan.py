@@ -0,0 +1,47 @@
+from checkov.runner_filter import RunnerFilter
+
+
+class CheckPlan(object):
+    """
+    Checks to run in a scan, compiled from its RunnerFilter once per run (see RunnerRegistry.run) instead of for every
+    scanned entity. The filter's check ids are frozen into sets, and the checks each registry runs on an entity type
+    (its own checks and the matching wildcard checks, less the filtered out ones) are computed on the first entity of
+    the type and kept as a tuple for the rest of the run.
+    """
+
+    def __init__(self, runner_filter):
+        self.runner_filter = runner_filter
+        self.checks = frozenset(runner_filter.checks)
+        self.skip_checks = frozenset(runner_filter.skip_checks)
+        # the Kubernetes allow list may also list namespaces, which are the names that aren't check ids
+        self.allowed_namespaces = frozenset(name for name in self.checks if 'CKV_' not in name)
+        self.allows_check_ids = len(self.allowed_namespaces) < len(self.checks)
+        # (registry, entity type) to the tuple of the checks to run
+        self._entity_checks = {}
+
+    def should_run_check(self, check_id):
+        """
+        Same as RunnerFilter.should_run_check
+        """
+        if RunnerFilter.is_external_check(check_id):
+            pass        # enabled unless skipped
+        elif self.checks:
+            return check_id in self.checks
+        return check_id not in self.skip_checks
+
+    def get_checks(self, registry, entity_type):
+        """
+        :return: tuple of the registry's checks to run on the entity type
+        """
+        key = (registry, entity_type)
+        checks = self._entity_checks.get(key)
+        if checks is None:
+            checks = self._entity_checks[key] = registry.compile_checks(entity_type, self)
+        return checks
+
+
+def get_check_plan(runner_filter):
+    """
+    :return: the check plan of the run of the runner filter, or a new one when it is not scanned in a RunnerRegistry run
+    """
+    return runner_filter.check_plan or CheckPlan(runner_filter)
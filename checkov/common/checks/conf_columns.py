@@ -0,0 +1,50 @@
+from checkov.common.util.data_path import compile_path, get_path
+
+# Value of a column's entity which has no value at the column's path, when no other default is given
+MISSING = object()
+
+
+class ConfColumns(object):
+    """
+    Columnar view of the configurations of entities of the same type, scanned together by the checks implementing
+    scan_batch: the values of all the configurations at an attribute path are extracted into a column (a list, in the
+    order of the configurations) once, for all the checks reading it
+    """
+
+    def __init__(self, confs, entity_type):
+        self.confs = confs
+        self.entity_type = entity_type
+        self._columns = {}
+
+    def __len__(self):
+        return len(self.confs)
+
+    def __iter__(self):
+        return iter(self.confs)
+
+    def column(self, path, default=MISSING):
+        """
+        :param path: attribute path, as a tuple of keys or a string of the keys separated by '/'
+        :param default: value of the configurations which have no value at the path
+        :return: list of the value of each configuration at the path
+        """
+        path = compile_path(path)
+        column = self._columns.get(path)
+        if column is None:
+            if len(path) == 1:
+                # an attribute of the configurations, most columns are
+                key = path[0]
+                column = [conf.get(key, MISSING) if type(conf) is dict else get_path(conf, path, MISSING) for
+                          conf in self.confs]
+            else:
+                column = [get_path(conf, path, MISSING) for conf in self.confs]
+            self._columns[path] = column
+        if default is MISSING:
+            return column
+        return [default if value is MISSING else value for value in column]
+
+    def select(self, indexes):
+        """
+        :return: ConfColumns of the configurations at the indexes
+        """
+        return ConfColumns([self.confs[index] for index in indexes], self.entity_type)
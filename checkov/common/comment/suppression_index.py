@@ -0,0 +1,68 @@
+from bisect import bisect_left, bisect_right
+
+from checkov.common.comment.enum import COMMENT_REGEX
+
+# Every skip comment contains this, lines without it don't need to go through the comment regex
+SKIP_COMMENT_MARKER = 'skip='
+
+
+def parse_skip_comment(text, comment_regex=COMMENT_REGEX, check_id_group=2):
+    """
+    Parse the skip comment in the given text
+    :param text: text which may contain a skip comment
+    :param comment_regex: regex of the skip comment, the suppression comment is the group following the check id
+    :param check_id_group: index of the check id group in comment_regex
+    :return: skip info dict of the check id and its suppression comment, None if there is no skip comment
+    """
+    skip_search = comment_regex.search(text)
+    if not skip_search:
+        return None
+    suppress_comment = skip_search.group(check_id_group + 1)
+    return {
+        'id': skip_search.group(check_id_group),
+        'suppress_comment': suppress_comment[1:] if suppress_comment else "No comment provided"
+    }
+
+
+def to_skipped_checks(skip_infos):
+    """
+    :param skip_infos: iterable of skip info dicts
+    :return: dict of check id to its skip info, the first skip comment of a check wins
+    """
+    skipped_checks = {}
+    for skip_info in skip_infos:
+        skipped_checks.setdefault(skip_info['id'], skip_info)
+    return skipped_checks
+
+
+class SuppressionIndex:
+    """
+    Index of the skip comments of a file, extracted with a single pass over the file's lines. The comments are kept
+    sorted by line number, so the comments of an entity are found by bisecting its lines range.
+    """
+
+    def __init__(self, file_lines):
+        """
+        :param file_lines: list of (line number, line) of the file, sorted by line number
+        """
+        self._line_nums = []
+        self._skip_infos = []
+        for line_num, line in file_lines:
+            if SKIP_COMMENT_MARKER not in line:
+                continue
+            skip_info = parse_skip_comment(line)
+            if skip_info:
+                self._line_nums.append(line_num)
+                self._skip_infos.append(skip_info)
+
+    def get_skipped_checks(self, start_line, end_line):
+        """
+        :param start_line: first line of the entity
+        :param end_line: last line of the entity
+        :return: dict of check id to skip info of the skip comments between start_line and end_line (inclusive)
+        """
+        start_idx = bisect_left(self._line_nums, start_line)
+        end_idx = bisect_right(self._line_nums, end_line)
+        if start_idx >= end_idx:
+            return {}
+        return to_skipped_checks(self._skip_infos[start_idx:end_idx])
@@ -1,13 +1,6 @@
 import logging
 import shutil
 
-try:
-    from git import Repo
-    git_import_error = None
-except ImportError as e:
-    git_import_error = e
-
-
 from checkov.common.goget.base_getter import BaseGetter
 
 
@@ -17,9 +10,11 @@ class GitGetter(BaseGetter):
         super().__init__(url)
 
     def do_get(self):
-        if git_import_error is not None:
-            raise ImportError("Unable to load git module (is the git executable available?)") \
-                from git_import_error
+        # GitPython is imported when it is used, as it is slow to import
+        try:
+            from git import Repo
+        except ImportError as e:
+            raise ImportError("Unable to load git module (is the git executable available?)") from e
 
         clone_dir = self.temp_dir + "/clone/"
         result_dir = self.temp_dir + "/result/"
@@ -1,4 +1,5 @@
 SUPPORTED_FILE_EXTENSIONS = [".tf", ".yml", ".yaml", ".json", ".template"]
+SLS_FILE_MASK = ["serverless.yml", "serverless.yaml"]
 ANY_VALUE = "CKV_ANY"
 DOCKER_IMAGE_REGEX = r'(?:[^\s\/]+/)?([^\s:]+):?([^\s]*)'
 access_key_pattern = "(?<![A-Z0-9])[A-Z0-9]{20}(?![A-Z0-9])" # nosec
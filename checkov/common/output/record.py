@@ -1,35 +1,150 @@
 import re
+import sys
+from collections.abc import MutableMapping
 
 from colorama import init, Fore, Style
 from termcolor import colored
 
 from checkov.common.models.enums import CheckResult
+from checkov.common.util.line_store import CodeBlock
 
 init(autoreset=True)
 
 
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class _CheckResult(MutableMapping):
+    """
+    The check result of a record, as the dict it used to be: its items are read from and written to the record's
+    result and suppress_comment, the only keys it has
+    """
+    __slots__ = ('_record',)
+
+    def __init__(self, record):
+        self._record = record
+
+    def __getitem__(self, key):
+        if key == 'result':
+            return self._record.result
+        if key == 'suppress_comment' and self._record.suppress_comment is not None:
+            return self._record.suppress_comment
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key == 'result':
+            self._record.result = value
+        elif key == 'suppress_comment':
+            self._record.suppress_comment = value
+        else:
+            raise KeyError(f'a check result only has a result and a suppress_comment, not {key!r}')
+
+    def __delitem__(self, key):
+        if key != 'suppress_comment' or self._record.suppress_comment is None:
+            raise KeyError(key)
+        self._record.suppress_comment = None
+
+    def __iter__(self):
+        yield 'result'
+        if self._record.suppress_comment is not None:
+            yield 'suppress_comment'
+
+    def __len__(self):
+        return 1 if self._record.suppress_comment is None else 2
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
 class Record:
-    check_id = ""
-    check_name = ""
-    check_result = None
-    check_class = ""
-    code_block = ""
-    file_path = ""
-    file_line_range = []
-    resource = ""
-    guideline = None
+    """
+    Result of a check on an entity. The record's attributes are slots, and its check result is kept as the CheckResult
+    (result) and the suppress comment of a skipped result (suppress_comment), so very large reports hold compact
+    records. check_result gives the check result as the mapping it used to be, which writes its items back to the
+    record. get_dict and __dict__ give the record as the dict it used to be, but as a copy: the record's attributes
+    are set on the record itself.
+    """
+    __slots__ = ('check_id', 'check_name', 'result', 'suppress_comment', '_code_block', 'file_path', 'file_line_range',
+                 'resource', 'evaluations', 'check_class', 'guideline')
 
     def __init__(self, check_id, check_name, check_result, code_block, file_path, file_line_range, resource,
                  evaluations, check_class):
-        self.check_id = check_id
-        self.check_name = check_name
+        # the check's strings are shared by all of its records
+        self.check_id = _intern(check_id)
+        self.check_name = _intern(check_name)
         self.check_result = check_result
         self.code_block = code_block
         self.file_path = file_path
         self.file_line_range = file_line_range
         self.resource = resource
         self.evaluations = evaluations
-        self.check_class = check_class
+        self.check_class = _intern(check_class)
+        self.guideline = None
+
+    @property
+    def check_result(self):
+        """
+        :return: mapping of the result, and of the suppress comment of a skipped result, backed by the record
+        """
+        return _CheckResult(self)
+
+    @check_result.setter
+    def check_result(self, check_result):
+        self.result = check_result['result']
+        self.suppress_comment = check_result.get('suppress_comment')
+
+    @property
+    def code_block(self):
+        """
+        :return: list of the (line number, line) of the resource's code, read from its file if it is a CodeBlock
+        """
+        if isinstance(self._code_block, CodeBlock):
+            return self._code_block.get_lines()
+        return self._code_block
+
+    @code_block.setter
+    def code_block(self, code_block):
+        self._code_block = code_block
+
+    def get_dict(self):
+        """
+        :return: dict of the record's attributes, with its check result's dict and its code block's lines. It is a copy
+                 of the attributes, writing it doesn't change the record
+        """
+        record_dict = {
+            'check_id': self.check_id,
+            'check_name': self.check_name,
+            'check_result': dict(self.check_result),
+            'code_block': self.code_block,
+            'file_path': self.file_path,
+            'file_line_range': self.file_line_range,
+            'resource': self.resource,
+            'evaluations': self.evaluations,
+            'check_class': self.check_class,
+        }
+        if self.guideline is not None:
+            record_dict['guideline'] = self.guideline
+        return record_dict
+
+    @property
+    def __dict__(self):
+        """
+        The record's attributes, as get_dict, for the consumers of the records' instance dicts (e.g. vars(record)).
+        Unlike an instance dict, writing it doesn't change the record
+        """
+        return self.get_dict()
+
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        # the unpickled strings are copies, the records of a check share them again
+        self.check_id = _intern(self.check_id)
+        self.check_name = _intern(self.check_name)
+        self.check_class = _intern(self.check_class)
 
     def set_guideline(self, guideline):
         self.guideline = guideline
@@ -38,9 +153,9 @@ class Record:
     def _trim_special_chars(expression):
         return "".join(re.findall(r'[^ ${\}]+', expression))
 
-    def _is_expression_in_code_lines(self, expression):
+    def _is_expression_in_code_lines(self, expression, code_block):
         stripped_expression = self._trim_special_chars(expression)
-        return any([stripped_expression in self._trim_special_chars(line) for (_, line) in self.code_block])
+        return any([stripped_expression in self._trim_special_chars(line) for (_, line) in code_block])
 
     @staticmethod
     def _code_line_string(code_block):
@@ -59,16 +174,16 @@ class Record:
         status = ''
         evaluation_message = f''
         status_color = "white"
-        if self.check_result['result'] == CheckResult.PASSED:
+        if self.result == CheckResult.PASSED:
             status = CheckResult.PASSED.name
             status_color = "green"
-        elif self.check_result['result'] == CheckResult.FAILED:
+        elif self.result == CheckResult.FAILED:
             status = CheckResult.FAILED.name
             status_color = "red"
-        elif self.check_result['result'] == CheckResult.SKIPPED:
+        elif self.result == CheckResult.SKIPPED:
             status = CheckResult.SKIPPED.name
             status_color = 'blue'
-            suppress_comment = "\tSuppress comment: {}\n".format(self.check_result['suppress_comment'])
+            suppress_comment = "\tSuppress comment: {}\n".format(self.suppress_comment)
 
         check_message = colored("Check: {}: \"{}\"\n".format(self.check_id, self.check_name), "white")
         guideline_message = ''
@@ -78,25 +193,26 @@ class Record:
             "\tFile: {}:{}\n".format(self.file_path, "-".join([str(x) for x in self.file_line_range])),
             "magenta")
         code_lines = ""
-        if self.code_block:
+        code_block = self.code_block
+        if code_block:
             code_lines = "\n{}\n".format("".join(
-                [self._code_line_string(self.code_block)]))
+                [self._code_line_string(code_block)]))
         if self.evaluations:
             for (var_name, var_evaluations) in self.evaluations.items():
                 var_file = var_evaluations['var_file']
                 var_definitions = var_evaluations['definitions']
                 for definition_obj in var_definitions:
                     definition_expression = definition_obj["definition_expression"]
-                    if self._is_expression_in_code_lines(definition_expression):
+                    if self._is_expression_in_code_lines(definition_expression, code_block):
                         evaluation_message = evaluation_message + colored(
                             f'\tVariable {colored(var_name, "yellow")} (of {var_file}) evaluated to value "{colored(var_evaluations["value"], "yellow")}" '
                             f'in expression: {colored(definition_obj["definition_name"] + " = ", "yellow")}{colored(definition_obj["definition_expression"], "yellow")}\n',
                             'white')
         status_message = colored("\t{} for resource: {}\n".format(status, self.resource), status_color)
-        if self.check_result['result'] == CheckResult.FAILED and code_lines:
+        if self.result == CheckResult.FAILED and code_lines:
             return check_message + status_message + file_details + guideline_message + code_lines + evaluation_message
 
-        if self.check_result['result'] == CheckResult.SKIPPED:
+        if self.result == CheckResult.SKIPPED:
             return check_message + status_message + suppress_comment + file_details + guideline_message
         else:
             return check_message + status_message + file_details + evaluation_message + guideline_message
@@ -0,0 +1,68 @@
+"""
+Spool of the records of a report, which keeps them in a temporary file instead of in memory, for the scans of large
+repositories. The records are pickled to the file in batches as they are added, and unpickled a batch at a time when
+the spool is iterated, so only a batch of records is in memory at once.
+"""
+import pickle
+import tempfile
+
+# Number of records kept in memory before they are written to the file
+BATCH_SIZE = 1000
+
+
+class RecordSpool(object):
+    """
+    Append only sequence of records, iterable (any number of times) in the order they were added
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self._records = []
+        self._batch_offsets = []
+        self._count = 0
+        self._fp = None
+
+    def append(self, record):
+        self._records.append(record)
+        self._count += 1
+        if len(self._records) >= self.batch_size:
+            self._flush()
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+        self._fp = None
+        self._records = []
+        self._batch_offsets = []
+        self._count = 0
+
+    def _flush(self):
+        if self._fp is None:
+            self._fp = tempfile.TemporaryFile(prefix='checkov_records_')
+        self._fp.seek(0, 2)
+        self._batch_offsets.append(self._fp.tell())
+        pickle.dump(self._records, self._fp, protocol=pickle.HIGHEST_PROTOCOL)
+        self._records = []
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        # a batch is read whole before its records are yielded, so other iterations can move the file's position
+        for offset in list(self._batch_offsets):
+            self._fp.seek(offset)
+            yield from pickle.load(self._fp)
+        yield from list(self._records)
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return f'RecordSpool({self._count} records)'
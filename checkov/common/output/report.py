@@ -1,11 +1,15 @@
+import itertools
 import json
-from collections import defaultdict
+import sys
+from collections import Counter, defaultdict
 
 from colorama import init
 from junit_xml import TestCase, TestSuite
 from termcolor import colored
 
 from checkov.common.models.enums import CheckResult
+from checkov.common.output.record_spool import RecordSpool
+from checkov.common.output.report_writers import JsonReportWriter, JunitXmlReportWriter
 from checkov.version import version
 from tabulate import tabulate
 
@@ -14,12 +18,17 @@ init(autoreset=True)
 
 class Report:
 
-    def __init__(self, check_type):
+    def __init__(self, check_type, spool_records=False):
+        """
+        :param spool_records: whether to keep the records in temporary files (RecordSpool) instead of in memory
+        """
         self.check_type = check_type
-        self.passed_checks = []
-        self.failed_checks = []
-        self.skipped_checks = []
+        self.passed_checks = RecordSpool() if spool_records else []
+        self.failed_checks = RecordSpool() if spool_records else []
+        self.skipped_checks = RecordSpool() if spool_records else []
         self.parsing_errors = []
+        # Counter of the CheckResult of the results which weren't recorded, see ResultCounts
+        self.unrecorded_results = Counter()
 
     def add_parsing_errors(self, files):
         for file in files:
@@ -30,18 +39,24 @@ class Report:
             self.parsing_errors.append(file)
 
     def add_record(self, record):
-        if record.check_result['result'] == CheckResult.PASSED:
+        if record.result == CheckResult.PASSED:
             self.passed_checks.append(record)
-        if record.check_result['result'] == CheckResult.FAILED:
+        if record.result == CheckResult.FAILED:
             self.failed_checks.append(record)
-        if record.check_result['result'] == CheckResult.SKIPPED:
+        if record.result == CheckResult.SKIPPED:
             self.skipped_checks.append(record)
 
+    def add_result_counts(self, result_counts):
+        """
+        :param result_counts: ResultCounts of results which weren't recorded
+        """
+        self.unrecorded_results.update(result_counts.counts)
+
     def get_summary(self):
         return {
-            "passed": len(self.passed_checks),
-            "failed": len(self.failed_checks),
-            "skipped": len(self.skipped_checks),
+            "passed": len(self.passed_checks) + self.unrecorded_results[CheckResult.PASSED],
+            "failed": len(self.failed_checks) + self.unrecorded_results[CheckResult.FAILED],
+            "skipped": len(self.skipped_checks) + self.unrecorded_results[CheckResult.SKIPPED],
             "parsing_errors": len(self.parsing_errors),
             "checkov_version": version
         }
@@ -53,9 +68,9 @@ class Report:
         return {
             "check_type": self.check_type,
             "results": {
-                "passed_checks": [check.__dict__ for check in self.passed_checks],
-                "failed_checks": [check.__dict__ for check in self.failed_checks],
-                "skipped_checks": [check.__dict__ for check in self.skipped_checks],
+                "passed_checks": [check.get_dict() for check in self.passed_checks],
+                "failed_checks": [check.get_dict() for check in self.failed_checks],
+                "skipped_checks": [check.get_dict() for check in self.skipped_checks],
                 "parsing_errors": [check for check in self.parsing_errors]
             },
             "summary": self.get_summary()
@@ -64,12 +79,13 @@ class Report:
     def get_exit_code(self, soft_fail):
         if soft_fail:
             return 0
-        elif len(self.failed_checks) > 0:
+        elif len(self.failed_checks) > 0 or self.unrecorded_results[CheckResult.FAILED] > 0:
             return 1
         return 0
 
     def is_empty(self):
-        return len(self.passed_checks) + len(self.failed_checks) + len(self.skipped_checks) == 0
+        summary = self.get_summary()
+        return summary["passed"] + summary["failed"] + summary["skipped"] == 0
 
     def print_console(self, is_quiet=False):
         summary = self.get_summary()
@@ -91,8 +107,8 @@ class Report:
                 print(record)
 
     def print_junit_xml(self):
-        ts = self.get_test_suites()
-        print(TestSuite.to_xml_string(ts))
+        JunitXmlReportWriter(sys.stdout).write(self)
+        print()
 
     def print_failed_github_md(self):
         result = []
@@ -104,20 +120,18 @@ class Report:
     def get_test_suites(self):
         test_cases = defaultdict(list)
         test_suites = []
-        records = self.passed_checks + self.failed_checks + self.skipped_checks
-        for record in records:
+        for record in itertools.chain(self.passed_checks, self.failed_checks, self.skipped_checks):
             check_name = record.check_name
 
             test_name = "{} {} {}".format(self.check_type, check_name, record.resource)
             test_case = TestCase(name=test_name, file=record.file_path, classname=record.check_class)
-            if record.check_result['result'] == CheckResult.FAILED:
+            if record.result == CheckResult.FAILED:
                 test_case.add_failure_info(
                     "Resource \"{}\" failed in check \"{}\"".format(record.resource, check_name))
-            if record.check_result['result'] == CheckResult.SKIPPED:
+            if record.result == CheckResult.SKIPPED:
                 test_case.add_skipped_info(
                     "Resource \"{}\" skipped in check \"{}\"\n Suppress comment: {}".format(record.resource, check_name,
-                                                                                            record.check_result[
-                                                                                                'suppress_comment']))
+                                                                                            record.suppress_comment))
             test_cases[check_name].append(test_case)
         for key in test_cases.keys():
             test_suites.append(
@@ -125,5 +139,6 @@ class Report:
         return test_suites
 
     def print_json(self):
-        print(self.get_json())
+        JsonReportWriter(sys.stdout).write_report(self)
+        print()
 
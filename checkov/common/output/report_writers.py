@@ -0,0 +1,203 @@
+"""
+Writers of the JSON and JUnit XML outputs of reports, which write the outputs record by record to a file (or stdout)
+instead of building the whole output (the reports' dicts and their JSON string, or the junit_xml test suites and
+their XML document) in memory first. The outputs are the same, to the byte, as the ones built in memory by the
+running interpreter.
+"""
+import itertools
+import json
+import re
+import xml.dom.minidom
+import xml.etree.ElementTree as ET
+
+from checkov.common.models.enums import CheckResult
+
+# Result lists of a report's JSON output, and the report's attribute holding each list's records
+JSON_RESULT_LISTS = (('passed_checks', 'passed_checks'), ('failed_checks', 'failed_checks'),
+                     ('skipped_checks', 'skipped_checks'))
+
+# The characters junit_xml removes from its XML document, once its (ASCII) attributes are escaped by ElementTree
+ILLEGAL_XML_CHARACTERS = re.compile('[\x00-\x08\x0b-\x1f\x7f]')
+# The characters whose escaping in attributes differs between the versions of ElementTree and minidom
+CONTROL_CHARACTERS = re.compile('[\x00-\x1f\x7f]')
+
+
+class JsonReportWriter(object):
+    """
+    Writes reports as json.dumps(..., indent=4) would write their dicts: each record's dict is dumped on its own and
+    indented to its depth in the output
+    """
+
+    def __init__(self, fp, indent=4):
+        self.fp = fp
+        self.indent = indent
+
+    def write(self, scan_reports):
+        """
+        Write the JSON output of the reports of a run, see RunnerRegistry.get_json_output
+        """
+        reports = [report for report in scan_reports if not report.is_empty()]
+        if len(reports) == 1:
+            self.write_report(reports[0])
+        else:
+            self._write_list(reports, 0, self._write_report)
+
+    def write_report(self, report):
+        """
+        Write the JSON output of a report, see Report.get_dict
+        """
+        self._write_report(report, 0)
+
+    def _write_report(self, report, level):
+        self._write_dict([
+            ('check_type', lambda value_level: self._write_value(report.check_type, value_level)),
+            ('results', lambda value_level: self._write_results(report, value_level)),
+            ('summary', lambda value_level: self._write_value(report.get_summary(), value_level)),
+        ], level)
+
+    def _write_results(self, report, level):
+        items = [(key, lambda value_level, records=getattr(report, attribute):
+                  self._write_list(records, value_level, self._write_record))
+                 for key, attribute in JSON_RESULT_LISTS]
+        items.append(('parsing_errors', lambda value_level: self._write_list(report.parsing_errors, value_level,
+                                                                              self._write_value)))
+        self._write_dict(items, level)
+
+    def _write_record(self, record, level):
+        self._write_value(record.get_dict(), level)
+
+    def _write_value(self, value, level):
+        # JSON strings have their line breaks escaped, so the dump's lines are the lines of its structure
+        self.fp.write(json.dumps(value, indent=self.indent).replace('\n', '\n' + self._get_padding(level)))
+
+    def _write_dict(self, items, level):
+        """
+        :param items: list of the (key, function writing the value at a level) of the dict
+        """
+        if not items:
+            self.fp.write('{}')
+            return
+        padding = self._get_padding(level + 1)
+        self.fp.write('{')
+        for index, (key, write_value) in enumerate(items):
+            self.fp.write(f'{"," if index else ""}\n{padding}{json.dumps(key)}: ')
+            write_value(level + 1)
+        self.fp.write(f'\n{self._get_padding(level)}}}')
+
+    def _write_list(self, values, level, write_value):
+        if not values:
+            self.fp.write('[]')
+            return
+        padding = self._get_padding(level + 1)
+        self.fp.write('[')
+        for index, value in enumerate(values):
+            self.fp.write(f'{"," if index else ""}\n{padding}')
+            write_value(value, level + 1)
+        self.fp.write(f'\n{self._get_padding(level)}]')
+
+    def _get_padding(self, level):
+        return ' ' * (self.indent * level)
+
+
+class _JunitSuite(object):
+    """
+    Test suite of the records of a check, see Report.get_test_suites
+    """
+
+    def __init__(self, name, package):
+        self.name = name
+        self.package = package
+        self.records = []
+        self.failures = 0
+        self.skipped = 0
+
+
+class JunitXmlReportWriter(object):
+    """
+    Writes a report as junit_xml writes its test suites (Report.get_test_suites) with TestSuite.to_xml_string. The
+    records are grouped by check into the suites first, as the suites' and the document's counts come before their
+    test cases.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+
+    def write(self, report):
+        suites = {}
+        for record in itertools.chain(report.passed_checks, report.failed_checks, report.skipped_checks):
+            suite = suites.get(record.check_name)
+            if suite is None:
+                suite = suites[record.check_name] = _JunitSuite(record.check_name, record.check_class)
+            suite.records.append(record)
+            result = record.result
+            if result == CheckResult.FAILED:
+                suite.failures += 1
+            elif result == CheckResult.SKIPPED:
+                suite.skipped += 1
+
+        self.fp.write('<?xml version="1.0" ?>\n')
+        if not suites:
+            self.fp.write('<testsuites/>\n')
+            return
+        failures = sum(suite.failures for suite in suites.values())
+        tests = sum(len(suite.records) for suite in suites.values())
+        self._write_element_start('testsuites', [('disabled', 0), ('errors', 0), ('failures', failures),
+                                                 ('tests', tests), ('time', 0.0)], '')
+        for suite in suites.values():
+            self._write_suite(report, suite)
+        self.fp.write('</testsuites>\n')
+
+    def _write_suite(self, report, suite):
+        attributes = [('disabled', 0), ('errors', 0), ('failures', suite.failures), ('name', suite.name),
+                      ('skipped', suite.skipped), ('tests', len(suite.records)), ('time', 0)]
+        if suite.package:
+            attributes.append(('package', suite.package))
+        self._write_element_start('testsuite', attributes, '\t')
+        for record in suite.records:
+            self._write_test_case(report, record)
+        self.fp.write('\t</testsuite>\n')
+
+    def _write_test_case(self, report, record):
+        attributes = [('name', f'{report.check_type} {record.check_name} {record.resource}')]
+        if record.check_class:
+            attributes.append(('classname', record.check_class))
+        if record.file_path:
+            attributes.append(('file', record.file_path))
+        result = record.result
+        if result == CheckResult.FAILED:
+            message = f'Resource "{record.resource}" failed in check "{record.check_name}"'
+            self._write_element_start('testcase', attributes, '\t\t')
+            self._write_element('failure', [('type', 'failure'), ('message', message)], '\t\t\t')
+            self.fp.write('\t\t</testcase>\n')
+        elif result == CheckResult.SKIPPED:
+            message = f'Resource "{record.resource}" skipped in check "{record.check_name}"\n ' \
+                      f'Suppress comment: {record.suppress_comment}'
+            self._write_element_start('testcase', attributes, '\t\t')
+            self._write_element('skipped', [('type', 'skipped'), ('message', message)], '\t\t\t')
+            self.fp.write('\t\t</testcase>\n')
+        else:
+            self._write_element('testcase', attributes, '\t\t')
+
+    def _write_element_start(self, tag, attributes, indent):
+        self.fp.write(f'{indent}<{tag}{self._format_attributes(attributes)}>\n')
+
+    def _write_element(self, tag, attributes, indent):
+        self.fp.write(f'{indent}<{tag}{self._format_attributes(attributes)}/>\n')
+
+    @staticmethod
+    def _format_attributes(attributes):
+        return ''.join(f' {name}="{JunitXmlReportWriter._escape_attribute(value)}"' for name, value in attributes)
+
+    @staticmethod
+    def _escape_attribute(value):
+        """
+        :return: the attribute value as junit_xml writes it: escaped by ElementTree, cleaned of the illegal
+                 characters, parsed and written back by minidom. The values with control characters go through the
+                 same steps, since the escaping of line breaks and tabs depends on the Python version
+        """
+        value = str(value)
+        if CONTROL_CHARACTERS.search(value) is None:
+            return value.replace('&', '&amp;').replace('<', '&lt;').replace('"', '&quot;').replace('>', '&gt;')
+        xml_string = ILLEGAL_XML_CHARACTERS.sub('', ET.tostring(ET.Element('a', v=value)).decode('utf-8'))
+        xml_string = xml.dom.minidom.parseString(xml_string.encode('utf-8')).documentElement.toxml()
+        return xml_string[len('<a v="'):-len('"/>')]
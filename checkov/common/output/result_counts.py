@@ -0,0 +1,16 @@
+from collections import Counter
+
+
+class ResultCounts(object):
+    """
+    Counts of the results of an entity's checks which weren't recorded: a runner yields them instead of the Records
+    of the results when the runner filter only records some of the results (see RunnerFilter.recorded_results), so
+    the reports' summaries still count every result
+    """
+    __slots__ = ('file_path', 'file_line_range', 'counts')
+
+    def __init__(self, file_path, file_line_range):
+        self.file_path = file_path
+        self.file_line_range = file_line_range
+        # Counter of the CheckResult of the results
+        self.counts = Counter()
@@ -1,6 +1,8 @@
+import itertools
 import os
-from abc import ABC, abstractmethod
+from abc import ABC
 
+from checkov.common.output.result_counts import ResultCounts
 from checkov.runner_filter import RunnerFilter
 
 IGNORED_DIRECTORIES_ENV = os.getenv('CKV_IGNORED_DIRECTORIES', "node_modules,.terraform,.serverless")
@@ -11,9 +13,67 @@ ignored_directories = IGNORED_DIRECTORIES_ENV.split(",")
 class BaseRunner(ABC):
     check_type = ""
 
-    @abstractmethod
-    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True):
-        pass
+    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True,
+            file_discovery=None):
+        """
+        Runners implement run_records, or run itself
+        :return: Report of the records of run_records
+        """
+        if type(self).run_records is BaseRunner.run_records:
+            raise NotImplementedError()
+        # imported when it is used, as the report's output modules are slow to import
+        from checkov.common.output.report import Report
+
+        report = Report(self.check_type)
+        parsing_errors = []
+        for record in self.run_records(root_folder, external_checks_dir=external_checks_dir, files=files,
+                                       runner_filter=runner_filter, collect_skip_comments=collect_skip_comments,
+                                       file_discovery=file_discovery, parsing_errors=parsing_errors):
+            if isinstance(record, ResultCounts):
+                report.add_result_counts(record)
+            else:
+                report.add_record(record=record)
+        report.add_parsing_errors(parsing_errors)
+        return report
+
+    def run_records(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+                    collect_skip_comments=True, file_discovery=None, parsing_errors=None):
+        """
+        Scan the files and yield the Record of each check of each scanned entity, as soon as the entity is scanned.
+        The results runner_filter doesn't record are counted in a ResultCounts per entity, yielded instead of their
+        Records (see split_results).
+        The runners which only implement run yield the records of its report, once the files are scanned.
+        :param parsing_errors: list to add the files which couldn't be parsed to, if given
+        """
+        if type(self).run is BaseRunner.run:
+            raise NotImplementedError()
+        # the runners implementing run walk the root folder themselves (file_discovery isn't a parameter of older ones)
+        report = self.run(root_folder, external_checks_dir=external_checks_dir, files=files,
+                          runner_filter=runner_filter, collect_skip_comments=collect_skip_comments)
+        if parsing_errors is not None:
+            parsing_errors.extend(report.parsing_errors)
+        yield from itertools.chain(report.passed_checks, report.failed_checks, report.skipped_checks)
+
+    @staticmethod
+    def split_results(results, runner_filter, file_path, file_line_range):
+        """
+        :param results: dict of the checks of an entity to their results
+        :return: tuple of the results to create the Records of, and the ResultCounts of the other results (None if
+                 all of them are recorded)
+        """
+        recorded_results = runner_filter.recorded_results if runner_filter else None
+        if recorded_results is None:
+            return results, None
+        result_counts = None
+        entity_results = {}
+        for check, check_result in results.items():
+            if check_result['result'] in recorded_results:
+                entity_results[check] = check_result
+            else:
+                if result_counts is None:
+                    result_counts = ResultCounts(file_path, file_line_range)
+                result_counts.counts[check_result['result']] += 1
+        return entity_results, result_counts
 
 
 def filter_ignored_directories(d_names):
@@ -0,0 +1,156 @@
+import logging
+import os
+import re
+from pathlib import Path
+
+from checkov.common.models.consts import SLS_FILE_MASK
+
+# Hunk header of a diff with no context lines, e.g. "@@ -10,2 +12,3 @@", the new lines are "+12,3"
+HUNK_HEADER_REGEX = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+# Serverless file() variable, e.g. ${file(./config.yml):key}
+SLS_FILE_REFERENCE_REGEX = re.compile(r'file\(([^?%*:|"<>]+?)\)')
+# Escape of a C-style quoted path, as git quotes the paths with special or non-ASCII characters, e.g. "b/\303\251.tf"
+QUOTED_PATH_ESCAPE_REGEX = re.compile(r'\\([0-7]{1,3}|.)')
+QUOTED_PATH_ESCAPES = {'a': '\a', 'b': '\b', 't': '\t', 'n': '\n', 'v': '\v', 'f': '\f', 'r': '\r'}
+
+
+class DiffScope(object):
+    """
+    Scope of a scan to what changed compared to a git base ref: the changed files, and the files they need as context
+    (the sibling Terraform files of a changed Terraform file, for variable evaluation, and the serverless files
+    including a changed file with file()). The reports are then limited to the records of the changed entities.
+    """
+
+    def __init__(self, root_folder, diff_base):
+        """
+        :param root_folder: scanned folder, in a git working tree
+        :param diff_base: git ref the working tree is compared to (through its merge base with HEAD)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.root_folder = root_folder
+        self.diff_base = diff_base
+        # absolute path of a changed file to the (inclusive) ranges of its changed lines, None if it changed entirely
+        self.changed_lines = {}
+
+    def load(self):
+        # GitPython is imported when it is used, as it is slow to import
+        try:
+            from git import Repo
+        except ImportError as e:
+            raise ImportError("Unable to load git module (is the git executable available?)") from e
+
+        repo = Repo(self.root_folder, search_parent_directories=True)
+        merge_bases = repo.merge_base(self.diff_base, repo.head.commit)
+        base_commit = merge_bases[0] if merge_bases else repo.commit(self.diff_base)
+        self.logger.debug(f'Scanning the changes since {base_commit.hexsha} ({self.diff_base})')
+
+        diff = repo.git.diff(base_commit.hexsha, '--unified=0', '--no-color', '--no-ext-diff', '--no-renames')
+        self.changed_lines = self.parse_diff(diff, repo.working_tree_dir)
+        for file_path in repo.untracked_files:
+            self.changed_lines[os.path.abspath(os.path.join(repo.working_tree_dir, file_path))] = None
+        return self
+
+    @staticmethod
+    def parse_diff(diff, working_tree_dir):
+        """
+        :param diff: output of git diff with no context lines
+        :param working_tree_dir: root directory of the diff's paths
+        :return: dict of the absolute path of a changed file to the ranges of its changed lines
+        """
+        changed_lines = {}
+        file_path = None
+        for line in diff.splitlines():
+            if line.startswith('+++ '):
+                new_path = DiffScope.unquote_path(line[4:])
+                if new_path == '/dev/null':
+                    file_path = None
+                else:
+                    file_path = os.path.abspath(os.path.join(working_tree_dir, new_path[2:]))
+                    changed_lines.setdefault(file_path, [])
+                continue
+            hunk_header = HUNK_HEADER_REGEX.match(line)
+            if hunk_header and file_path:
+                start = int(hunk_header.group(1))
+                count = int(hunk_header.group(2)) if hunk_header.group(2) is not None else 1
+                if count:
+                    changed_lines[file_path].append((start, start + count - 1))
+                else:
+                    # lines were only removed, after the start line
+                    changed_lines[file_path].append((max(start, 1), start + 1))
+        return changed_lines
+
+    @staticmethod
+    def unquote_path(path):
+        """
+        :param path: path of a file header line of git diff, which git ends with a tab if the path contains a space,
+                     and C-style quotes (with octal escapes of the UTF-8 bytes of the non-ASCII characters) if the path
+                     contains special or non-ASCII characters
+        :return: the path
+        """
+        if path.endswith('\t'):
+            path = path[:-1]
+        if len(path) < 2 or not (path.startswith('"') and path.endswith('"')):
+            return path
+
+        # the escapes are of the path's bytes, the other characters are as the file system decoded them
+        path_bytes = b''
+        for index, part in enumerate(QUOTED_PATH_ESCAPE_REGEX.split(path[1:-1])):
+            if index % 2 == 0:
+                path_bytes += os.fsencode(part)
+            elif part[0] in '01234567':
+                path_bytes += bytes([int(part, 8) & 0xff])
+            else:
+                path_bytes += os.fsencode(QUOTED_PATH_ESCAPES.get(part, part))
+        return os.fsdecode(path_bytes)
+
+    def get_scope(self, file_discovery):
+        """
+        :param file_discovery: FileDiscovery of the root folder
+        :return: set of the absolute paths of the files to scan
+        """
+        changed_files = {file_path for file_path in self.changed_lines if os.path.isfile(file_path)}
+        scope = set(changed_files)
+
+        changed_tf_directories = {os.path.dirname(file_path) for file_path in changed_files if
+                                  file_path.endswith('.tf')}
+        for file_path in file_discovery.get_files(extensions=['.tf']):
+            if os.path.dirname(os.path.abspath(file_path)) in changed_tf_directories:
+                scope.add(os.path.abspath(file_path))
+
+        for file_path in file_discovery.get_files(names=SLS_FILE_MASK):
+            sls_file = os.path.abspath(file_path)
+            if sls_file not in scope and self.includes_any(sls_file, changed_files):
+                scope.add(sls_file)
+                # its entities may have changed with the included file
+                self.changed_lines[sls_file] = None
+        return scope
+
+    @staticmethod
+    def includes_any(sls_file, file_paths):
+        """
+        :return: whether the serverless file includes any of the files (absolute paths) with file()
+        """
+        try:
+            with open(sls_file) as fp:
+                content = fp.read()
+        except (OSError, UnicodeDecodeError):
+            return False
+        service_file_directory = os.path.dirname(sls_file)
+        for file_location in SLS_FILE_REFERENCE_REGEX.findall(content):
+            file_location = file_location.strip().replace("~", str(Path.home()))
+            if os.path.abspath(os.path.join(service_file_directory, file_location)) in file_paths:
+                return True
+        return False
+
+    def is_changed(self, record, root_folder):
+        """
+        :return: whether the record's entity changed
+        """
+        file_path = os.path.abspath(os.path.join(root_folder, record.file_path.lstrip('/')))
+        if file_path not in self.changed_lines:
+            return False
+        line_ranges = self.changed_lines[file_path]
+        if line_ranges is None:
+            return True
+        start_line, end_line = record.file_line_range
+        return any(start <= end_line and start_line <= end for start, end in line_ranges)
@@ -0,0 +1,157 @@
+import logging
+import os
+from collections import defaultdict
+
+from checkov.common.runners.base_runner import ignored_directories
+
+
+class FileDiscovery(object):
+    """
+    Walks a root folder once with os.scandir, in the same order as os.walk and skipping the ignored directories, and
+    indexes its files by extension and name. The runners (and the platform uploader) select their candidate files from
+    it instead of walking the folder again.
+    """
+
+    def __init__(self, root_folder):
+        self.logger = logging.getLogger(__name__)
+        self.root_folder = root_folder
+        self._walk = None
+        self._ignored_walk = None
+        self._ignored_directories = []
+        self._files = []
+        self._files_by_extension = defaultdict(list)
+        self._files_by_name = defaultdict(list)
+
+    def walk(self, root_folder=None):
+        """
+        :param root_folder: path of the root folder the directory paths are returned under, when it is given
+                            differently than the discovery's root folder (e.g. as an absolute path)
+        :return: list of (directory path, file names) of the root folder's directories, like os.walk (without the
+                 directory names) after filtering the ignored directories
+        """
+        self._scan_root_folder()
+        if root_folder is None or root_folder == self.root_folder:
+            return self._walk
+        return [(self._rebase(directory, root_folder), file_names) for directory, file_names in self._walk]
+
+    def _rebase(self, directory, root_folder):
+        relative_directory = os.path.relpath(directory, self.root_folder)
+        if relative_directory == os.curdir:
+            return root_folder
+        return os.path.join(root_folder, relative_directory)
+
+    def _scan_root_folder(self):
+        if self._walk is None:
+            self._walk = []
+            self._scan(self.root_folder, self._walk, self._ignored_directories)
+            self._index_files()
+
+    def _index_files(self):
+        for directory, file_names in self._walk:
+            for file_name in file_names:
+                file_id = len(self._files)
+                self._files.append(os.path.join(directory, file_name))
+                self._files_by_extension[os.path.splitext(file_name)[1]].append(file_id)
+                self._files_by_name[file_name].append(file_id)
+
+    def scoped(self, file_paths):
+        """
+        Get a discovery of the same root folder which only discovers some of its files, directories without any of
+        the files are left out of its walk
+        :param file_paths: absolute paths of the files to discover
+        :return: FileDiscovery of the root folder, limited to file_paths
+        """
+        self._scan_root_folder()
+        scoped_discovery = FileDiscovery(self.root_folder)
+        scoped_discovery._walk = []
+        for directory, file_names in self._walk:
+            scoped_file_names = [file_name for file_name in file_names if
+                                 os.path.abspath(os.path.join(directory, file_name)) in file_paths]
+            if scoped_file_names:
+                scoped_discovery._walk.append((directory, scoped_file_names))
+        scoped_discovery._index_files()
+        return scoped_discovery
+
+    @classmethod
+    def from_files(cls, root_folder, file_paths):
+        """
+        Get a discovery of a root folder which discovers the given files only, without walking the root folder
+        :param file_paths: absolute paths of files under the root folder
+        :return: FileDiscovery of the root folder, limited to file_paths
+        """
+        file_names_by_directory = defaultdict(list)
+        for file_path in sorted(file_paths):
+            directory, file_name = os.path.split(file_path)
+            file_names_by_directory[directory].append(file_name)
+        file_discovery = cls(root_folder)
+        file_discovery._walk = [(file_discovery._rebase(directory, root_folder), file_names) for
+                                directory, file_names in file_names_by_directory.items()]
+        file_discovery._index_files()
+        return file_discovery
+
+    def get_files(self, extensions=(), names=(), include_ignored_directories=False):
+        """
+        Get the files of the root folder matching any of the given extensions or names
+        :param extensions: file extensions, as returned by os.path.splitext (e.g. '.json')
+        :param names: file names
+        :param include_ignored_directories: whether to also return the files found in the ignored directories
+        :return: list of the file paths, in the order of os.walk
+        """
+        self._scan_root_folder()
+        file_ids = set()
+        for extension in extensions:
+            file_ids.update(self._files_by_extension.get(extension, []))
+        for name in names:
+            file_ids.update(self._files_by_name.get(name, []))
+        files = [self._files[file_id] for file_id in sorted(file_ids)]
+
+        if include_ignored_directories:
+            for directory, file_names in self._walk_ignored_directories():
+                files.extend(os.path.join(directory, file_name) for file_name in file_names if
+                             file_name in names or os.path.splitext(file_name)[1] in extensions)
+        return files
+
+    def _walk_ignored_directories(self):
+        if self._ignored_walk is None:
+            self._ignored_walk = []
+            for directory in self._ignored_directories:
+                self._scan(directory, self._ignored_walk)
+        return self._ignored_walk
+
+    def _scan(self, directory, walk, ignored=None):
+        """
+        Scan a directory tree top-down, skipping symbolic links to directories like os.walk does
+        :param directory: directory to scan
+        :param walk: list the (directory path, file names) of the scanned directories are appended to
+        :param ignored: list the skipped ignored directories are appended to, None to not skip them
+        """
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError as e:
+            self.logger.debug(f'Failed to scan directory {directory}', exc_info=e)
+            return
+
+        sub_directories = []
+        file_names = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                sub_directories.append(entry)
+            else:
+                file_names.append(entry.name)
+        walk.append((directory, file_names))
+
+        for entry in sub_directories:
+            try:
+                if entry.is_symlink():
+                    continue
+            except OSError:
+                continue
+            if ignored is not None and entry.name in ignored_directories:
+                ignored.append(entry.path)
+                continue
+            self._scan(entry.path, walk, ignored)
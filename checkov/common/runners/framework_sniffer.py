@@ -0,0 +1,78 @@
+import logging
+import mmap
+
+# Text every file of a framework contains, e.g. the keys the runner requires in its templates
+FRAMEWORK_MARKERS = {
+    'cloudformation': (b'Resources',),
+    'kubernetes': (b'apiVersion', b'kind'),
+    'serverless': (b'provider',),
+    'arm': (b'$schema', b'resources'),
+}
+
+# Encodings the markers can't be searched in as (ASCII) bytes
+UNSEARCHABLE_BOMS = (b'\xff\xfe', b'\xfe\xff')
+
+STRICT = 'strict'
+AUDIT = 'audit'
+OFF = 'off'
+SNIFFING_MODES = [STRICT, AUDIT, OFF]
+
+
+class FrameworkSniffer(object):
+    """
+    Prefilter of the files a runner parses: a file which doesn't contain the markers of a framework can't be one of its
+    templates, so it isn't parsed by the framework's runner. The file is memory mapped, it is not decoded nor copied.
+
+    Modes:
+        strict - the files without the framework's markers are skipped
+        audit - all the files are parsed, and the files which are matched by a framework without having its markers
+                (false negatives of the markers) are logged
+        off - all the files are parsed
+    """
+
+    def __init__(self, mode=STRICT):
+        self.logger = logging.getLogger(__name__)
+        self.mode = mode
+
+    def may_match(self, filename, framework):
+        """
+        :param filename: path of the file
+        :param framework: check type of the runner
+        :return: False if the file should not be parsed by the framework's runner
+        """
+        if self.mode != STRICT:
+            return True
+        return self.has_markers(filename, framework)
+
+    def audit(self, filename, framework, matched):
+        """
+        Log the file if it was matched by the framework's runner even though it doesn't have the framework's markers
+        :param filename: path of the file
+        :param framework: check type of the runner
+        :param matched: whether the runner found templates of its framework in the file
+        """
+        if self.mode == AUDIT and matched and not self.has_markers(filename, framework):
+            self.logger.warning(f'{framework} template {filename} does not contain the {framework} markers, '
+                                f'it would be skipped in {STRICT} framework sniffing')
+
+    def has_markers(self, filename, framework):
+        markers = FRAMEWORK_MARKERS.get(framework)
+        if not markers:
+            return True
+        try:
+            with open(filename, 'rb') as fp:
+                if fp.read(len(UNSEARCHABLE_BOMS[0])) in UNSEARCHABLE_BOMS:
+                    return True
+                try:
+                    content = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # an empty file can't be mapped
+                    return False
+                with content:
+                    return all(content.find(marker) != -1 for marker in markers)
+        except OSError:
+            # let the parser handle (and report) unreadable files
+            return True
+
+
+framework_sniffer = FrameworkSniffer()
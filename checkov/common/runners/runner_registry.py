@@ -1,8 +1,18 @@
-import json
 import logging
+import sys
 from abc import abstractmethod
 
+from checkov.common.checks.check_plan import CheckPlan
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.report_writers import JsonReportWriter
+from checkov.common.output.result_counts import ResultCounts
+from checkov.common.runners.diff_scope import DiffScope
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.util.check_result_cache import check_result_cache
+from checkov.common.util.document_store import document_store
+
 OUTPUT_CHOICES = ['cli', 'json', 'junitxml', 'github_failed_only']
+FRAMEWORK_CHOICES = ['cloudformation', 'terraform', 'kubernetes', 'serverless', 'arm', 'all']
 
 
 class RunnerRegistry(object):
@@ -16,43 +26,105 @@ class RunnerRegistry(object):
         self.runners = runners
         self.banner = banner
         self.scan_reports = []
+        self.file_discovery = None
+        # whether the reports keep their records in temporary files instead of in memory
+        self.spool_records = False
+        # CheckResults to create the Records of, None for all of them, see get_recorded_results
+        self.recorded_results = None
         self.filter_runner_framework()
 
     @abstractmethod
     def extract_entity_details(self, entity):
         raise NotImplementedError()
 
-    def run(self, root_folder=None, external_checks_dir=None, files=None, guidelines={}, collect_skip_comments=True):
-        for runner in self.runners:
-            scan_report = runner.run(root_folder, external_checks_dir=external_checks_dir, files=files,
-                                     runner_filter=self.runner_filter, collect_skip_comments=collect_skip_comments)
-            RunnerRegistry.enrich_report_with_guidelines(scan_report, guidelines)
-            self.scan_reports.append(scan_report)
+    def run(self, root_folder=None, external_checks_dir=None, files=None, guidelines={}, collect_skip_comments=True,
+            diff_base=None, file_discovery=None):
+        """
+        :param diff_base: git ref to only scan the changes of the root folder since, None to scan all of it
+        :param file_discovery: FileDiscovery of the root folder's files to scan, None to scan all of them
+        """
+        # imported when it is used, as the report's output modules are slow to import
+        from checkov.common.output.report import Report
+
+        # the root folder is walked once, for all the runners
+        self.file_discovery = file_discovery or (FileDiscovery(root_folder) if root_folder else None)
+        runners_file_discovery = self.file_discovery
+        diff_scope = None
+        if diff_base and root_folder:
+            diff_scope = DiffScope(root_folder, diff_base).load()
+            runners_file_discovery = self.file_discovery.scoped(diff_scope.get_scope(self.file_discovery))
+        # the checks to run are compiled once, and the YAML and JSON files are read and composed once, for all the
+        # runners
+        self.runner_filter.check_plan = CheckPlan(self.runner_filter)
+        self.runner_filter.recorded_results = self.recorded_results
+        try:
+            with document_store.run_scope():
+                for runner in self.runners:
+                    # the records are filtered, enriched and added to the report as the runner scans its entities
+                    scan_report = Report(runner.check_type, spool_records=self.spool_records)
+                    parsing_errors = []
+                    for record in runner.run_records(root_folder, external_checks_dir=external_checks_dir,
+                                                     files=files, runner_filter=self.runner_filter,
+                                                     collect_skip_comments=collect_skip_comments,
+                                                     file_discovery=runners_file_discovery,
+                                                     parsing_errors=parsing_errors):
+                        if diff_scope and not diff_scope.is_changed(record, root_folder):
+                            continue
+                        if isinstance(record, ResultCounts):
+                            scan_report.add_result_counts(record)
+                            continue
+                        if record.check_id in guidelines:
+                            record.set_guideline(guidelines[record.check_id])
+                        scan_report.add_record(record=record)
+                    scan_report.add_parsing_errors(parsing_errors)
+                    self.scan_reports.append(scan_report)
+        finally:
+            self.runner_filter.check_plan = None
+            self.runner_filter.recorded_results = None
+        check_result_cache.save()
         return self.scan_reports
 
     def print_reports(self, scan_reports, args):
         if args.output not in OUTPUT_CHOICES:
             print(f"{self.banner}\n")
-        exit_codes = []
-        report_jsons = []
         for report in scan_reports:
             if not report.is_empty():
-                if args.output == "json":
-                    report_jsons.append(report.get_dict())
-                elif args.output == "junitxml":
+                if args.output == "junitxml":
                     report.print_junit_xml()
                 elif args.output == 'github_failed_only':
                     report.print_failed_github_md()
-                else:
+                elif args.output != "json":
                     report.print_console(is_quiet=args.quiet)
-            exit_codes.append(report.get_exit_code(args.soft_fail))
         if args.output == "json":
-            if len(report_jsons) == 1:
-                print(json.dumps(report_jsons[0], indent=4))
-            else:
-                print(json.dumps(report_jsons, indent=4))
-        exit_code = 1 if 1 in exit_codes else 0
-        exit(exit_code)
+            JsonReportWriter(sys.stdout).write(scan_reports)
+            print()
+        exit(RunnerRegistry.get_exit_code(scan_reports, args.soft_fail))
+
+    @staticmethod
+    def get_recorded_results(args):
+        """
+        :return: the CheckResults whose records print_reports prints with the args' output, None if it prints all of
+                 them (the other results are only counted)
+        """
+        if args.output == 'github_failed_only' or (args.output not in ('json', 'junitxml') and args.quiet):
+            return {CheckResult.FAILED}
+        return None
+
+    @staticmethod
+    def get_json_output(scan_reports):
+        """
+        :return: the JSON output of the reports: the dict of the only non empty report, or a list of the non empty
+                 reports' dicts
+        """
+        report_jsons = [report.get_dict() for report in scan_reports if not report.is_empty()]
+        if len(report_jsons) == 1:
+            return report_jsons[0]
+        return report_jsons
+
+    @staticmethod
+    def get_exit_code(scan_reports, soft_fail=False):
+        exit_codes = [report.get_exit_code(soft_fail) for report in scan_reports]
+        return 1 if 1 in exit_codes else 0
 
     def filter_runner_framework(self):
         if not self.runner_filter:
@@ -63,9 +135,3 @@ class RunnerRegistry(object):
             if runner.check_type == self.runner_filter.framework:
                 self.runners = [runner]
                 return
-
-    @staticmethod
-    def enrich_report_with_guidelines(scan_report, guidelines):
-        for record in scan_report.failed_checks + scan_report.passed_checks + scan_report.skipped_checks:
-            if record.check_id in guidelines:
-                record.set_guideline(guidelines[record.check_id])
@@ -0,0 +1,188 @@
+import json
+import logging
+import os
+import socketserver
+import stat
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from checkov.common.runners.runner_registry import RunnerRegistry, FRAMEWORK_CHOICES
+from checkov.common.util.line_store import line_store
+from checkov.runner_filter import RunnerFilter
+from checkov.version import version
+
+EXIT_CODE_HEADER = 'X-Checkov-Exit-Code'
+
+
+class ScanRequestError(ValueError):
+    """
+    Error thrown when a scan request is invalid
+    """
+
+
+class ScanService(object):
+    """
+    Runs the scans requested to the server. The check registries (and the other module level state, like the parse
+    cache) are loaded once and stay warm between the scans, a new RunnerRegistry is created for each scan.
+    """
+
+    def __init__(self, registry_factory, guidelines=None, external_checks_dir=None):
+        """
+        :param registry_factory: callable creating a RunnerRegistry (with new runners) from a RunnerFilter
+        :param guidelines: guidelines of the checks, fetched once for all the scans
+        :param external_checks_dir: directories of custom checks, loaded for all the scans
+        """
+        self.registry_factory = registry_factory
+        self.guidelines = guidelines or {}
+        self.external_checks_dir = external_checks_dir
+
+    def scan(self, request):
+        """
+        :param request: dict of the scan arguments: directory or files, and optionally framework, check, skip_check,
+                        soft_fail and diff_base, like the command line arguments
+        :return: tuple of the JSON output of the scan reports and the exit code of the scan
+        """
+        if not isinstance(request, dict):
+            raise ScanRequestError('The scan request should be a JSON object')
+        directory = request.get('directory')
+        files = request.get('files')
+        if not directory and not files:
+            raise ScanRequestError('The scan request should have a directory or files')
+        if directory and not isinstance(directory, str):
+            raise ScanRequestError('directory should be a path')
+        if files and (not isinstance(files, list) or not all(isinstance(file, str) for file in files)):
+            raise ScanRequestError('files should be a list of paths')
+        framework = request.get('framework', 'all')
+        if framework not in FRAMEWORK_CHOICES:
+            raise ScanRequestError(f'framework should be one of {", ".join(FRAMEWORK_CHOICES)}')
+        if request.get('check') and request.get('skip_check'):
+            raise ScanRequestError('check and skip_check can not be applied together')
+
+        runner_filter = RunnerFilter(framework=framework, checks=request.get('check'),
+                                     skip_checks=request.get('skip_check'))
+        runner_registry = self.registry_factory(runner_filter)
+        try:
+            scan_reports = runner_registry.run(root_folder=directory, external_checks_dir=self.external_checks_dir,
+                                               files=files, guidelines=self.guidelines,
+                                               diff_base=request.get('diff_base'))
+            return (RunnerRegistry.get_json_output(scan_reports),
+                    RunnerRegistry.get_exit_code(scan_reports, request.get('soft_fail', False)))
+        finally:
+            # the code blocks are in the JSON output, the scanned files aren't needed by the next scans
+            line_store.clear()
+
+
+class ScanRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP API of the scan server:
+        POST /scan - body is a scan request (see ScanService.scan), responds with the report JSON (like --output json)
+                     and the scan's exit code in the X-Checkov-Exit-Code header
+        GET /health - responds with the server's status and checkov's version
+    """
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(404, {'error': f'Unknown path {self.path}'})
+            return
+        self._send_json(200, {'status': 'ok', 'checkov_version': version})
+
+    def do_POST(self):
+        if self.path != '/scan':
+            self._send_json(404, {'error': f'Unknown path {self.path}'})
+            return
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(content_length) or b'{}')
+        except ValueError as e:
+            self._send_json(400, {'error': f'Invalid scan request: {e}'})
+            return
+        try:
+            output, exit_code = self.server.scan_service.scan(request)
+        except ScanRequestError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            logging.error('Failed to run the scan request', exc_info=e)
+            self._send_json(500, {'error': str(e)})
+            return
+        self._send_json(200, output, {EXIT_CODE_HEADER: str(exit_code)})
+
+    def _send_json(self, status, body, headers=None):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logging.debug(f'Scan server: {format % args}')
+
+
+class ScanHTTPServer(HTTPServer):
+    """
+    Scan server on a TCP address. Requests are handled one at a time, as scans share module level state.
+    """
+
+    def __init__(self, server_address, scan_service):
+        super().__init__(server_address, ScanRequestHandler)
+        self.scan_service = scan_service
+
+
+class UnixScanHTTPServer(socketserver.UnixStreamServer):
+    """
+    Scan server on a Unix socket. Requests are handled one at a time, as scans share module level state.
+    """
+
+    def __init__(self, socket_path, scan_service):
+        super().__init__(socket_path, ScanRequestHandler)
+        self.scan_service = scan_service
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+
+def is_unix_socket_address(address):
+    return os.sep in address or address.endswith('.sock')
+
+
+def create_server(address, scan_service):
+    """
+    :param address: path of a Unix socket (containing a path separator or ending with .sock), or [host:]port
+    :param scan_service: ScanService running the scans
+    :return: the scan server, bound to the address
+    """
+    if is_unix_socket_address(address):
+        try:
+            if stat.S_ISSOCK(os.stat(address).st_mode):
+                # a stale socket of a previous server
+                os.remove(address)
+        except FileNotFoundError:
+            pass
+        return UnixScanHTTPServer(address, scan_service)
+
+    host, _, port = address.rpartition(':')
+    try:
+        port = int(port)
+    except ValueError:
+        raise ValueError(f'Invalid serve address {address}, expected [host:]port or a Unix socket path')
+    return ScanHTTPServer((host or 'localhost', port), scan_service)
+
+
+def serve(address, scan_service):
+    """
+    Serve scan requests until interrupted
+    """
+    server = create_server(address, scan_service)
+    logging.info(f'checkov {version} serving scan requests on {address}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,204 @@
+import logging
+import os
+from collections import defaultdict
+
+from termcolor import colored
+
+from checkov.arm.runner import ARM_POSSIBLE_ENDINGS
+from checkov.cloudformation.runner import CF_POSSIBLE_ENDINGS
+from checkov.common.models.consts import SLS_FILE_MASK
+from checkov.common.runners.diff_scope import DiffScope
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.util.file_watcher import create_file_watcher
+from checkov.common.util.line_store import line_store
+from checkov.kubernetes.runner import K8_POSSIBLE_ENDINGS
+
+# Extensions of the files the runners scan, changes to the other files only matter to the serverless files including them
+SCANNED_EXTENSIONS = frozenset(['.tf'] + CF_POSSIBLE_ENDINGS + K8_POSSIBLE_ENDINGS + ARM_POSSIBLE_ENDINGS)
+
+
+class ScanDelta(object):
+    """
+    Failed checks which appeared and disappeared in a framework's report after a re-scan
+    """
+
+    def __init__(self, check_type, new_failed_checks, fixed_checks):
+        self.check_type = check_type
+        self.new_failed_checks = new_failed_checks
+        self.fixed_checks = fixed_checks
+
+    def is_empty(self):
+        return not self.new_failed_checks and not self.fixed_checks
+
+    def print_console(self):
+        print(colored(f"{self.check_type} scan changes:", "blue"))
+        print(colored(f"\nNew failed checks: {len(self.new_failed_checks)}, "
+                      f"Fixed checks: {len(self.fixed_checks)}\n", "cyan"))
+        for record in self.new_failed_checks:
+            print(record)
+        for record in self.fixed_checks:
+            print(colored(f'Fixed: {record.check_id}: "{record.check_name}"', "green"))
+            print(f"\tResource: {record.resource}")
+            print(f"\tFile: {record.file_path}:{record.file_line_range[0]}-{record.file_line_range[1]}\n")
+
+
+class ScanWatcher(object):
+    """
+    Scans a root folder, then re-scans the files which change in it. A re-scan parses and checks only the changed
+    files, with the files they need as context (all the Terraform files of a changed Terraform file's folder, for its
+    variable evaluation, and the serverless files including a changed file with file()), and its report is compared
+    to the previous results of the same files.
+    """
+
+    def __init__(self, root_folder, registry_factory, runner_filter, guidelines=None, external_checks_dir=None):
+        """
+        :param registry_factory: callable creating a RunnerRegistry (with new runners) from a RunnerFilter
+        """
+        self.logger = logging.getLogger(__name__)
+        self.root_folder = root_folder
+        self.registry_factory = registry_factory
+        self.runner_filter = runner_filter
+        self.guidelines = guidelines or {}
+        self.external_checks_dir = external_checks_dir
+        # check type to the absolute path of a scanned file to the failed checks of its entities
+        self._failed_checks = defaultdict(dict)
+        self._sls_files = set()
+
+    def scan(self):
+        """
+        Scan the whole root folder
+        :return: the scan reports
+        """
+        runner_registry = self.registry_factory(self.runner_filter)
+        scan_reports = runner_registry.run(root_folder=self.root_folder, external_checks_dir=self.external_checks_dir,
+                                           guidelines=self.guidelines)
+        self._failed_checks.clear()
+        for report in scan_reports:
+            self._failed_checks[report.check_type] = self._get_failed_checks_by_file(report)
+        self._sls_files = {os.path.abspath(file_path) for file_path in
+                           runner_registry.file_discovery.get_files(names=SLS_FILE_MASK)}
+        return scan_reports
+
+    def rescan(self, changed_files):
+        """
+        Re-scan the changed files
+        :param changed_files: absolute paths of the changed (or deleted) files, None to re-scan the whole root folder
+        :return: list of the ScanDelta of each framework
+        """
+        if changed_files is None:
+            previous_failed_checks = dict(self._failed_checks)
+            scan_reports = self.scan()
+            return [self._get_delta(report.check_type, previous_failed_checks.get(report.check_type, {}),
+                                    self._failed_checks[report.check_type]) for report in scan_reports]
+
+        scope = self.get_scope(changed_files)
+        removed_paths = [file_path for file_path in changed_files if not os.path.exists(file_path)]
+        if not scope and not removed_paths:
+            return []
+        self.logger.debug(f'Re-scanning {len(scope)} files of {self.root_folder}')
+
+        runner_registry = self.registry_factory(self.runner_filter)
+        scan_reports = runner_registry.run(root_folder=self.root_folder, external_checks_dir=self.external_checks_dir,
+                                           guidelines=self.guidelines,
+                                           file_discovery=FileDiscovery.from_files(self.root_folder, scope))
+
+        def is_rescanned(file_path):
+            return file_path in scope or _is_under_any(file_path, removed_paths)
+
+        deltas = []
+        for report in scan_reports:
+            failed_checks = self._failed_checks[report.check_type]
+            previous_failed_checks = dict(failed_checks)
+            for file_path in list(failed_checks):
+                if is_rescanned(file_path):
+                    del failed_checks[file_path]
+            # the records of the files out of the scope (e.g. of a loaded Terraform module) are not complete
+            failed_checks.update({file_path: records for file_path, records in
+                                  self._get_failed_checks_by_file(report).items() if file_path in scope})
+            deltas.append(self._get_delta(report.check_type, previous_failed_checks, failed_checks, is_rescanned))
+        return deltas
+
+    def get_scope(self, changed_files):
+        """
+        :param changed_files: absolute paths of the changed (or deleted) files
+        :return: set of the absolute paths of the files to re-scan
+        """
+        existing_files = {file_path for file_path in changed_files if os.path.isfile(file_path)}
+        scope = {file_path for file_path in existing_files if os.path.splitext(file_path)[1] in SCANNED_EXTENSIONS}
+
+        changed_tf_directories = {os.path.dirname(file_path) for file_path in changed_files if
+                                  file_path.endswith('.tf')}
+        for directory in changed_tf_directories:
+            try:
+                file_names = os.listdir(directory)
+            except OSError:
+                continue
+            scope.update(os.path.join(directory, file_name) for file_name in file_names if
+                         file_name.endswith('.tf') and os.path.isfile(os.path.join(directory, file_name)))
+
+        self._sls_files = {file_path for file_path in self._sls_files if os.path.isfile(file_path)}
+        self._sls_files.update(file_path for file_path in scope if os.path.basename(file_path) in SLS_FILE_MASK)
+        for sls_file in self._sls_files:
+            if sls_file not in scope and DiffScope.includes_any(sls_file, existing_files):
+                scope.add(sls_file)
+        return scope
+
+    def _get_failed_checks_by_file(self, report):
+        failed_checks = defaultdict(list)
+        for record in report.failed_checks:
+            failed_checks[os.path.abspath(os.path.join(self.root_folder, record.file_path.lstrip('/')))].append(record)
+        return dict(failed_checks)
+
+    @staticmethod
+    def _get_delta(check_type, previous_failed_checks, failed_checks, is_compared=None):
+        """
+        :param is_compared: predicate of the files to compare the failed checks of, None to compare all of them
+        """
+        def get_records(failed_checks_by_file):
+            records = {}
+            for file_path, file_records in failed_checks_by_file.items():
+                if is_compared is None or is_compared(file_path):
+                    for record in file_records:
+                        # line numbers are left out, as they move with the edits around an entity
+                        records[(record.check_id, file_path, record.resource)] = record
+            return records
+
+        previous_records = get_records(previous_failed_checks)
+        records = get_records(failed_checks)
+        return ScanDelta(check_type,
+                         [record for key, record in records.items() if key not in previous_records],
+                         [record for key, record in previous_records.items() if key not in records])
+
+
+def _is_under_any(file_path, paths):
+    return any(file_path == path or file_path.startswith(path + os.sep) for path in paths)
+
+
+def watch(scan_watcher, is_quiet=False):
+    """
+    Scan the root folder of the scan watcher and print its reports, then re-scan the files which change and print the
+    new and fixed failed checks, until interrupted
+    """
+    for report in scan_watcher.scan():
+        if not report.is_empty():
+            report.print_console(is_quiet=is_quiet)
+    # the code blocks of the printed records aren't read again, the files are added again when they are re-scanned
+    line_store.clear()
+    file_watcher = create_file_watcher(scan_watcher.root_folder)
+    print(colored(f"Watching {scan_watcher.root_folder} for changes...", "blue"))
+    try:
+        while True:
+            changed_files = file_watcher.wait_for_changes()
+            if changed_files is not None and not changed_files:
+                continue
+            deltas = scan_watcher.rescan(changed_files)
+            for delta in deltas:
+                if not delta.is_empty():
+                    delta.print_console()
+            if deltas and all(delta.is_empty() for delta in deltas):
+                print(colored("No new or fixed failed checks", "cyan"))
+            line_store.clear()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        file_watcher.close()
@@ -0,0 +1,215 @@
+import hashlib
+import logging
+import os
+import pickle
+import sys
+
+from checkov.version import version
+
+CHECK_RESULT_CACHE_DIR_ENV = os.getenv('CKV_CHECK_RESULT_CACHE_DIR', os.path.join(
+    os.getenv('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'checkov', 'checks'))
+CHECK_RESULT_CACHE_MAX_SIZE_MB_ENV = os.getenv('CKV_CHECK_RESULT_CACHE_MAX_SIZE_MB', '128')
+
+CACHE_FILE_NAME = 'check_results.pickle'
+
+# Once the cache outgrows its max size, the least recently used entries are evicted down to this ratio of it
+EVICTION_TARGET_RATIO = 0.8
+
+# Keys of the line numbers added to the parsed entities, they don't take part in the entity fingerprint
+LINE_KEYS = frozenset(['__startline__', '__endline__'])
+
+
+class CheckResultCache(object):
+    """
+    On-disk cache of check results, keyed by the fingerprint of the entity configuration (its normalised content,
+    without the line numbers), the entity type, the check id and the hash of the check's source code. All the cached
+    results are loaded on the first lookup of a run and saved back at the end of the run, bounded in size by evicting
+    the results which were used the least recently. The whole cache is dropped when checkov's version changes.
+    """
+
+    def __init__(self, cache_dir=CHECK_RESULT_CACHE_DIR_ENV,
+                 max_size=int(CHECK_RESULT_CACHE_MAX_SIZE_MB_ENV) * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.enabled = False
+        self._entries = None
+        self._run = 0
+        self._modified = False
+        self._source_hashes = {}
+        self._last_configuration = None
+        self._last_fingerprint = None
+
+    def get_or_scan(self, check, entity_configuration, entity_type):
+        """
+        :return: the result of check.scan_entity_conf(entity_configuration, entity_type), from the cache if it is
+                 there
+        """
+        if not self.enabled:
+            return check.scan_entity_conf(entity_configuration, entity_type)
+        source_hash = self._get_source_hash(type(check))
+        if source_hash is None:
+            return check.scan_entity_conf(entity_configuration, entity_type)
+
+        key = (self._get_fingerprint(entity_configuration), entity_type, check.id, source_hash)
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is not None:
+            entry[1] = self._run
+            self._modified = True
+            return entry[0]
+
+        result = check.scan_entity_conf(entity_configuration, entity_type)
+        entries[key] = [result, self._run]
+        self._modified = True
+        return result
+
+    def get_or_scan_batch(self, check, confs):
+        """
+        :param confs: ConfColumns of the configurations of entities of the same type
+        :return: the results of check.scan_entity_batch(confs), only the configurations whose results aren't in the
+                 cache are scanned
+        """
+        if not self.enabled:
+            return check.scan_entity_batch(confs)
+        source_hash = self._get_source_hash(type(check))
+        if source_hash is None:
+            return check.scan_entity_batch(confs)
+
+        keys = [(self._get_fingerprint(conf), confs.entity_type, check.id, source_hash) for conf in confs]
+        entries = self._load()
+        results = [None] * len(keys)
+        missing_indexes = []
+        for index, key in enumerate(keys):
+            entry = entries.get(key)
+            if entry is None:
+                missing_indexes.append(index)
+            else:
+                entry[1] = self._run
+                results[index] = entry[0]
+        if missing_indexes:
+            missing_confs = confs if len(missing_indexes) == len(keys) else confs.select(missing_indexes)
+            for index, result in zip(missing_indexes, check.scan_entity_batch(missing_confs)):
+                results[index] = result
+                entries[keys[index]] = [result, self._run]
+        self._modified = True
+        return results
+
+    def save(self):
+        """
+        Write the results of the run to the cache
+        """
+        if not self._modified:
+            return
+        self._modified = False
+        try:
+            data = self._dump()
+            if len(data) > self.max_size:
+                self._evict(len(data))
+                data = self._dump()
+        except Exception as e:
+            self.logger.debug('Check results can not be cached', exc_info=e)
+            return
+
+        cache_path = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+        tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.debug(f'Failed to write the check result cache {cache_path}', exc_info=e)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def clear(self):
+        self._entries = {}
+        self._modified = False
+        try:
+            os.remove(os.path.join(self.cache_dir, CACHE_FILE_NAME))
+        except OSError:
+            pass
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {}
+            cache_path = os.path.join(self.cache_dir, CACHE_FILE_NAME)
+            try:
+                with open(cache_path, 'rb') as fp:
+                    cache = pickle.load(fp)
+                if cache['version'] == version:
+                    self._entries = cache['entries']
+                    self._run = cache['run'] + 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.debug(f'Dropping unreadable check result cache {cache_path}', exc_info=e)
+        return self._entries
+
+    def _dump(self):
+        return pickle.dumps({'version': version, 'run': self._run, 'entries': self._entries},
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _evict(self, size):
+        # the entries are evicted by the last run they were used in, their size is estimated as the average size
+        target_entries = int(len(self._entries) * self.max_size * EVICTION_TARGET_RATIO / size)
+        entries = sorted(self._entries.items(), key=lambda item: item[1][1], reverse=True)
+        self._entries = dict(entries[:target_entries])
+
+    def _get_source_hash(self, check_class):
+        """
+        :return: hash of the source code of the check's class and its base classes, None if there is no source code
+        """
+        if check_class not in self._source_hashes:
+            source_hash = hashlib.sha256()
+            for cls in check_class.__mro__:
+                if cls is object:
+                    continue
+                module_file = getattr(sys.modules.get(cls.__module__), '__file__', None)
+                try:
+                    with open(module_file, 'rb') as fp:
+                        source_hash.update(fp.read())
+                except (OSError, TypeError):
+                    if cls is check_class:
+                        source_hash = None
+                        break
+            self._source_hashes[check_class] = source_hash.hexdigest() if source_hash else None
+        return self._source_hashes[check_class]
+
+    def _get_fingerprint(self, entity_configuration):
+        # the checks of an entity run one after the other, so its fingerprint is computed once
+        if entity_configuration is not self._last_configuration:
+            tokens = []
+            _serialize(entity_configuration, tokens)
+            self._last_fingerprint = hashlib.sha256('\n'.join(tokens).encode('utf-8', 'surrogatepass')).hexdigest()
+            self._last_configuration = entity_configuration
+        return self._last_fingerprint
+
+
+def _serialize(obj, tokens):
+    """
+    Serialize an entity configuration, the parsed node classes are serialized like their base types (dict, list, str)
+    """
+    if isinstance(obj, dict):
+        tokens.append('{')
+        for key, value in obj.items():
+            if key in LINE_KEYS:
+                continue
+            _serialize(key, tokens)
+            _serialize(value, tokens)
+        tokens.append('}')
+    elif isinstance(obj, (list, tuple)):
+        tokens.append('[' if isinstance(obj, list) else '(')
+        for value in obj:
+            _serialize(value, tokens)
+        tokens.append(']')
+    elif isinstance(obj, str):
+        tokens.append(str.__repr__(obj))
+    else:
+        tokens.append(f'{type(obj).__name__}:{obj!r}')
+
+
+check_result_cache = CheckResultCache()
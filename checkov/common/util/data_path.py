@@ -0,0 +1,142 @@
+"""
+Direct access to the values of nested dicts and lists by their path, for the parsing and evaluation code which used
+dpath for it. A path is a tuple of keys and list indexes; string paths (dpath's 'a/b/0' form) are split once and
+cached. Unlike dpath, the keys aren't globs and the paths aren't searched for in the whole object, so a lookup is
+a walk down the path.
+"""
+from collections.abc import MutableMapping, MutableSequence
+from functools import lru_cache
+
+SEPARATOR = '/'
+CONTAINER_TYPES = (MutableMapping, MutableSequence)
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path):
+    return tuple(path.lstrip(SEPARATOR).split(SEPARATOR))
+
+
+def compile_path(path):
+    """
+    :param path: tuple or list of keys, or a string of the keys separated by '/'
+    :return: tuple of the path's keys
+    """
+    if isinstance(path, tuple):
+        return path
+    if isinstance(path, str):
+        return _split_path(path)
+    return tuple(path)
+
+
+def format_path(path):
+    """
+    :return: string of the path's keys separated by '/', like dpath's paths
+    """
+    return SEPARATOR.join(map(str, path))
+
+
+def _get_child(obj, key):
+    if isinstance(obj, MutableMapping):
+        return obj[key]
+    if isinstance(obj, MutableSequence):
+        return obj[int(key)]
+    raise KeyError(key)
+
+
+def get_path(obj, path, default=None):
+    """
+    :return: the value at the path of obj, default if there is none
+    """
+    try:
+        for key in compile_path(path):
+            obj = _get_child(obj, key)
+    except (KeyError, IndexError, ValueError, TypeError):
+        return default
+    return obj
+
+
+def set_path(obj, path, value):
+    """
+    Replace the existing value at the path of obj, like dpath.set
+    :return: whether the path exists, and so the value was set
+    """
+    path = compile_path(path)
+    parent = get_path(obj, path[:-1])
+    key = path[-1]
+    if isinstance(parent, MutableMapping):
+        if key not in parent:
+            return False
+        parent[key] = value
+        return True
+    if isinstance(parent, MutableSequence):
+        try:
+            parent[int(key)] = value
+        except (IndexError, ValueError):
+            return False
+        return True
+    return False
+
+
+def new_path(obj, path, value):
+    """
+    Set the value at the path of obj, creating the missing dicts on the way, like dpath.new
+    """
+    path = compile_path(path)
+    for key in path[:-1]:
+        if isinstance(obj, MutableMapping):
+            child = obj.get(key)
+            if not isinstance(child, CONTAINER_TYPES):
+                child = obj[key] = {}
+            obj = child
+        else:
+            obj = obj[int(key)]
+    if isinstance(obj, MutableSequence):
+        obj[int(path[-1])] = value
+    else:
+        obj[path[-1]] = value
+
+
+def _get_children(obj):
+    if isinstance(obj, MutableMapping):
+        # dpath skips the special keys starting with '+'
+        return ((key, value) for key, value in obj.items() if not (isinstance(key, str) and key[:1] == '+'))
+    return enumerate(obj)
+
+
+def walk_nodes(obj):
+    """
+    Walk the values of obj at every depth, depth first, in the same order and with the same paths as dpath's search
+    :return: generator of (path, container, key, value) of the values
+    """
+    if not isinstance(obj, CONTAINER_TYPES):
+        return
+    stack = [((), obj, _get_children(obj))]
+    while stack:
+        path, container, children = stack[-1]
+        for key, value in children:
+            yield path + (key,), container, key, value
+            if isinstance(value, CONTAINER_TYPES):
+                stack.append((path + (key,), value, _get_children(value)))
+                break
+        else:
+            stack.pop()
+
+
+def walk_leaves(obj):
+    """
+    Walk the leaves (the values which aren't dicts or lists) of obj depth first, in the same order and with the same
+    paths as dpath's '**' search. The leaves can be replaced in their container while walking.
+    :return: generator of (path, container, key, value) of the leaves
+    """
+    if not isinstance(obj, CONTAINER_TYPES):
+        return
+    stack = [((), obj, _get_children(obj))]
+    while stack:
+        path, container, children = stack[-1]
+        for key, value in children:
+            if isinstance(value, CONTAINER_TYPES):
+                stack.append((path + (key,), value, _get_children(value)))
+                break
+            yield path + (key,), container, key, value
+        else:
+            stack.pop()
@@ -4,15 +4,7 @@ import re
 
 from tabulate import tabulate
 
-from checkov.arm.registry import arm_registry
-from checkov.cloudformation.checks.resource.registry import cfn_registry as cfn_registry
-from checkov.common.checks.base_check_registry import BaseCheckRegistry
-from checkov.kubernetes.registry import registry as k8_registry
-from checkov.serverless.registry import sls_registry
-from checkov.terraform.checks.data.registry import data_registry
-from checkov.terraform.checks.module.registry import module_registry
-from checkov.terraform.checks.provider.registry import provider_registry
-from checkov.terraform.checks.resource.registry import resource_registry
+from checkov.common.checks.check_manifest import get_check_manifest, is_wildcard
 
 ID_PARTS_PATTERN = re.compile(r'(\D*)(\d*)')
 
@@ -39,24 +31,26 @@ def print_checks(framework="all"):
 def get_checks(framework="all"):
     printable_checks_list = []
 
-    def add_from_repository(registry: BaseCheckRegistry, checked_type: str, iac: str):
+    def add_from_manifest(checks_manifest_key: str, checked_type: str, iac: str):
+        # the checks are listed from the manifest, without loading them
         nonlocal printable_checks_list
-        for entity, check in registry.all_checks():
-            printable_checks_list.append([check.id, checked_type, entity, check.name, iac])
+        for check_id, check_name, _, supported_entities in get_check_manifest(checks_manifest_key).entries:
+            for entity in sorted(supported_entities, key=is_wildcard):
+                printable_checks_list.append([check_id, checked_type, entity, check_name, iac])
 
     if framework == "terraform" or framework == "all":
-        add_from_repository(resource_registry, "resource", "Terraform")
-        add_from_repository(data_registry, "data", "Terraform")
-        add_from_repository(provider_registry, "provider", "Terraform")
-        add_from_repository(module_registry, "module", "Terraform")
+        add_from_manifest('terraform_resource', "resource", "Terraform")
+        add_from_manifest('terraform_data', "data", "Terraform")
+        add_from_manifest('terraform_provider', "provider", "Terraform")
+        add_from_manifest('terraform_module', "module", "Terraform")
     if framework == "cloudformation" or framework == "all":
-        add_from_repository(cfn_registry, "resource", "Cloudformation")
+        add_from_manifest('cloudformation', "resource", "Cloudformation")
     if framework == "kubernetes" or framework == "all":
-        add_from_repository(k8_registry, "PodSecurityPolicy", "Kubernetes")
+        add_from_manifest('kubernetes', "PodSecurityPolicy", "Kubernetes")
     if framework == "serverless" or framework == "all":
-        add_from_repository(sls_registry, "resource", "serverless")
+        add_from_manifest('serverless_function', "resource", "serverless")
     if framework == "arm" or framework == "all":
-        add_from_repository(arm_registry, "resource", "arm")
+        add_from_manifest('arm', "resource", "arm")
     return sorted(printable_checks_list, key=get_compare_key)
 
 
@@ -0,0 +1,124 @@
+import os
+from contextlib import contextmanager
+
+import yaml
+from yaml.composer import ComposerError
+
+try:
+    from yaml import CSafeLoader as ComposeLoader
+except ImportError:
+    from yaml import SafeLoader as ComposeLoader
+
+RESULT = 'result'
+ERROR = 'error'
+
+
+class Composition(object):
+    """
+    YAML node graphs of the documents of a file, composed with the (safe) resolver every parser uses
+    """
+
+    def __init__(self, nodes, error=None):
+        """
+        :param nodes: node of each document composed before the error (all the documents if there is no error)
+        :param error: YAMLError raised while composing the file, if any
+        """
+        self.nodes = nodes
+        self.error = error
+
+    def get_nodes(self):
+        """
+        :return: nodes of all the documents, like yaml.compose_all
+        """
+        if self.error:
+            raise self.error
+        return self.nodes
+
+    def get_single_node(self):
+        """
+        :return: node of the single document of the file (None for an empty file), like yaml.compose
+        """
+        if len(self.nodes) > 1:
+            raise ComposerError("expected a single document in the stream", self.nodes[0].start_mark,
+                                "but found another document", self.nodes[1].start_mark)
+        if self.error:
+            raise self.error
+        return self.nodes[0] if self.nodes else None
+
+
+class DocumentStore(object):
+    """
+    Run-scoped store of the YAML and JSON files read by the CloudFormation, Kubernetes, Serverless and ARM parsers.
+    Within a run scope, each file is read and composed into a YAML node graph (with the nodes' line marks) once,
+    and every parser constructs its own representation from the shared nodes. Outside of a run scope nothing is kept.
+    """
+
+    def __init__(self):
+        self._scopes = 0
+        self._contents = {}
+        self._compositions = {}
+
+    @contextmanager
+    def run_scope(self):
+        """
+        Keep the read and composed files until the (outermost) scope exits
+        """
+        self._scopes += 1
+        try:
+            yield self
+        finally:
+            self._scopes -= 1
+            if not self._scopes:
+                self.clear()
+
+    def clear(self):
+        self._contents.clear()
+        self._compositions.clear()
+
+    def read(self, filename):
+        """
+        :return: tuple of the file's content and its lines, as a list of (line number, line)
+        """
+        return self._get_or_compute(self._contents, filename, self._read)
+
+    def compose(self, filename):
+        """
+        :return: Composition of the file's content
+        """
+        return self._get_or_compute(self._compositions, filename, self._compose)
+
+    def _get_or_compute(self, store, filename, compute):
+        if not self._scopes:
+            return compute(filename)
+        key = os.path.abspath(filename)
+        if key not in store:
+            try:
+                store[key] = (RESULT, compute(filename))
+            except Exception as e:
+                store[key] = (ERROR, e)
+        outcome, value = store[key]
+        if outcome == ERROR:
+            raise value
+        return value
+
+    @staticmethod
+    def _read(filename):
+        with open(filename) as fp:
+            content = fp.read()
+            fp.seek(0)
+            file_lines = [(ind + 1, line) for (ind, line) in
+                          list(enumerate(fp.readlines()))]
+        return content, file_lines
+
+    def _compose(self, filename):
+        content, _ = self.read(filename)
+        nodes = []
+        try:
+            for node in yaml.compose_all(content, Loader=ComposeLoader):
+                nodes.append(node)
+        except yaml.YAMLError as e:
+            return Composition(nodes, e)
+        return Composition(nodes)
+
+
+document_store = DocumentStore()
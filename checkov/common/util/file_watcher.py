@@ -0,0 +1,180 @@
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+
+from checkov.common.runners.base_runner import ignored_directories
+
+# inotify event masks, see inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+# Changes made within this time of each other (e.g. an editor writing a file and its backup) are reported together
+DEBOUNCE_SECONDS = 0.1
+POLL_INTERVAL_SECONDS = 1.0
+
+
+def _is_watched_directory(name):
+    return name not in ignored_directories and not name.startswith('.')
+
+
+class InotifyFileWatcher(object):
+    """
+    Watches the files of a directory tree with Linux's inotify (through libc, so there is no dependency to install).
+    The ignored directories and the hidden directories (e.g. .git) are not watched.
+    """
+
+    def __init__(self, root_folder):
+        self.logger = logging.getLogger(__name__)
+        self.root_folder = os.path.abspath(root_folder)
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self._watches = {}
+        self._watch_tree(self.root_folder)
+
+    def _watch_tree(self, directory, created_files=None):
+        """
+        :param created_files: set the files found under the directory are added to, when it was just created
+        """
+        wd = self._add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            self.logger.debug(f'Failed to watch {directory}: {os.strerror(ctypes.get_errno())}')
+            return
+        self._watches[wd] = directory
+        try:
+            with os.scandir(directory) as entries:
+                entries = list(entries)
+        except OSError:
+            return
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if _is_watched_directory(entry.name):
+                    self._watch_tree(entry.path, created_files)
+            elif created_files is not None:
+                created_files.add(entry.path)
+
+    def wait_for_changes(self, timeout=None):
+        """
+        Wait for files to change
+        :param timeout: seconds to wait for, None to wait until something changes
+        :return: set of the paths of the changed (modified, created, moved or deleted) files, None if the changes
+                 were lost (e.g. the event queue overflowed) and everything should be considered changed
+        """
+        changed_files = set()
+        overflowed = False
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        while ready:
+            overflowed |= self._read_events(changed_files)
+            ready, _, _ = select.select([self._fd], [], [], DEBOUNCE_SECONDS)
+        return None if overflowed else changed_files
+
+    def _read_events(self, changed_files):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+        overflowed = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + name_length].rstrip(b'\0'))
+            offset += name_length
+
+            if mask & IN_Q_OVERFLOW:
+                overflowed = True
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._watches[wd]
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF) or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and _is_watched_directory(name):
+                    self._watch_tree(path, changed_files)
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    # the files of a removed directory are matched by their directory's path
+                    changed_files.add(path)
+            else:
+                changed_files.add(path)
+        return overflowed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollingFileWatcher(object):
+    """
+    Watches the files of a directory tree by comparing their modification times and sizes periodically, for the
+    platforms without inotify
+    """
+
+    def __init__(self, root_folder, interval=POLL_INTERVAL_SECONDS):
+        self.root_folder = os.path.abspath(root_folder)
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for directory, directory_names, file_names in os.walk(self.root_folder):
+            directory_names[:] = [name for name in directory_names if _is_watched_directory(name)]
+            for file_name in file_names:
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def wait_for_changes(self, timeout=None):
+        """
+        Wait for files to change, see InotifyFileWatcher.wait_for_changes
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+            snapshot = self._take_snapshot()
+            changed_files = {path for path in snapshot.keys() | self._snapshot.keys() if
+                             snapshot.get(path) != self._snapshot.get(path)}
+            self._snapshot = snapshot
+            if changed_files or (deadline is not None and time.monotonic() >= deadline):
+                return changed_files
+
+    def close(self):
+        pass
+
+
+def create_file_watcher(root_folder):
+    """
+    :return: an inotify file watcher of the root folder, or a polling one if inotify is not available
+    """
+    try:
+        return InotifyFileWatcher(root_folder)
+    except (OSError, AttributeError, TypeError) as e:
+        logging.getLogger(__name__).debug('inotify is not available, polling for file changes', exc_info=e)
+        return PollingFileWatcher(root_folder)
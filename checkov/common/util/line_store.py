@@ -0,0 +1,277 @@
+"""
+Store of the lines of the scanned files, for the code blocks of the records. A record's code block is a CodeBlock,
+a reference to a range of its file's lines, instead of a copy of the lines kept for the whole run: the lines are only
+read back from the file (memory mapped, at the byte offsets of its lines) when an output prints or serializes them.
+"""
+import locale
+import logging
+import mmap
+import os
+import re
+import weakref
+from array import array
+from collections.abc import Sequence
+
+# Python's universal newlines also end a line at a carriage return which isn't followed by a line feed
+LONE_CARRIAGE_RETURN = re.compile(rb'\r(?!\n)')
+# Number of the last read code blocks whose lines are kept
+MAX_CACHED_BLOCKS = 256
+
+
+def read_file_lines(filename):
+    """
+    :return: FileLines of the file's lines, as a list of (line number, line)
+    """
+    with open(filename) as fp:
+        file_lines = [(ind + 1, line) for (ind, line) in enumerate(fp.readlines())]
+    return line_store.bind(filename, file_lines)
+
+
+def get_code_block(file_lines, start, stop):
+    """
+    :return: the code block of the lines file_lines[start:stop], a CodeBlock if the lines are bound to their file
+    """
+    if isinstance(file_lines, FileLines):
+        return CodeBlock(file_lines.file_id, start, stop)
+    return file_lines[start:stop]
+
+
+class FileLines(list):
+    """
+    Lines of a file, as a list of (line number, line), bound to the file in the line store so code blocks can
+    reference them. Pickled as a plain list, as the file id only means something in the process.
+    """
+
+    def __init__(self, file_lines, file_id):
+        super().__init__(file_lines)
+        self.file_id = file_id
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+class CodeBlock(Sequence):
+    """
+    Lines file_lines[start:stop] of a file in the line store, read from the file when accessed
+    """
+    __slots__ = ('file_id', 'start', 'stop')
+
+    def __init__(self, file_id, start, stop):
+        self.file_id = file_id
+        self.start = start
+        self.stop = stop
+
+    def get_lines(self):
+        """
+        :return: list of the (line number, line) of the block
+        """
+        return line_store.get_lines(self.file_id, self.start, self.stop)
+
+    def __len__(self):
+        return len(range(*slice(self.start, self.stop).indices(line_store.get_line_count(self.file_id))))
+
+    def __getitem__(self, index):
+        return self.get_lines()[index]
+
+    def __iter__(self):
+        return iter(self.get_lines())
+
+    def __eq__(self, other):
+        if isinstance(other, CodeBlock):
+            return (self.file_id, self.start, self.stop) == (other.file_id, other.start, other.stop)
+        if isinstance(other, list):
+            return self.get_lines() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'CodeBlock({self.file_id}, {self.start}, {self.stop})'
+
+
+class _StoredFile(object):
+
+    def __init__(self, path, stat, line_count):
+        self.path = path
+        # (size, modification time) of the file when its lines were read
+        self.stat = stat
+        self.line_count = line_count
+        # weak reference to the FileLines of the lines read, used if the file changed since they were read
+        self.file_lines_ref = None
+        # byte offset of the start of each line, and of the end of the file, once indexed
+        self.offsets = None
+        # lines kept in memory, for the files whose lines can't be read back at their offsets
+        self.lines = None
+
+
+class LineStore(object):
+    """
+    Files whose lines are referenced by code blocks. A file is indexed (the byte offsets of its lines found in its
+    memory map) on the first read of its lines, and the map of the last read file is kept open for the next reads,
+    which usually are of the same file, as records are printed in the order they were scanned in.
+    The store is cleared once a run's outputs are produced by the long running modes (--serve and --watch); the code
+    blocks of the cleared files are then empty.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # file id to _StoredFile, the ids aren't reused once the store is cleared
+        self._files = {}
+        self._next_file_id = 0
+        self._file_ids = {}
+        self._encoding = None
+        self._mapped_file_id = None
+        self._mapped_fp = None
+        self._map = None
+        # the last read blocks, as the checks' records of a resource are usually printed close to each other. Like
+        # the lines the records used to hold, the lines of a block are shared by the records of the resource.
+        self._blocks = {}
+
+    def bind(self, filename, file_lines):
+        """
+        :param file_lines: lines of the file, as read by open(filename).readlines(), as a list of (line number, line)
+        :return: FileLines of the lines, None if there are none (the file couldn't be parsed)
+        """
+        if file_lines is None or isinstance(file_lines, FileLines):
+            return file_lines
+        file_id = self.add_file(filename, len(file_lines))
+        file_lines = FileLines(file_lines, file_id)
+        self._files[file_id].file_lines_ref = weakref.ref(file_lines)
+        return file_lines
+
+    def add_file(self, filename, line_count):
+        """
+        :return: id of the file, the same as when it was last added if it hasn't changed since
+        """
+        path = os.path.abspath(filename)
+        try:
+            stat = os.stat(path)
+            stat = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            stat = None
+        file_id = self._file_ids.get(path)
+        if file_id is not None:
+            stored_file = self._files[file_id]
+            if stored_file.stat == stat and stored_file.line_count == line_count:
+                return file_id
+        file_id = self._next_file_id
+        self._next_file_id += 1
+        self._files[file_id] = _StoredFile(path, stat, line_count)
+        self._file_ids[path] = file_id
+        return file_id
+
+    def get_line_count(self, file_id):
+        stored_file = self._files.get(file_id)
+        return stored_file.line_count if stored_file else 0
+
+    def get_lines(self, file_id, start, stop):
+        """
+        :return: the file's lines[start:stop], as a list of (line number, line)
+        """
+        stored_file = self._files.get(file_id)
+        if stored_file is None:
+            # the store was cleared since the block was read
+            return []
+        if stored_file.offsets is None and stored_file.lines is None:
+            self._index(stored_file)
+        if stored_file.lines is not None:
+            return stored_file.lines[start:stop]
+        block = (file_id, start, stop)
+        lines = self._blocks.get(block)
+        if lines is not None:
+            return lines
+        line_indexes = range(*slice(start, stop).indices(stored_file.line_count))
+        if not line_indexes:
+            return []
+        offsets = stored_file.offsets
+        content = self._get_map(file_id)[offsets[line_indexes.start]:offsets[line_indexes.stop]]
+        content = content.decode(self._get_encoding()).replace('\r\n', '\n')
+        # split at the line feeds only, like readlines (unlike splitlines)
+        line_contents = content.split('\n')
+        lines = [(line_num, line_content + '\n') for line_num, line_content in
+                 enumerate(line_contents[:-1], start=line_indexes.start + 1)]
+        if line_contents[-1]:
+            lines.append((line_indexes.stop, line_contents[-1]))
+        if len(self._blocks) >= MAX_CACHED_BLOCKS:
+            self._blocks.clear()
+        self._blocks[block] = lines
+        return lines
+
+    def __len__(self):
+        return len(self._files)
+
+    def clear(self):
+        self._close_map()
+        self._blocks.clear()
+        self._files = {}
+        self._file_ids = {}
+
+    def _get_encoding(self):
+        if self._encoding is None:
+            # the encoding open() reads the files with
+            self._encoding = locale.getpreferredencoding(False)
+        return self._encoding
+
+    def _index(self, stored_file):
+        offsets = array('q', [0])
+        with open(stored_file.path, 'rb') as fp:
+            stat = os.fstat(fp.fileno())
+            if (stat.st_size, stat.st_mtime_ns) != stored_file.stat:
+                # the file changed since its lines were read, they can't be read back from it
+                self._keep_read_lines(stored_file)
+                return
+            if stat.st_size:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+                    if LONE_CARRIAGE_RETURN.search(file_map) or not self._is_line_feed_compatible():
+                        offsets = None
+                    else:
+                        position = file_map.find(b'\n')
+                        while position != -1:
+                            offsets.append(position + 1)
+                            position = file_map.find(b'\n', position + 1)
+                        if offsets[-1] != stat.st_size:
+                            offsets.append(stat.st_size)
+        if offsets is None or len(offsets) - 1 != stored_file.line_count:
+            # the file's lines can't be found at line feeds, or the file changed since it was read
+            with open(stored_file.path) as fp:
+                stored_file.lines = [(ind + 1, line) for (ind, line) in enumerate(fp.readlines())]
+        else:
+            stored_file.offsets = offsets
+
+    def _keep_read_lines(self, stored_file):
+        """
+        Keep the lines of a file which changed since they were read in memory: the lines read if they are still
+        referenced, else its current lines
+        """
+        file_lines = stored_file.file_lines_ref() if stored_file.file_lines_ref else None
+        if file_lines is not None:
+            stored_file.lines = list(file_lines)
+            return
+        self.logger.warning(f'{stored_file.path} changed since it was scanned, its code blocks are of its current '
+                            f'content')
+        try:
+            with open(stored_file.path) as fp:
+                stored_file.lines = [(ind + 1, line) for (ind, line) in enumerate(fp.readlines())]
+        except (OSError, UnicodeDecodeError):
+            stored_file.lines = []
+
+    def _is_line_feed_compatible(self):
+        encoding = self._get_encoding()
+        return '\n'.encode(encoding) == b'\n' and '\r'.encode(encoding) == b'\r'
+
+    def _get_map(self, file_id):
+        if self._mapped_file_id != file_id:
+            self._close_map()
+            self._mapped_fp = open(self._files[file_id].path, 'rb')
+            self._map = mmap.mmap(self._mapped_fp.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_file_id = file_id
+        return self._map
+
+    def _close_map(self):
+        if self._map is not None:
+            self._map.close()
+            self._mapped_fp.close()
+        self._mapped_file_id = self._mapped_fp = self._map = None
+
+
+line_store = LineStore()
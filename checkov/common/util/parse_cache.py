@@ -0,0 +1,162 @@
+import functools
+import hashlib
+import logging
+import os
+import pickle
+
+from checkov.version import version
+
+PARSE_CACHE_DIR_ENV = os.getenv('CKV_PARSE_CACHE_DIR', os.path.join(
+    os.getenv('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'checkov', 'parse'))
+PARSE_CACHE_MAX_SIZE_MB_ENV = os.getenv('CKV_PARSE_CACHE_MAX_SIZE_MB', '512')
+
+# Once the cache outgrows its max size, the least recently used entries are evicted down to this ratio of it
+EVICTION_TARGET_RATIO = 0.8
+
+RESULT = 'result'
+ERROR = 'error'
+
+
+class ParseCache(object):
+    """
+    On-disk cache of parsed files, keyed by the file content hash, the parser and the parser's version.
+    Entries are pickled parse results (definitions and raw file lines), and the cache is bounded in size by
+    evicting the least recently used entries.
+    """
+
+    def __init__(self, cache_dir=PARSE_CACHE_DIR_ENV, max_size=int(PARSE_CACHE_MAX_SIZE_MB_ENV) * 1024 * 1024):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.enabled = True
+        self._size = None
+
+    def cached(self, parser_id, parser_version=''):
+        """
+        Decorate a function parsing a file (given by its path) so its results are served from the cache
+        :param parser_id: unique name of the parser, usually its module name
+        :param parser_version: version of the underlying parsing library
+        """
+        def decorator(parse_func):
+            @functools.wraps(parse_func)
+            def wrapper(filename):
+                return self.get_or_parse(filename, f'{parser_id}:{parser_version}', parse_func)
+
+            return wrapper
+
+        return decorator
+
+    def get_or_parse(self, filename, parser_id, parse_func):
+        if not self.enabled:
+            return parse_func(filename)
+        try:
+            with open(filename, 'rb') as fp:
+                content = fp.read()
+        except OSError:
+            # let the parser handle (and report) unreadable files
+            return parse_func(filename)
+
+        key = hashlib.sha256(f'{version}:{parser_id}:'.encode() + content).hexdigest()
+        entry = self._get(key)
+        if entry:
+            outcome, value = entry
+            if outcome == ERROR:
+                raise value
+            return value
+
+        try:
+            value = parse_func(filename)
+        except Exception as e:
+            self._put(key, (ERROR, e))
+            raise
+        self._put(key, (RESULT, value))
+        return value
+
+    def clear(self):
+        for entry_path, _, _ in self._entries():
+            self._remove(entry_path)
+        self._size = 0
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _get(self, key):
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'rb') as fp:
+                entry = pickle.load(fp)
+            # the modification time is the recency used for LRU eviction
+            os.utime(entry_path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f'Dropping unreadable parse cache entry {entry_path}', exc_info=e)
+            self._remove(entry_path)
+            return None
+
+    def _put(self, key, entry):
+        try:
+            data = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+            # make sure the entry can also be loaded back (some exceptions can't be unpickled)
+            pickle.loads(data)
+        except Exception as e:
+            self.logger.debug('Parse result can not be cached', exc_info=e)
+            return
+
+        entry_path = self._entry_path(key)
+        tmp_path = f'{entry_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            with open(tmp_path, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            self.logger.debug(f'Failed to write parse cache entry {entry_path}', exc_info=e)
+            self._remove(tmp_path)
+            return
+
+        if self._size is None:
+            self._size = sum(size for _, _, size in self._entries())
+        else:
+            self._size += len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        self._size = sum(size for _, _, size in entries)
+        target_size = self.max_size * EVICTION_TARGET_RATIO
+        for entry_path, _, size in entries:
+            if self._size <= target_size:
+                break
+            self._remove(entry_path)
+            self._size -= size
+
+    def _entries(self):
+        """
+        :return: list of (entry path, last access time, size) of all the cache entries
+        """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for bucket in os.scandir(self.cache_dir):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, stat.st_mtime, stat.st_size))
+        return entries
+
+    @staticmethod
+    def _remove(entry_path):
+        try:
+            os.remove(entry_path)
+        except OSError:
+            pass
+
+
+parse_cache = ParseCache()
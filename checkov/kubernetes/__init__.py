@@ -1 +0,0 @@
-from checkov.kubernetes.checks import *
\ No newline at end of file
@@ -1,21 +1,30 @@
 import yaml
+from yaml import MappingNode, SequenceNode
 from yaml.loader import SafeLoader
 
+from checkov.common.util.document_store import document_store
+from checkov.common.util.parse_cache import parse_cache
+
+
 def loads(filename):
     """
     Load the given YAML string
     """
-    template = None
-    template_temp = None
     with open(filename, 'r') as fp:
         content = fp.read()
 
+    return _loads_content(content)
+
+
+def _loads_content(content):
+    template = None
+    template_temp = None
 
-        content = "[" + content + "]"
-        content = content.replace('}{', '},{')
-        content = content.replace('}\n{', '},\n{')
+    content = "[" + content + "]"
+    content = content.replace('}{', '},{')
+    content = content.replace('}\n{', '},\n{')
 
-        template_temp = list(yaml.load_all(content, Loader=SafeLineLoader))
+    template_temp = list(yaml.load_all(content, Loader=SafeLineLoader))
 
     # Convert an empty file to an empty dict
     if template_temp is None:
@@ -26,19 +35,33 @@ def loads(filename):
     return template
 
 
+def _get_json_node(composition, content):
+    """
+    :return: composed node of the file's content if it is a single JSON object or array, which is constructed the
+             same as the only item of the file's content wrapped in a list. None if the content has to be wrapped.
+    """
+    if composition.error or len(composition.nodes) != 1 or '}{' in content or '}\n{' in content:
+        return None
+    node = composition.nodes[0]
+    if not isinstance(node, (MappingNode, SequenceNode)) or not node.flow_style:
+        return None
+    if content[:node.start_mark.index].strip() or content[node.end_mark.index:].strip():
+        return None
+    return node
+
+
+@parse_cache.cached(__name__, yaml.__version__)
 def load(filename):
     """
     Load the given JSON file
     """
-    content = ''
+    content, file_lines = document_store.read(filename)
 
-    with open(filename) as fp:
-        content = fp.read()
-        fp.seek(0)
-        file_lines = [(ind + 1, line) for (ind, line) in
-                      list(enumerate(fp.readlines()))]
-
-    template = loads(filename)
+    node = _get_json_node(document_store.compose(filename), content)
+    if node is not None:
+        template = [SafeLineLoader('').construct_document(node)]
+    else:
+        template = _loads_content(content)
 
     return (template, file_lines)
 
@@ -1,6 +1,10 @@
 import yaml
 from yaml.loader import SafeLoader
 
+from checkov.common.util.document_store import document_store
+from checkov.common.util.parse_cache import parse_cache
+
+
 def loads(filename):
     """
     Load the given YAML string
@@ -17,29 +21,41 @@ def loads(filename):
     return template
 
 
+def construct(nodes, content):
+    """
+    Construct the documents of the given composed YAML nodes of content
+    """
+    loader = SafeLineLoader('', last_line=content.count('\n'))
+    return [loader.construct_document(node) for node in nodes]
+
+
+@parse_cache.cached(__name__, yaml.__version__)
 def load(filename):
     """
     Load the given YAML file
     """
 
-    content = ''
+    content, file_lines = document_store.read(filename)
 
-    with open(filename) as fp:
-        content = fp.read()
-        fp.seek(0)
-        file_lines = [(ind + 1, line) for (ind, line) in
-                      list(enumerate(fp.readlines()))]
-
-    template = loads(filename)
+    template = construct(document_store.compose(filename).get_nodes(), content)
 
     return (template, file_lines)
 
 
 class SafeLineLoader(SafeLoader):
+    def __init__(self, stream, last_line=None):
+        super(SafeLineLoader, self).__init__(stream)
+        # The C parser marks the end of the stream on a new line when the content doesn't end with a line break,
+        # the end lines are kept within the content like with the pure Python parser
+        self.last_line = last_line
+
     def construct_mapping(self, node, deep=False):
         mapping = super(SafeLineLoader, self).construct_mapping(node, deep=deep)
         # Add 1 so line numbering starts at 1
         #mapping['__line__'] = node.start_mark.line + 1
         mapping['__startline__'] = node.start_mark.line + 1
-        mapping['__endline__'] = node.end_mark.line + 1
+        end_line = node.end_mark.line
+        if self.last_line is not None:
+            end_line = min(end_line, self.last_line)
+        mapping['__endline__'] = end_line + 1
         return mapping
\ No newline at end of file
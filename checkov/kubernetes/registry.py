@@ -1,3 +1,3 @@
 from checkov.kubernetes.base_registry import Registry
 
-registry = Registry()
+registry = Registry(checks_manifest_key='kubernetes')
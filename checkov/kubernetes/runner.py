@@ -3,9 +3,12 @@ import operator
 import os
 from functools import reduce
 
+from checkov.common.comment.suppression_index import to_skipped_checks
 from checkov.common.output.record import Record
-from checkov.common.output.report import Report
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_directories
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.runners.framework_sniffer import framework_sniffer
+from checkov.common.util.line_store import get_code_block, line_store
 from checkov.kubernetes.parser.parser import parse
 from checkov.kubernetes.registry import registry
 from checkov.runner_filter import RunnerFilter
@@ -16,11 +19,10 @@ K8_POSSIBLE_ENDINGS = [".yaml", ".yml", ".json"]
 class Runner(BaseRunner):
     check_type = "kubernetes"
 
-    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True):
-        report = Report(self.check_type)
+    def run_records(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+                    collect_skip_comments=True, file_discovery=None, parsing_errors=None):
         definitions = {}
         definitions_raw = {}
-        parsing_errors = {}
         files_list = []
         if external_checks_dir:
             for directory in external_checks_dir:
@@ -31,24 +33,25 @@ class Runner(BaseRunner):
                 parse_result = parse(file)
                 if parse_result:
                     (definitions[file], definitions_raw[file]) = parse_result
+                    definitions_raw[file] = line_store.bind(file, definitions_raw[file])
 
         if root_folder:
-            for root, d_names, f_names in os.walk(root_folder):
-                filter_ignored_directories(d_names)
-
-                for file in f_names:
-                    file_ending = os.path.splitext(file)[1]
-                    if file_ending in K8_POSSIBLE_ENDINGS:
-                        full_path = os.path.join(root, file)
-                        if "/." not in full_path and file not in ['package.json','package-lock.json']:
-                            # skip temp directories
-                            files_list.append(full_path)
+            file_discovery = file_discovery or FileDiscovery(root_folder)
+            for full_path in file_discovery.get_files(extensions=K8_POSSIBLE_ENDINGS):
+                file = os.path.basename(full_path)
+                if "/." not in full_path and file not in ['package.json','package-lock.json']:
+                    # skip temp directories
+                    files_list.append(full_path)
 
             for file in files_list:
+                if not framework_sniffer.may_match(file, self.check_type):
+                    continue
                 relative_file_path = f'/{os.path.relpath(file, os.path.commonprefix((root_folder, file)))}'
                 parse_result = parse(file)
+                framework_sniffer.audit(file, self.check_type, parse_result is not None)
                 if parse_result:
                     (definitions[relative_file_path], definitions_raw[relative_file_path]) = parse_result
+                    definitions_raw[relative_file_path] = line_store.bind(file, definitions_raw[relative_file_path])
 
         for k8_file in definitions.keys():
             if definitions[k8_file]:
@@ -155,23 +158,25 @@ class Runner(BaseRunner):
 
                     if start_line == end_line:
                         entity_lines_range = [start_line, end_line]
-                        entity_code_lines = definitions_raw[k8_file][start_line - 1: end_line]
+                        entity_code_lines = get_code_block(definitions_raw[k8_file], start_line - 1, end_line)
                     else:
                         entity_lines_range = [start_line, end_line - 1]
-                        entity_code_lines = definitions_raw[k8_file][start_line - 1: end_line - 1]
+                        entity_code_lines = get_code_block(definitions_raw[k8_file], start_line - 1, end_line - 1)
 
                     # TODO? - Variable Eval Message!
                     variable_evaluations = {}
 
+                    results, result_counts = self.split_results(results, runner_filter, k8_file,
+                                                                entity_lines_range)
                     for check, check_result in results.items():
                         record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                         code_block=entity_code_lines, file_path=k8_file,
                                         file_line_range=entity_lines_range,
                                         resource=check.get_resource_id(entity_conf), evaluations=variable_evaluations,
                                         check_class=check.__class__.__module__)
-                        report.add_record(record=record)
-
-        return report
+                        yield record
+                    if result_counts is not None:
+                        yield result_counts
 
 
 
@@ -207,7 +212,7 @@ def get_skipped_checks(entity_conf):
     skipped = []
     metadata = {}
     if not isinstance(entity_conf,dict):
-        return skipped
+        return {}
     if entity_conf["kind"] == "containers" or entity_conf["kind"] == "initContainers":
         metadata = entity_conf["parent_metadata"]
     else:
@@ -227,7 +232,7 @@ def get_skipped_checks(entity_conf):
                 else:
                     logging.debug("Parse of Annotation Failed for {}: {}".format(metadata["annotations"][key], entity_conf, indent=2))
                     continue
-    return skipped
+    return to_skipped_checks(skipped)
 
 def _get_from_dict(data_dict, map_list):
     return reduce(operator.getitem, map_list, data_dict)
@@ -6,20 +6,19 @@ import os
 import shutil
 from pathlib import Path
 
-from checkov.arm.runner import Runner as arm_runner
-from checkov.cloudformation.runner import Runner as cfn_runner
-from checkov.common.bridgecrew.platform_integration import BcPlatformIntegration
-from checkov.common.goget.github.get_git import GitGetter
-from checkov.common.runners.runner_registry import RunnerRegistry, OUTPUT_CHOICES
+from checkov.common.runners.framework_sniffer import framework_sniffer, SNIFFING_MODES
+from checkov.common.runners.runner_registry import RunnerRegistry, OUTPUT_CHOICES, FRAMEWORK_CHOICES
 from checkov.common.util.banner import banner as checkov_banner
-from checkov.common.util.docs_generator import print_checks
-from checkov.kubernetes.runner import Runner as k8_runner
+from checkov.common.util.check_result_cache import check_result_cache
+from checkov.common.util.parse_cache import parse_cache
 from checkov.logging_init import init as logging_init
 from checkov.runner_filter import RunnerFilter
-from checkov.serverless.runner import Runner as sls_runner
-from checkov.terraform.runner import Runner as tf_runner
 from checkov.version import version
 
+# The runners, the platform integration and the other optional features are imported when they are used
+
+DEFAULT_SERVE_ADDRESS = 'localhost:8000'
+
 outer_registry = None
 
 logging_init()
@@ -30,17 +29,25 @@ def run(banner=checkov_banner):
     parser = argparse.ArgumentParser(description='Infrastructure as code static analysis')
     add_parser_args(parser)
     args = parser.parse_args()
-    bc_integration = BcPlatformIntegration()
-    runner_filter = RunnerFilter(framework=args.framework, checks=args.check, skip_checks=args.skip_check)
-    if outer_registry:
-        runner_registry = outer_registry
-        runner_registry.runner_filter = runner_filter
-    else:
-        runner_registry = RunnerRegistry(banner, runner_filter, tf_runner(), cfn_runner(), k8_runner(), sls_runner(),
-                                         arm_runner())
     if args.version:
         print(version)
         return
+    if args.parse_workers < 1:
+        parser.error("--parse-workers must be a positive number")
+    if args.no_parse_cache:
+        parse_cache.enabled = False
+    framework_sniffer.mode = args.framework_sniffing
+    if args.check_result_cache:
+        check_result_cache.enabled = True
+    bc_integration = None
+    if args.bc_api_key or not args.no_guide:
+        from checkov.common.bridgecrew.platform_integration import BcPlatformIntegration
+        bc_integration = BcPlatformIntegration()
+    runner_filter = RunnerFilter(framework=args.framework, checks=args.check, skip_checks=args.skip_check)
+
+    def create_runner_registry(runner_filter):
+        return RunnerRegistry(banner, runner_filter, *get_runners(runner_filter.framework, args.parse_workers))
+
     if args.bc_api_key:
         if args.repo_id is None:
             parser.error("--repo-id argument is required when using --bc-api-key")
@@ -52,20 +59,43 @@ def run(banner=checkov_banner):
     guidelines = {}
     if not args.no_guide:
         guidelines = bc_integration.get_guidelines()
+    if args.diff_base and not args.directory:
+        parser.error("--diff-base can only be used together with --directory")
+    if args.watch and (not args.directory or len(args.directory) > 1 or args.file):
+        parser.error("--watch can only be used together with a single --directory")
     if args.check and args.skip_check:
         parser.error("--check and --skip-check can not be applied together. please use only one of them")
         return
     if args.list:
+        from checkov.common.util.docs_generator import print_checks
         print_checks(framework=args.framework)
         return
     external_checks_dir = get_external_checks_dir(args)
+    if args.serve:
+        from checkov.common.runners.scan_server import ScanService, serve
+        serve(args.serve, ScanService(create_runner_registry, guidelines, external_checks_dir))
+        return
+    if args.watch:
+        from checkov.common.runners.scan_watcher import ScanWatcher, watch
+        watch(ScanWatcher(args.directory[0], create_runner_registry, runner_filter, guidelines, external_checks_dir),
+              is_quiet=args.quiet)
+        return
+    if outer_registry:
+        runner_registry = outer_registry
+        runner_registry.runner_filter = runner_filter
+    else:
+        runner_registry = create_runner_registry(runner_filter)
+    runner_registry.spool_records = args.spool_records
+    if not (bc_integration and bc_integration.is_integration_configured()):
+        # the platform is sent all the records, the outputs may only need the failed ones
+        runner_registry.recorded_results = RunnerRegistry.get_recorded_results(args)
     if args.directory:
         for root_folder in args.directory:
             file = args.file
             scan_reports = runner_registry.run(root_folder=root_folder, external_checks_dir=external_checks_dir,
-                                               files=file, guidelines=guidelines)
-            if bc_integration.is_integration_configured():
-                bc_integration.persist_repository(root_folder)
+                                               files=file, guidelines=guidelines, diff_base=args.diff_base)
+            if bc_integration and bc_integration.is_integration_configured():
+                bc_integration.persist_repository(root_folder, file_discovery=runner_registry.file_discovery)
                 bc_integration.persist_scan_results(scan_reports)
                 bc_integration.commit_repository(args.branch)
             runner_registry.print_reports(scan_reports, args)
@@ -73,7 +103,7 @@ def run(banner=checkov_banner):
     elif args.file:
         scan_reports = runner_registry.run(external_checks_dir=external_checks_dir, files=args.file,
                                            guidelines=guidelines)
-        if bc_integration.is_integration_configured():
+        if bc_integration and bc_integration.is_integration_configured():
             files = [os.path.abspath(file) for file in args.file]
             root_folder = os.path.split(os.path.commonprefix(files))[0]
             bc_integration.persist_repository(root_folder)
@@ -107,8 +137,7 @@ def add_parser_args(parser):
                         default=False,
                         help='in case of CLI output, display only failed checks')
     parser.add_argument('--framework', help='filter scan to run only on a specific infrastructure code frameworks',
-                        choices=['cloudformation', 'terraform', 'kubernetes', 'serverless', 'arm', 'all'],
-                        default='all')
+                        choices=FRAMEWORK_CHOICES, default='all')
     parser.add_argument('-c', '--check',
                         help='filter scan to run only on a specific check identifier(allowlist), You can '
                              'specify multiple checks separated by comma delimiter', default=None)
@@ -123,11 +152,64 @@ def add_parser_args(parser):
     parser.add_argument('-b', '--branch',
                         help="Selected branch of the persisted repository. Only has effect when using the --bc-api-key flag",
                         default='master')
+    parser.add_argument('--parse-workers', type=int, default=1,
+                        help='Number of processes used to parse Terraform files. Defaults to 1 (parse serially)')
+    parser.add_argument('--no-parse-cache', action='store_true', default=False,
+                        help='Do not use the on-disk cache of parsed files (stored under ~/.cache/checkov, '
+                             'or CKV_PARSE_CACHE_DIR)')
+    parser.add_argument('--framework-sniffing', choices=SNIFFING_MODES, default='strict',
+                        help='Skip parsing the YAML/JSON files which do not contain the markers of a framework (strict), '
+                             'parse all the files but log the templates found without their markers (audit), '
+                             'or parse all the files (off)')
+    parser.add_argument('--check-result-cache', action='store_true', default=False,
+                        help='Reuse the results of the checks on unchanged resources from previous runs (stored under '
+                             '~/.cache/checkov, or CKV_CHECK_RESULT_CACHE_DIR)')
+    parser.add_argument('--diff-base',
+                        help='Scan only the changes of the directory since the given git ref (e.g. origin/master): '
+                             'the changed files, with the files they need as context, and report only the changed '
+                             'resources')
+    parser.add_argument('--serve', nargs='?', const=DEFAULT_SERVE_ADDRESS, metavar='ADDRESS',
+                        help='Run as a daemon serving scan requests over HTTP, with the checks loaded once. ADDRESS is '
+                             f'[host:]port or the path of a Unix socket (default: {DEFAULT_SERVE_ADDRESS})')
+    parser.add_argument('--watch', action='store_true', default=False,
+                        help='Scan the directory, then keep watching it and re-scan only the files which change, '
+                             'printing the new and fixed failed checks')
+    parser.add_argument('--spool-records', action='store_true', default=False,
+                        help='Keep the results of the checks in temporary files instead of in memory until they are '
+                             'reported, for the scans of large repositories')
+
+
+def get_runners(framework='all', parse_workers=1):
+    """
+    Import and create the runners of a framework, the runners of the other frameworks are not imported
+    :param framework: framework to scan, 'all' for all of them
+    :param parse_workers: number of processes parsing the Terraform files
+    :return: list of the runners
+    """
+    runners = []
+    if framework in ('terraform', 'all'):
+        from checkov.terraform.parser import Parser as tf_parser
+        from checkov.terraform.runner import Runner as tf_runner
+        runners.append(tf_runner(parser=tf_parser(parse_workers=parse_workers)))
+    if framework in ('cloudformation', 'all'):
+        from checkov.cloudformation.runner import Runner as cfn_runner
+        runners.append(cfn_runner())
+    if framework in ('kubernetes', 'all'):
+        from checkov.kubernetes.runner import Runner as k8_runner
+        runners.append(k8_runner())
+    if framework in ('serverless', 'all'):
+        from checkov.serverless.runner import Runner as sls_runner
+        runners.append(sls_runner())
+    if framework in ('arm', 'all'):
+        from checkov.arm.runner import Runner as arm_runner
+        runners.append(arm_runner())
+    return runners
 
 
 def get_external_checks_dir(args):
     external_checks_dir = args.external_checks_dir
     if args.external_checks_git:
+        from checkov.common.goget.github.get_git import GitGetter
         git_getter = GitGetter(args.external_checks_git[0])
         external_checks_dir = [git_getter.get()]
         atexit.register(shutil.rmtree, str(Path(external_checks_dir[0]).parent))
@@ -20,6 +20,10 @@ class RunnerFilter(object):
         else:
             self.skip_checks = skip_checks
         self.framework = framework
+        # CheckPlan of the current RunnerRegistry run, see RunnerRegistry.run
+        self.check_plan = None
+        # CheckResults the runners create the Records of, None for all of them (see BaseRunner.split_results)
+        self.recorded_results = None
 
     def should_run_check(self, check_id):
         if RunnerFilter.is_external_check(check_id):
@@ -1,7 +0,0 @@
-from checkov.serverless.checks.complete import *
-from checkov.serverless.checks.custom import *
-from checkov.serverless.checks.function import *
-from checkov.serverless.checks.layer import *
-from checkov.serverless.checks.package import *
-from checkov.serverless.checks.provider import *
-from checkov.serverless.checks.service import *
\ No newline at end of file
@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-complete_registry = ServerlessRegistry()
+complete_registry = ServerlessRegistry(checks_manifest_key='serverless_complete')
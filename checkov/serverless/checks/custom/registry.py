@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-custom_registry = ServerlessRegistry()
+custom_registry = ServerlessRegistry(checks_manifest_key='serverless_custom')
@@ -1 +0,0 @@
-from checkov.serverless.checks.function.aws import *
@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-function_registry = ServerlessRegistry()
+function_registry = ServerlessRegistry(checks_manifest_key='serverless_function')
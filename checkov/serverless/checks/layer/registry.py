@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-layer_registry = ServerlessRegistry()
+layer_registry = ServerlessRegistry(checks_manifest_key='serverless_layer')
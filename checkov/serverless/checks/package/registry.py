@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-package_registry = ServerlessRegistry()
+package_registry = ServerlessRegistry(checks_manifest_key='serverless_package')
@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-plugin_registry = ServerlessRegistry()
+plugin_registry = ServerlessRegistry(checks_manifest_key='serverless_plugin')
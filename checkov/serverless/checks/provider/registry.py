@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-provider_registry = ServerlessRegistry()
+provider_registry = ServerlessRegistry(checks_manifest_key='serverless_provider')
@@ -1,3 +1,3 @@
 from checkov.serverless.base_registry import ServerlessRegistry
 
-service_registry = ServerlessRegistry()
+service_registry = ServerlessRegistry(checks_manifest_key='serverless_service')
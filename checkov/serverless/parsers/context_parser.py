@@ -2,6 +2,7 @@ from checkov.cloudformation.parser.node import dict_node, list_node, str_node
 from checkov.serverless.parsers.parser import FUNCTIONS_TOKEN, PROVIDER_TOKEN, IAM_ROLE_STATEMENTS_TOKEN, \
     ENVIRONMENT_TOKEN, STACK_TAGS_TOKEN, TAGS_TOKEN
 from checkov.cloudformation.context_parser import ContextParser as CfnContextParser
+from checkov.common.util.line_store import get_code_block
 
 
 class ContextParser(object):
@@ -35,7 +36,7 @@ class ContextParser(object):
 
             entity_lines_range = [start_line, end_line - 1]
 
-            entity_code_lines = self.sls_template_lines[start_line - 1: end_line - 1]
+            entity_code_lines = get_code_block(self.sls_template_lines, start_line - 1, end_line - 1)
             return entity_lines_range, entity_code_lines
         return None, None
 
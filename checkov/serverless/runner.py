@@ -1,6 +1,8 @@
 import logging
 import os
 from checkov.cloudformation.context_parser import ContextParser as CfnContextParser
+from checkov.common.comment.suppression_index import SuppressionIndex
+from checkov.common.models.consts import SLS_FILE_MASK
 from checkov.serverless.base_registry import EntityDetails
 from checkov.serverless.parsers.context_parser import ContextParser as SlsContextParser
 from checkov.cloudformation.checks.resource.registry import cfn_registry
@@ -12,16 +14,16 @@ from checkov.serverless.checks.package.registry import package_registry
 from checkov.serverless.checks.plugin.registry import plugin_registry
 from checkov.serverless.checks.provider.registry import provider_registry
 from checkov.serverless.checks.service.registry import service_registry
-from checkov.common.runners.base_runner import BaseRunner, filter_ignored_directories
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.runners.framework_sniffer import framework_sniffer
+from checkov.common.util.line_store import line_store
 from checkov.runner_filter import RunnerFilter
 from checkov.common.output.record import Record
-from checkov.common.output.report import Report
 from checkov.serverless.parsers.parser import parse
 from checkov.cloudformation.parser.node import dict_node
 from checkov.serverless.parsers.parser import CFN_RESOURCES_TOKEN
 
-SLS_FILE_MASK = ["serverless.yml", "serverless.yaml"]
-
 MULTI_ITEM_SECTIONS = [
     ("functions", function_registry),
     ("layers", layer_registry)
@@ -38,11 +40,10 @@ SINGLE_ITEM_SECTIONS = [
 class Runner(BaseRunner):
     check_type = "serverless"
 
-    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True):
-        report = Report(self.check_type)
+    def run_records(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+                    collect_skip_comments=True, file_discovery=None, parsing_errors=None):
         definitions = {}
         definitions_raw = {}
-        parsing_errors = {}
         files_list = []
         if external_checks_dir:
             for directory in external_checks_dir:
@@ -54,27 +55,29 @@ class Runner(BaseRunner):
                     parse_result = parse(file)
                     if parse_result:
                         (definitions[file], definitions_raw[file]) = parse_result
+                        definitions_raw[file] = line_store.bind(file, definitions_raw[file])
 
         if root_folder:
-            for root, d_names, f_names in os.walk(root_folder):
+            file_discovery = file_discovery or FileDiscovery(root_folder)
+            for full_path in file_discovery.get_files(names=SLS_FILE_MASK):
                 # Don't walk in to "node_modules" directories under the root folder. If –for some reason–
                 # scanning one of these is desired, it can be directly specified.
-                if "node_modules" in d_names:
-                    d_names.remove("node_modules")
-
-                filter_ignored_directories(d_names)
-                for file in f_names:
-                    if file in SLS_FILE_MASK:
-                        full_path = os.path.join(root, file)
-                        if "/." not in full_path:
-                            # skip temp directories
-                            files_list.append(full_path)
+                relative_directory = os.path.relpath(os.path.dirname(full_path), root_folder)
+                if "node_modules" in relative_directory.split(os.sep):
+                    continue
+                if "/." not in full_path:
+                    # skip temp directories
+                    files_list.append(full_path)
 
             for file in files_list:
+                if not framework_sniffer.may_match(file, self.check_type):
+                    continue
                 relative_file_path = f'/{os.path.relpath(file, os.path.commonprefix((root_folder, file)))}'
                 parse_result = parse(file)
+                framework_sniffer.audit(file, self.check_type, parse_result is not None)
                 if parse_result:
                     (definitions[relative_file_path], definitions_raw[relative_file_path]) = parse_result
+                    definitions_raw[relative_file_path] = line_store.bind(file, definitions_raw[relative_file_path])
 
         # Filter out empty files that have not been parsed successfully
         definitions = {k: v for k, v in definitions.items() if v}
@@ -83,6 +86,7 @@ class Runner(BaseRunner):
         for sls_file, sls_file_data in definitions.items():
             if not isinstance(sls_file_data, dict_node):
                 continue
+            suppression_index = SuppressionIndex(definitions_raw[sls_file])
 
             if CFN_RESOURCES_TOKEN in sls_file_data and isinstance(sls_file_data[CFN_RESOURCES_TOKEN], dict_node):
                 cf_sub_template = sls_file_data[CFN_RESOURCES_TOKEN]
@@ -96,19 +100,23 @@ class Runner(BaseRunner):
                     entity_lines_range, entity_code_lines = cf_context_parser.extract_cf_resource_code_lines(
                         resource)
                     if entity_lines_range and entity_code_lines:
-                        skipped_checks = CfnContextParser.collect_skip_comments(entity_code_lines)
+                        skipped_checks = suppression_index.get_skipped_checks(*entity_lines_range)
                         # TODO - Variable Eval Message!
                         variable_evaluations = {}
 
                         results = cfn_registry.scan(sls_file, {resource_name: resource}, skipped_checks,
                                                     runner_filter)
+                        results, result_counts = self.split_results(results, runner_filter, sls_file,
+                                                                    entity_lines_range)
                         for check, check_result in results.items():
                             record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                             code_block=entity_code_lines, file_path=sls_file,
                                             file_line_range=entity_lines_range,
                                             resource=cf_resource_id, evaluations=variable_evaluations,
                                             check_class=check.__class__.__module__)
-                            report.add_record(record=record)
+                            yield record
+                        if result_counts is not None:
+                            yield result_counts
 
             sls_context_parser = SlsContextParser(sls_file, sls_file_data, definitions_raw[sls_file])
 
@@ -122,7 +130,7 @@ class Runner(BaseRunner):
                         continue
                     entity_lines_range, entity_code_lines = sls_context_parser.extract_code_lines(item_content)
                     if entity_lines_range and entity_code_lines:
-                        skipped_checks = CfnContextParser.collect_skip_comments(entity_code_lines)
+                        skipped_checks = suppression_index.get_skipped_checks(*entity_lines_range)
                         variable_evaluations = {}
                         if token == "functions":
                             # "Enriching" copies things like "environment" and "stackTags" down into the
@@ -132,13 +140,17 @@ class Runner(BaseRunner):
                         results = registry.scan(sls_file,
                                                 EntityDetails(sls_context_parser.provider_type, item_content),
                                                 skipped_checks, runner_filter)
+                        results, result_counts = self.split_results(results, runner_filter, sls_file,
+                                                                    entity_lines_range)
                         for check, check_result in results.items():
                             record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                             code_block=entity_code_lines, file_path=sls_file,
                                             file_line_range=entity_lines_range,
                                             resource=item_name, evaluations=variable_evaluations,
                                             check_class=check.__class__.__module__)
-                            report.add_record(record=record)
+                            yield record
+                        if result_counts is not None:
+                            yield result_counts
             # Sub-sections that are a single item
             for token, registry in SINGLE_ITEM_SECTIONS:
                 item_content = sls_file_data.get(token)
@@ -148,28 +160,34 @@ class Runner(BaseRunner):
                 if not entity_lines_range:
                     entity_lines_range, entity_code_lines = sls_context_parser.extract_code_lines(sls_file_data)
 
-                skipped_checks = CfnContextParser.collect_skip_comments(entity_code_lines)
+                skipped_checks = suppression_index.get_skipped_checks(*entity_lines_range)
                 variable_evaluations = {}
                 results = registry.scan(sls_file,
                                         EntityDetails(sls_context_parser.provider_type, item_content),
                                         skipped_checks, runner_filter)
+                results, result_counts = self.split_results(results, runner_filter, sls_file,
+                                                            entity_lines_range)
                 for check, check_result in results.items():
                     record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                     code_block=entity_code_lines, file_path=sls_file,
                                     file_line_range=entity_lines_range,
                                     resource=token, evaluations=variable_evaluations,
                                     check_class=check.__class__.__module__)
-                    report.add_record(record=record)
+                    yield record
+                if result_counts is not None:
+                    yield result_counts
 
             # "Complete" checks
             # NOTE: Ignore code content, no point in showing (could be long)
             entity_lines_range, entity_code_lines = sls_context_parser.extract_code_lines(sls_file_data)
             if entity_lines_range:
-                skipped_checks = CfnContextParser.collect_skip_comments(entity_code_lines)
+                skipped_checks = suppression_index.get_skipped_checks(*entity_lines_range)
                 variable_evaluations = {}
                 results = complete_registry.scan(sls_file,
                                                  EntityDetails(sls_context_parser.provider_type, sls_file_data),
                                                  skipped_checks, runner_filter)
+                results, result_counts = self.split_results(results, runner_filter, sls_file,
+                                                            entity_lines_range)
                 for check, check_result in results.items():
                     record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
                                     code_block=[],              # Don't show, could be large
@@ -178,6 +196,6 @@ class Runner(BaseRunner):
                                     resource="complete",        # Weird, not sure what to put where
                                     evaluations=variable_evaluations,
                                     check_class=check.__class__.__module__)
-                    report.add_record(record=record)
-
-        return report
+                    yield record
+                if result_counts is not None:
+                    yield result_counts
@@ -1,2 +0,0 @@
-from checkov.terraform.checks.resource import *
-from checkov.terraform.checks.data import *
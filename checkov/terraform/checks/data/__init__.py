@@ -1 +0,0 @@
-from checkov.terraform.checks.data.aws import *
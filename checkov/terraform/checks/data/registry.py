@@ -1,3 +1,3 @@
 from checkov.terraform.checks.data.base_registry import Registry
 
-data_registry = Registry()
+data_registry = Registry(checks_manifest_key='terraform_data')
@@ -3,8 +3,8 @@ from checkov.common.checks.base_check_registry import BaseCheckRegistry
 
 class Registry(BaseCheckRegistry):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, checks_manifest_key=None):
+        super().__init__(checks_manifest_key)
 
     def extract_entity_details(self, entity):
         module_name = list(entity.keys())[0]
@@ -1,3 +1,3 @@
 from checkov.terraform.checks.module.base_registry import Registry
 
-module_registry = Registry()
+module_registry = Registry(checks_manifest_key='terraform_module')
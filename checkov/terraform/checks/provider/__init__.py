@@ -1 +0,0 @@
-from checkov.terraform.checks.provider.aws import *
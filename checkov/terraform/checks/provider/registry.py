@@ -1,3 +1,3 @@
 from checkov.terraform.checks.provider.base_registry import Registry
 
-provider_registry = Registry()
+provider_registry = Registry(checks_manifest_key='terraform_provider')
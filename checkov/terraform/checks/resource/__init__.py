@@ -1,4 +0,0 @@
-from checkov.terraform.checks.resource.aws import *
-from checkov.terraform.checks.resource.gcp import *
-from checkov.terraform.checks.resource.azure import *
-from checkov.terraform.checks.resource.github import *
@@ -1,3 +1,4 @@
+from checkov.common.checks.conf_columns import MISSING
 from checkov.common.models.enums import CheckResult, CheckCategories
 from checkov.terraform.checks.resource.base_resource_check import BaseResourceCheck
 from checkov.common.util.type_forcers import force_list
@@ -54,6 +55,38 @@ class AbsSecurityGroupUnrestrictedIngress(BaseResourceCheck):
         # The result for an SG with no ingress block
         return CheckResult.PASSED
 
+    def scan_batch(self, confs):
+        """
+            Scans the aws_security_group_rule resources together: their types and port ranges are compared column by
+            column, and only the ingress rules open to this port have their CIDR blocks looked at. The security groups
+            with ingress blocks, and the rules missing a port, are scanned one by one with scan_resource_conf.
+        :param confs: ConfColumns of aws_security_group or aws_security_group_rule configurations
+        :return: list of <CheckResult>
+        """
+        results = [None] * len(confs)
+        rule_indexes = []
+        for index, (conf, rule_type, from_port, to_port) in enumerate(zip(confs, confs.column('type'),
+                                                                          confs.column('from_port'),
+                                                                          confs.column('to_port'))):
+            if 'ingress' in conf or rule_type is MISSING:
+                results[index] = self.scan_resource_conf(conf)
+            elif force_list(rule_type)[0] != 'ingress':
+                results[index] = CheckResult.UNKNOWN
+            elif from_port is MISSING or to_port is MISSING:
+                results[index] = self.scan_resource_conf(conf)
+            else:
+                rule_indexes.append(index)
+
+        rules = confs.select(rule_indexes)
+        from_ports = [force_int(force_list(from_port)[0]) for from_port in rules.column('from_port')]
+        to_ports = [force_int(force_list(to_port)[0]) for to_port in rules.column('to_port')]
+        in_port_range = [from_port is not None and to_port is not None and from_port <= self.port <= to_port for
+                         from_port, to_port in zip(from_ports, to_ports)]
+        for index, in_range, cidr_blocks in zip(rule_indexes, in_port_range, rules.column('cidr_blocks', [[]])):
+            violation = in_range and "0.0.0.0/0" in force_list(cidr_blocks[0])
+            results[index] = CheckResult.FAILED if violation else CheckResult.PASSED
+        return results
+
     def contains_violation(self, conf):
         from_port = force_int(force_list(conf['from_port'])[0])
         to_port = force_int(force_list(conf['to_port'])[0])
@@ -1,10 +1,14 @@
 from checkov.common.checks.base_check_registry import BaseCheckRegistry
+from checkov.common.checks.check_plan import get_check_plan
+from checkov.terraform.checks.resource.value_check_batch import ValueCheckBatch, value_check_scope
 
 
 class Registry(BaseCheckRegistry):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, checks_manifest_key=None):
+        super().__init__(checks_manifest_key)
+        # tuple of the checks run on a resource type to the batch of its value checks
+        self._value_check_batches = {}
 
     def extract_entity_details(self, entity):
         resource_type = list(entity.keys())[0]
@@ -12,3 +16,22 @@ class Registry(BaseCheckRegistry):
         resource_object = entity[resource_type]
         resource_configuration = resource_object[resource_name]
         return resource_type, resource_name, resource_configuration
+
+    def scan(self, scanned_file, entity, skipped_checks, runner_filter, check_results=None):
+        (entity_type, _, entity_configuration) = self.extract_entity_details(entity)
+        checks = get_check_plan(runner_filter).get_checks(self, entity_type)
+        with value_check_scope.scan(entity_configuration, self._get_value_check_batch(checks)):
+            return super().scan(scanned_file, entity, skipped_checks, runner_filter, check_results)
+
+    def _get_value_check_batch(self, checks):
+        """
+        :return: ValueCheckBatch of the value checks among the checks, None if there aren't any
+        """
+        if checks not in self._value_check_batches:
+            # imported here, the value checks module imports the registry
+            from checkov.terraform.checks.resource.base_resource_value_check import BaseResourceValueCheck
+
+            value_checks = [check for check in checks if
+                            isinstance(check, BaseResourceValueCheck) and check.is_batched()]
+            self._value_check_batches[checks] = ValueCheckBatch(value_checks) if value_checks else None
+        return self._value_check_batches[checks]
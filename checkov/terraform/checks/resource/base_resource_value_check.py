@@ -1,7 +1,7 @@
 from abc import abstractmethod
-import dpath.util
 import re
 from checkov.terraform.checks.resource.base_resource_check import BaseResourceCheck
+from checkov.terraform.checks.resource.value_check_batch import ValueCheckBatch, value_check_scope
 from checkov.common.models.enums import CheckResult
 from checkov.common.models.consts import ANY_VALUE
 
@@ -12,6 +12,8 @@ class BaseResourceValueCheck(BaseResourceCheck):
     def __init__(self, name, id, categories, supported_resources, missing_block_result=CheckResult.FAILED):
         super().__init__(name=name, id=id, categories=categories, supported_resources=supported_resources)
         self.missing_block_result = missing_block_result
+        # batch of the check alone, resolving its inspected key when it isn't scanned with its resource type's batch
+        self._value_check_batch = None
 
     @staticmethod
     def _filter_key_path(path):
@@ -39,14 +41,30 @@ class BaseResourceValueCheck(BaseResourceCheck):
         return any([x in key for x in inspected_attributes])
 
     def scan_resource_conf(self, conf):
-        inspected_key = self.get_inspected_key()
+        resolution = value_check_scope.get_resolution(self, conf)
+        if resolution is None:
+            if self._value_check_batch is None:
+                self._value_check_batch = ValueCheckBatch([self])
+            resolution = self._value_check_batch.resolve(conf)[self]
+        return self.scan_key_resolution(resolution)
+
+    def scan_key_resolution(self, resolution):
+        """
+        Compare the values of the resource configuration at the inspected key with the expected values
+        :param resolution: KeyResolution of the inspected key in the resource configuration
+        :return: <CheckResult>
+        """
+        if resolution.error:
+            raise resolution.error
         expected_values = self.get_expected_values()
-        if dpath.search(conf, inspected_key) != {}:
+        if resolution.key_values:
             # Inspected key exists
             if ANY_VALUE in expected_values:
                 # Key is found on the configuration - if it accepts any value, the check is PASSED
                 return CheckResult.PASSED
-            value = dpath.get(conf, inspected_key)
+            if len(resolution.key_values) > 1:
+                raise ValueError(f'The inspected key {self.get_inspected_key()} must match only one value')
+            value = resolution.key_values[0]
             if isinstance(value, list) and len(value) == 1:
                 value = value[0]
             if self._is_variable_dependant(value):
@@ -57,14 +75,14 @@ class BaseResourceValueCheck(BaseResourceCheck):
             return CheckResult.FAILED
         else:
             # Look for the configuration in a bottom-up fashion
-            inspected_attributes = self._filter_key_path(inspected_key)
-            for attribute in reversed(inspected_attributes):
-                for sub_key, sub_conf in dpath.search(conf, f'**/{attribute}', yielded=True):
+            inspected_attributes = resolution.attributes
+            for attribute_matches in reversed(resolution.attribute_matches):
+                for sub_key, sub_conf in attribute_matches:
                     filtered_sub_key = self._filter_key_path(sub_key)
                     if self._is_nesting_key(inspected_attributes, filtered_sub_key):
                         if isinstance(sub_conf, list) and len(sub_conf) == 1:
                             sub_conf = sub_conf[0]
-                        if sub_conf in self.get_expected_values():
+                        if sub_conf in expected_values:
                             return CheckResult.PASSED
                         if self._is_variable_dependant(sub_conf):
                             # If the tested attribute is variable-dependant, then result is PASSED
@@ -72,6 +90,19 @@ class BaseResourceValueCheck(BaseResourceCheck):
 
         return self.missing_block_result
 
+    def get_inspected_attributes(self):
+        """
+        :return: List of the named attributes of the inspected key
+        """
+        return self._filter_key_path(self.get_inspected_key())
+
+    def is_batched(self):
+        """
+        :return: whether the check's inspected key is resolved with the other value checks of the resource type (see
+                 ValueCheckBatch), which it isn't when the check scans the configuration itself
+        """
+        return type(self).scan_resource_conf is BaseResourceValueCheck.scan_resource_conf
+
     @abstractmethod
     def get_inspected_key(self):
         """
@@ -0,0 +1,186 @@
+import fnmatch
+import re
+from contextlib import contextmanager
+
+from checkov.common.util.data_path import CONTAINER_TYPES, compile_path, format_path, walk_nodes
+
+GLOB_CHARACTERS = ('*', '?', '[')
+
+
+def _compile_pattern(pattern):
+    """
+    :return: the pattern if it matches a single name, or the compiled regex of the glob, matching like dpath
+    """
+    if any(character in pattern for character in GLOB_CHARACTERS):
+        return re.compile(fnmatch.translate(pattern))
+    return pattern
+
+
+class KeyResolution(object):
+    """
+    Values of a resource configuration a value check inspects: the values at its inspected key, and the values at
+    each attribute of its key (the names of its path, without the list indexes) wherever they are in the
+    configuration, which the check falls back to when the key isn't found
+    """
+
+    def __init__(self, attributes):
+        self.attributes = attributes
+        self.key_values = []
+        # for each attribute, list of the (path, value) of the configuration's values at the attribute
+        self.attribute_matches = [[] for _ in attributes]
+        self.error = None
+
+    @staticmethod
+    def from_dpath(conf, inspected_key, attributes):
+        """
+        Resolve a key which the batch can't (with a '**' glob) with dpath's searches
+        """
+        import dpath.util
+
+        resolution = KeyResolution(attributes)
+        try:
+            resolution.key_values = [value for _, value in dpath.search(conf, inspected_key, yielded=True)]
+            if not resolution.key_values:
+                resolution.attribute_matches = [list(dpath.search(conf, f'**/{attribute}', yielded=True)) for
+                                                attribute in attributes]
+        except Exception as e:
+            # e.g. an invalid glob, raised when the check is scanned
+            resolution.error = e
+        return resolution
+
+
+class _KeyTrieNode(object):
+
+    def __init__(self):
+        self.children = {}
+        self.glob_children = []
+        # checks whose inspected key ends at the node
+        self.checks = []
+
+    def add_child(self, pattern):
+        compiled_pattern = _compile_pattern(pattern)
+        if isinstance(compiled_pattern, str):
+            return self.children.setdefault(pattern, _KeyTrieNode())
+        for glob_pattern, child in self.glob_children:
+            if glob_pattern.pattern == compiled_pattern.pattern:
+                return child
+        child = _KeyTrieNode()
+        self.glob_children.append((compiled_pattern, child))
+        return child
+
+    def get_children(self, name):
+        child = self.children.get(name)
+        children = [child] if child is not None else []
+        children.extend(child for pattern, child in self.glob_children if pattern.match(name))
+        return children
+
+
+class ValueCheckBatch(object):
+    """
+    Resolves the inspected keys of the value checks of a resource type in one walk of a resource configuration,
+    instead of each check searching the configuration for its key and then for each of its attributes. The inspected
+    keys are globs, like dpath's, which are matched by walking a trie of them along the configuration.
+    """
+
+    def __init__(self, checks):
+        """
+        :param checks: value checks (BaseResourceValueCheck) of the resource type
+        """
+        self.checks = checks
+        self._trie = _KeyTrieNode()
+        # attribute name or glob to the (check, attribute index) of the checks inspecting it
+        self._attribute_listeners = {}
+        self._glob_attribute_listeners = []
+        self._dpath_checks = []
+        self._attributes = {}
+        for check in checks:
+            inspected_key = check.get_inspected_key()
+            attributes = check.get_inspected_attributes()
+            self._attributes[check] = attributes
+            key_path = compile_path(inspected_key)
+            if '**' in key_path:
+                self._dpath_checks.append(check)
+                continue
+            node = self._trie
+            for pattern in key_path:
+                node = node.add_child(pattern)
+            node.checks.append(check)
+            for attribute_index, attribute in enumerate(attributes):
+                self._add_attribute_listener(attribute, (check, attribute_index))
+
+    def _add_attribute_listener(self, attribute, listener):
+        compiled_attribute = _compile_pattern(attribute)
+        if isinstance(compiled_attribute, str):
+            self._attribute_listeners.setdefault(attribute, []).append(listener)
+            return
+        for pattern, listeners in self._glob_attribute_listeners:
+            if pattern.pattern == compiled_attribute.pattern:
+                listeners.append(listener)
+                return
+        self._glob_attribute_listeners.append((compiled_attribute, [listener]))
+
+    def resolve(self, conf):
+        """
+        :return: dict of each check of the batch to the KeyResolution of its inspected key in the configuration
+        """
+        resolutions = {check: KeyResolution(self._attributes[check]) for check in self.checks}
+        # path of each visited container to the trie nodes its path matches
+        container_nodes = {(): [self._trie]}
+        for path, _, key, value in walk_nodes(conf):
+            name = str(key)
+            parent_nodes = container_nodes.get(path[:-1])
+            if parent_nodes:
+                nodes = [child for node in parent_nodes for child in node.get_children(name)]
+                for node in nodes:
+                    for check in node.checks:
+                        resolutions[check].key_values.append(value)
+                if nodes and isinstance(value, CONTAINER_TYPES):
+                    container_nodes[path] = nodes
+
+            listeners = self._attribute_listeners.get(name, [])
+            for pattern, glob_listeners in self._glob_attribute_listeners:
+                if pattern.match(name):
+                    listeners = listeners + glob_listeners
+            if listeners:
+                match = (format_path(path), value)
+                for check, attribute_index in listeners:
+                    resolutions[check].attribute_matches[attribute_index].append(match)
+
+        for check in self._dpath_checks:
+            resolutions[check] = KeyResolution.from_dpath(conf, check.get_inspected_key(), self._attributes[check])
+        return resolutions
+
+
+class ValueCheckScope(object):
+    """
+    The value check batch of the resource being scanned, so its value checks get their inspected keys resolved by a
+    single walk of its configuration, on the first check which needs them
+    """
+
+    def __init__(self):
+        self._conf = None
+        self._batch = None
+        self._resolutions = None
+
+    @contextmanager
+    def scan(self, conf, batch):
+        previous_scope = (self._conf, self._batch, self._resolutions)
+        self._conf, self._batch, self._resolutions = conf, batch, None
+        try:
+            yield self
+        finally:
+            self._conf, self._batch, self._resolutions = previous_scope
+
+    def get_resolution(self, check, conf):
+        """
+        :return: KeyResolution of the check's inspected key in the configuration, None if the check isn't in the
+                 batch of the configuration being scanned
+        """
+        if self._batch is None or conf is not self._conf:
+            return None
+        if self._resolutions is None:
+            self._resolutions = self._batch.resolve(conf)
+        return self._resolutions.get(check)
+
+
+value_check_scope = ValueCheckScope()
@@ -1,19 +1,18 @@
 import logging
-import re
-import dpath.util
 from abc import ABC, abstractmethod
+from checkov.common.util.data_path import get_path, new_path
+from checkov.common.util.line_store import get_code_block, read_file_lines
+from checkov.terraform.context_parsers.block_index import BlockIndex
 from checkov.terraform.context_parsers.registry import parser_registry
 from checkov.common.models.enums import ContextCategories
-from itertools import islice
-from checkov.common.comment.enum import COMMENT_REGEX
-OPEN_CURLY = '{'
-CLOSE_CURLY = '}'
 
 
 class BaseContextParser(ABC):
     definition_type = ""
     tf_file = ""
     file_lines = []
+    filtered_lines = []
+    block_index = None
     context = {}
 
     def __init__(self, definition_type):
@@ -44,6 +43,13 @@ class BaseContextParser(ABC):
         block_type = self.get_block_type()
         return all(x in line_tokens for x in [block_type] + entity_context_path)
 
+    def _get_signature_tokens(self, entity_context_path):
+        """
+        :param entity_context_path: the entity's path in the context parser
+        :return: tokens which must all be present on the entity's signature line
+        """
+        return [self.get_block_type()] + entity_context_path
+
     @staticmethod
     def _trim_whitespaces_linebreaks(text):
         return text.strip()
@@ -54,33 +60,27 @@ class BaseContextParser(ABC):
         return self.filtered_lines
 
     def _read_file_lines(self):
-        with(open(self.tf_file, 'r')) as file:
-            file.seek(0)
-            file_lines = [(ind + 1, line) for (ind, line) in
-                          list(enumerate(file.readlines()))]
-            return file_lines
+        return read_file_lines(self.tf_file)
 
     def _collect_skip_comments(self, definition_blocks):
         """
         Collects checkov skip comments to all definition blocks
         :param definition_blocks: parsed definition blocks
-        :return: context enriched with with skipped checks per skipped entity
+        :return: context enriched with a dict of skipped check id to its skip info per entity
         """
-        parsed_file_lines = self.filtered_lines
-        comments = [(line_num, {"id": re.search(COMMENT_REGEX, x).group(2),
-                                "suppress_comment": re.search(COMMENT_REGEX, x).group(3)[1:] if re.search(COMMENT_REGEX,
-                                                                                                          x).group(3)
-                                else "No comment provided"}) for (line_num, x) in
-                    parsed_file_lines if re.search(COMMENT_REGEX, x)]
+        suppression_index = self.block_index.suppression_index
         for entity_block in definition_blocks:
-            skipped_checks = []
+            skipped_checks = {}
             entity_context_path = self.get_entity_context_path(entity_block)
-            context_search = dpath.search(self.context, entity_context_path, yielded=True)
-            for _, entity_context in context_search:
-                for (skip_check_line_num, skip_check) in comments:
-                    if entity_context['start_line'] < skip_check_line_num < entity_context['end_line']:
-                        skipped_checks.append(skip_check)
-            dpath.new(self.context, entity_context_path + ['skipped_checks'], skipped_checks)
+            # an empty path (e.g. of a variable block) doesn't match an entity's context
+            entity_context = get_path(self.context, entity_context_path) if entity_context_path else None
+            if entity_context is not None:
+                # skip comments apply to the lines between the block's signature and closing lines
+                entity_skipped_checks = suppression_index.get_skipped_checks(entity_context['start_line'] + 1,
+                                                                             entity_context['end_line'] - 1)
+                for check_id, skip_info in entity_skipped_checks.items():
+                    skipped_checks.setdefault(check_id, skip_info)
+            new_path(self.context, entity_context_path + ['skipped_checks'], skipped_checks)
         return self.context
 
     def _compute_definition_end_line(self, start_line_num):
@@ -88,24 +88,14 @@ class BaseContextParser(ABC):
         :param start_line_num: code block's first line number (the signature line)
         :return: the code block's last line number
         """
-        parsed_file_lines = self.filtered_lines
-        start_line_idx = [line_num for (line_num, _) in parsed_file_lines].index(start_line_num)
-        i = 1
-        end_line_num = 0
-        for (line_num, line) in islice(parsed_file_lines, start_line_idx + 1, None):
-            if OPEN_CURLY in line:
-                i = i + 1
-            if CLOSE_CURLY in line:
-                i = i - 1
-                if i == 0:
-                    end_line_num = line_num
-                    break
-        return end_line_num
+        return self.block_index.get_end_line(start_line_num)
 
-    def run(self, tf_file, definition_blocks, collect_skip_comments=True):
+    def run(self, tf_file, definition_blocks, collect_skip_comments=True, block_index=None):
         self.tf_file = tf_file
         self.context = {}
-        self.file_lines = self._read_file_lines()
+        self.block_index = block_index or BlockIndex(self._read_file_lines())
+        self.file_lines = self.block_index.file_lines
+        self.filtered_lines = self.block_index.filtered_lines
         self.context = self.enrich_definition_block(definition_blocks)
         if collect_skip_comments:
             self.context = self._collect_skip_comments(definition_blocks)
@@ -120,16 +110,23 @@ class BaseContextParser(ABC):
         :param definition_blocks: Terraform block, key-value dictionary
         :return: Enriched block context
         """
-        parsed_file_lines = self._filter_file_lines()
-        for i, entity_block in enumerate(definition_blocks):
+        signature_lines = {}
+        for entity_block in definition_blocks:
             entity_context_path = self.get_entity_context_path(entity_block)
-            for line_num, line in parsed_file_lines:
-                line_tokens = [x.replace('"', "") for x in line.split()]
-                if self._is_block_signature(line_num, line_tokens, entity_context_path):
-                    start_line = line_num
-                    end_line = self._compute_definition_end_line(line_num)
-                    dpath.new(self.context, entity_context_path + ["start_line"], start_line)
-                    dpath.new(self.context, entity_context_path + ["end_line"], end_line)
-                    dpath.new(self.context, entity_context_path + ["code_lines"],
-                              self.file_lines[start_line - 1: end_line])
+            path_key = tuple(entity_context_path)
+            if path_key not in signature_lines:
+                # the last matching line is the entity's signature line
+                signature_lines[path_key] = None
+                for line_num in self.block_index.find_lines(self._get_signature_tokens(entity_context_path)):
+                    line_tokens = self.block_index.get_line_tokens(line_num)
+                    if self._is_block_signature(line_num, line_tokens, entity_context_path):
+                        signature_lines[path_key] = line_num
+            start_line = signature_lines[path_key]
+            if start_line is None:
+                continue
+            end_line = self._compute_definition_end_line(start_line)
+            new_path(self.context, entity_context_path + ["start_line"], start_line)
+            new_path(self.context, entity_context_path + ["end_line"], end_line)
+            new_path(self.context, entity_context_path + ["code_lines"],
+                     get_code_block(self.file_lines, start_line - 1, end_line))
         return self.context
@@ -0,0 +1,87 @@
+from checkov.common.comment.suppression_index import SuppressionIndex
+
+OPEN_CURLY = '{'
+CLOSE_CURLY = '}'
+
+
+class BlockIndex:
+    """
+    Index of a Terraform file's lines, built in a single pass over the file so the context parsers can look up
+    block signature lines and block end lines without rescanning the file for every entity.
+    """
+
+    def __init__(self, file_lines):
+        """
+        :param file_lines: list of (line number, line) of the file, line numbers starting at 1
+        """
+        self.file_lines = file_lines
+        self.filtered_lines = []
+        self._line_tokens = {}
+        self._token_lines = {}
+        self._end_lines = {}
+        self._suppression_index = None
+        self._build()
+
+    def _build(self):
+        # Lines waiting for their block end, keyed by the brace depth which closes them. The depth only moves by
+        # one per line, so the first line reaching that depth is the block's end line.
+        pending_end_lines = {}
+        depth = 0
+        for line_num, line in self.file_lines:
+            line = line.strip()
+            if not line:
+                continue
+            self.filtered_lines.append((line_num, line))
+
+            tokens = [x.replace('"', "") for x in line.split()]
+            self._line_tokens[line_num] = tokens
+            for token in tokens:
+                token_lines = self._token_lines.setdefault(token, [])
+                if not token_lines or token_lines[-1] != line_num:
+                    token_lines.append(line_num)
+
+            if OPEN_CURLY in line:
+                depth += 1
+            if CLOSE_CURLY in line:
+                depth -= 1
+                for start_line_num in pending_end_lines.pop(depth, []):
+                    self._end_lines[start_line_num] = line_num
+            pending_end_lines.setdefault(depth - 1, []).append(line_num)
+
+    @property
+    def suppression_index(self):
+        """
+        :return: index of the file's skip comments, built on first use
+        """
+        if self._suppression_index is None:
+            self._suppression_index = SuppressionIndex(self.filtered_lines)
+        return self._suppression_index
+
+    def find_lines(self, tokens):
+        """
+        :param tokens: tokens which must all be present on the line
+        :return: sorted line numbers of the lines containing all the given tokens
+        """
+        if not tokens:
+            return [line_num for line_num, _ in self.filtered_lines]
+        candidates = []
+        for token in tokens:
+            token_lines = self._token_lines.get(token)
+            if not token_lines:
+                return []
+            candidates.append(token_lines)
+        shortest = min(candidates, key=len)
+        return [line_num for line_num in shortest if all(t in self._line_tokens[line_num] for t in tokens)]
+
+    def get_line_tokens(self, line_num):
+        """
+        :return: list of the line's tokens, stripped of their quotes
+        """
+        return self._line_tokens[line_num]
+
+    def get_end_line(self, start_line_num):
+        """
+        :param start_line_num: code block's first line number (the signature line)
+        :return: the code block's last line number, 0 if the block is not closed
+        """
+        return self._end_lines.get(start_line_num, 0)
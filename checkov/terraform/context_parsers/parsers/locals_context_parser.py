@@ -1,5 +1,5 @@
+from checkov.common.util.data_path import new_path
 from checkov.terraform.context_parsers.base_parser import BaseContextParser
-import dpath.util
 
 
 class LocalsContextParser(BaseContextParser):
@@ -12,7 +12,7 @@ class LocalsContextParser(BaseContextParser):
             for local_name, local_value in local_block.items():
                 local_value = local_value[0]
                 if type(local_value) in (int, float, bool, str):
-                    dpath.new(self.context, ['assignments', local_name], local_value)
+                    new_path(self.context, ('assignments', local_name), local_value)
 
     def get_block_type(self):
         return self.definition_type
@@ -12,6 +12,10 @@ class ProviderContextParser(BaseContextParser):
         entity_type = next(iter(entity_block))
         return [entity_type] + entity_block[entity_type].get('alias', ['default'])
 
+    def _get_signature_tokens(self, entity_context_path):
+        # Ignore the alias as it is not part of the signature
+        return super()._get_signature_tokens(entity_context_path[0:-1])
+
     def _is_block_signature(self, line_num, line_tokens, entity_context_path):
         # Ignore the alias as it is not part of the signature
         is_provider = super()._is_block_signature(line_num, line_tokens, entity_context_path[0:-1])
@@ -1,6 +1,6 @@
 from checkov.terraform.context_parsers.base_parser import BaseContextParser
+from checkov.common.util.data_path import new_path
 import os
-import dpath.util
 
 
 class VariableContextParser(BaseContextParser):
@@ -17,7 +17,7 @@ class VariableContextParser(BaseContextParser):
                         if isinstance(value, list) and len(value) == 1:
                             value = values['default'][0]
                             if type(value) in (int, float, bool, str):
-                                dpath.new(self.context, ['assignments', variable_name], value)
+                                new_path(self.context, ('assignments', variable_name), value)
 
     def get_entity_context_path(self, entity_block):
         return []
@@ -1,5 +1,8 @@
 import logging
-import dpath.util
+
+from checkov.common.util.data_path import new_path
+from checkov.common.util.line_store import read_file_lines
+from checkov.terraform.context_parsers.block_index import BlockIndex
 
 
 class ParserRegistry:
@@ -20,12 +23,16 @@ class ParserRegistry:
         (tf_file, definition_blocks_types) = definitions
         if definition_blocks_types:
             definition_blocks_types = {x: definition_blocks_types[x] for x in definition_blocks_types.keys()}
+            block_index = None
             for definition_type in definition_blocks_types.keys():
                 if definition_type in supported_definitions:
-                    dpath.new(self.definitions_context, [tf_file, definition_type], {})
+                    new_path(self.definitions_context, (tf_file, definition_type), {})
                     context_parser = self.context_parsers[definition_type]
                     definition_blocks = definition_blocks_types[definition_type]
-                    self.definitions_context[tf_file][definition_type] = context_parser.run(tf_file, definition_blocks, collect_skip_comments)
+                    if block_index is None:
+                        # the file is read and indexed once, for all of its definition types
+                        block_index = BlockIndex(read_file_lines(tf_file))
+                    self.definitions_context[tf_file][definition_type] = context_parser.run(tf_file, definition_blocks, collect_skip_comments, block_index)
 
         return self.definitions_context
 
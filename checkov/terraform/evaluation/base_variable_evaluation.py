@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 import logging
 import os
 import re
-import dpath.util
 
 TF_DEFINITIONS_STRIP_WORDS = r'\b(?!\d)([^\/]+)'
 NON_PATH_WORDS_REGEX = r'\b(?!output)[^ .]+'
@@ -18,6 +17,8 @@ class BaseVariableEvaluation(ABC):
         self.root_folder = root_folder
         self.tf_definitions = tf_definitions
         self.definitions_context = definitions_context
+        # file path to its entities evaluations, see map_entities_evaluations
+        self.entities_evaluations = {}
 
     @abstractmethod
     def evaluate_variables(self):
@@ -47,24 +48,28 @@ class BaseVariableEvaluation(ABC):
         return os.path.split("/".join(re.findall(TF_DEFINITIONS_STRIP_WORDS, definition_path)))
 
     @staticmethod
-    def reduce_entity_evaluations(variables_evaluations, entity_context_path):
+    def map_entities_evaluations(variables_evaluations):
         """
-        Reduce variable evaluations only to variables that are included in the entity's code block
-        :param variables_evaluations:
-        :param entity_context_path:
-        :return: the variable evaluations of the entity
+        Map the variable evaluations of a file to the entities whose code block include them
+        :param variables_evaluations: the file's variable evaluations, from its context
+        :return: dict of entity key (see get_entity_key) to the entity's variable evaluations
         """
-        entity_evaluations = {}
+        entities_evaluations = {}
         for var_name, variable_evaluations in variables_evaluations.items():
-            entity_definitions = []
             for var_definition in variable_evaluations['definitions']:
                 var_context_path, _ = BaseVariableEvaluation.extract_context_path(var_definition['definition_path'])
-                variable_context_path = var_context_path.split("/")
-                # This is due to inconsistency in order of Terraform entity naming conventions
-                if set(variable_context_path) == set(entity_context_path):
-                    entity_definitions.append(var_definition)
-            if entity_definitions:
-                entity_evaluation = variables_evaluations[var_name]
-                entity_evaluation['definitions'] = entity_definitions
-                dpath.new(entity_evaluations, var_name, entity_evaluation)
-        return entity_evaluations
+                entity_key = BaseVariableEvaluation.get_entity_key(var_context_path.split("/"))
+                entity_evaluations = entities_evaluations.setdefault(entity_key, {})
+                if var_name not in entity_evaluations:
+                    entity_evaluations[var_name] = {**variable_evaluations, 'definitions': []}
+                entity_evaluations[var_name]['definitions'].append(var_definition)
+        return entities_evaluations
+
+    @staticmethod
+    def get_entity_key(entity_context_path):
+        """
+        :param entity_context_path: entity's path in the context parser
+        :return: key of the entity in the entities evaluations
+        """
+        # This is due to inconsistency in order of Terraform entity naming conventions
+        return frozenset(entity_context_path)
@@ -2,40 +2,38 @@ import logging
 import os
 import re
 
-import dpath
-
-from checkov.terraform.evaluation.base_variable_evaluation import BaseVariableEvaluation
+from checkov.common.util.data_path import new_path, set_path
+from checkov.terraform.evaluation.base_variable_evaluation import BaseVariableEvaluation, \
+    DEFINITION_TYPES_REGEX_MAPPING
+from checkov.terraform.evaluation.reference_index import ReferenceIndex
 
 
 class ConstVariableEvaluation(BaseVariableEvaluation):
     def __init__(self, root_folder, tf_definitions, definitions_context):
         super().__init__(root_folder, tf_definitions, definitions_context)
 
-    def _locate_variables_assignments(self, definition_type, folder, var_name):
+    def _locate_variables_assignments(self, definition_type, references, var_name):
         var_assignments_paths = {}
-        assignment_regex = self._generate_evaluation_regex(definition_type, var_name)
-        for source_file in [file for file in os.listdir(folder) if
-                            file.endswith('.tf') and self.tf_definitions.get(os.path.join(folder, file))]:
-            file_path = os.path.join(folder, source_file)
-            var_entries = dpath.search(self.tf_definitions[file_path], '**',
-                                       afilter=lambda x: re.findall(assignment_regex, str(x)), yielded=True)
-            var_assignments_paths[file_path] = []
-            for definition_path, expression in var_entries:
-                context_path, definition_name = self.extract_context_path(definition_path)
-                var_assignments_paths[file_path].append({
-                    'definition_name': definition_name,
-                    'definition_expression': expression,
-                    'definition_path': definition_path})
-        var_assignments_paths = {k: v for (k, v) in var_assignments_paths.items() if len(v) > 0}
+        assignment_regex = re.compile(self._generate_evaluation_regex(definition_type, var_name))
+        reference_type = DEFINITION_TYPES_REGEX_MAPPING[definition_type]
+        for file_path, definition_path, expression in references.find(reference_type, var_name):
+            if not assignment_regex.search(str(expression)):
+                continue
+            context_path, definition_name = self.extract_context_path(definition_path)
+            var_assignments_paths.setdefault(file_path, []).append({
+                'definition_name': definition_name,
+                'definition_expression': expression,
+                'definition_path': definition_path})
         return var_assignments_paths
 
-    def _assign_definition_value(self, definition_type, var_name, var_value, var_assignments):
+    def _assign_definition_value(self, definition_type, var_name, var_value, var_assignments, references):
         """
         assigns var_value to variable var_name in tf_definitions
         :param definition_type: the entity's block type
         :param var_name: variable name
         :param var_value: variable value
         :param var_assignments: variable assignments
+        :param references: index of the variable references of the evaluated folder
         """
         assignment_regex = self._generate_evaluation_regex(definition_type, var_name)
         var_file = var_assignments['var_file']
@@ -53,20 +51,19 @@ class ConstVariableEvaluation(BaseVariableEvaluation):
                     continue
                 context_path, _ = self.extract_context_path(definition_path)
                 if assignment_file in self.definitions_context.keys():
-                    dpath.new(self.definitions_context[assignment_file], f'evaluations/{var_name}/var_file',
-                              var_file)
-                    dpath.new(self.definitions_context[assignment_file], f'evaluations/{var_name}/value',
-                              var_value)
-                    dpath.new(self.definitions_context[assignment_file],
-                              f'evaluations/{var_name}/definitions',
-                              assignments)
+                    file_context = self.definitions_context[assignment_file]
+                    new_path(file_context, ('evaluations', var_name, 'var_file'), var_file)
+                    new_path(file_context, ('evaluations', var_name, 'value'), var_value)
+                    new_path(file_context, ('evaluations', var_name, 'definitions'), assignments)
                 if self._is_variable_only_expression(assignment_regex, entry_expression):
                     # Preserve the original type of the variable if not part of a composite expression
                     evaluated_definition = var_value
                 else:
                     evaluated_definition = re.sub(assignment_regex, re.escape(var_value_string), entry_expression)
 
-                dpath.set(self.tf_definitions[assignment_file], definition_path, evaluated_definition)
+                set_path(self.tf_definitions[assignment_file], definition_path, evaluated_definition)
+                # the evaluated value may reference other variables
+                references.update(assignment_file, definition_path)
                 self.logger.debug(
                     f'Evaluated definition {definition_name} in file {assignment_file}: default value of variable {var_file}: '
                     f'{var_name} to "{var_value_string}"')
@@ -75,9 +72,13 @@ class ConstVariableEvaluation(BaseVariableEvaluation):
         """
         Evaluate all default variables found in tf_definitions expressions, per a scanned directory of Terraform files
         """
-        definitions_folders = set([os.path.split(file_path)[0] for file_path in self.definitions_context.keys()])
+        definitions_folders = sorted(set([os.path.split(file_path)[0] for file_path in self.definitions_context.keys()]))
         for folder in definitions_folders:
             self._evaluate_folder_variables(folder)
+        for file_path, file_context in self.definitions_context.items():
+            variables_evaluations = file_context.get('evaluations')
+            if variables_evaluations:
+                self.entities_evaluations[file_path] = self.map_entities_evaluations(variables_evaluations)
 
     def _evaluate_folder_variables(self, folder):
         """
@@ -86,8 +87,16 @@ class ConstVariableEvaluation(BaseVariableEvaluation):
         :param folder: folder to assign variables in
         :return:
         """
-        assignment_files = dpath.search(self.definitions_context, f'**.assignments', separator='.')
-        assignment_files = {k: v for k, v in assignment_files.items() if folder in k}
+        assignment_files = {}
+        for file_path, file_context in self.definitions_context.items():
+            if folder not in file_path:
+                continue
+            variable_assignments = {definition_type: file_context[definition_type] for definition_type in
+                                    file_context.keys() if definition_type in DEFINITION_TYPES_REGEX_MAPPING and
+                                    isinstance(file_context[definition_type], dict) and
+                                    'assignments' in file_context[definition_type]}
+            if variable_assignments:
+                assignment_files[file_path] = variable_assignments
         if assignment_files:
             self._assign_definitions(assignment_files, folder)
 
@@ -98,12 +107,16 @@ class ConstVariableEvaluation(BaseVariableEvaluation):
         :param folder:
         :return:
         """
+        # the folder's definitions are walked once, and their variable references indexed for all the assignments
+        references = ReferenceIndex({file_path: tf_definition for file_path, tf_definition in
+                                     self.tf_definitions.items() if os.path.split(file_path)[0] == folder and
+                                     file_path.endswith('.tf') and tf_definition})
         for var_file, variable_assignments in assignment_files.items():
             relative_var_file = f'/{os.path.relpath(var_file, self.root_folder)}'
             for definition_type in variable_assignments.keys():
                 for var_name, var_value in variable_assignments[definition_type].get('assignments', {}).items():
                     if var_name == '':
                         continue
-                    evaluated_definitions = self._locate_variables_assignments(definition_type, folder, var_name)
+                    evaluated_definitions = self._locate_variables_assignments(definition_type, references, var_name)
                     var_assignments = {'definitions': evaluated_definitions, 'var_file': relative_var_file}
-                    self._assign_definition_value(definition_type, var_name, var_value, var_assignments)
+                    self._assign_definition_value(definition_type, var_name, var_value, var_assignments, references)
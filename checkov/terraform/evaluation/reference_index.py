@@ -0,0 +1,69 @@
+import re
+from collections import defaultdict
+
+from checkov.common.util.data_path import format_path, walk_leaves
+from checkov.terraform.evaluation.base_variable_evaluation import DEFINITION_TYPES_REGEX_MAPPING
+
+# Matches (overlapping) every reference prefix followed by the name characters of the reference, e.g. var.name
+REFERENCE_REGEX = re.compile(r'(?=(' + '|'.join(map(re.escape, DEFINITION_TYPES_REGEX_MAPPING.values())) +
+                             r')[.]([\w-]*))')
+NAME_REGEX = re.compile(r'[\w-]+')
+
+
+class ReferenceIndex:
+    """
+    Reverse index of the variable references (e.g. var.name, local.name) found in the leaf expressions of
+    tf_definitions. The definitions are walked once, then the expressions which may reference a variable are looked
+    up by the variable's name.
+    """
+
+    def __init__(self, tf_definitions):
+        """
+        :param tf_definitions: dict of file path to its Terraform definitions
+        """
+        self._leaves = []
+        self._leaf_ids = {}
+        self._references = defaultdict(set)
+        for file_path, tf_definition in tf_definitions.items():
+            for path, container, key, value in walk_leaves(tf_definition):
+                expression = str(value)
+                if '.' not in expression:
+                    continue
+                definition_path = format_path(path)
+                leaf_id = len(self._leaves)
+                self._leaves.append((file_path, container, key, definition_path))
+                self._leaf_ids[(file_path, definition_path)] = leaf_id
+                self._index_expression(leaf_id, expression)
+
+    def _index_expression(self, leaf_id, expression):
+        for reference_type, name in REFERENCE_REGEX.findall(expression):
+            # index every prefix of the name, variable names are matched as prefixes by the evaluation regex
+            for i in range(len(name) + 1):
+                self._references[(reference_type, name[:i])].add(leaf_id)
+
+    def find(self, reference_type, name):
+        """
+        Find the expressions which may reference a variable. The expressions are only candidates, they should be
+        matched with the variable's evaluation regex.
+        :param reference_type: type of the reference, e.g. var or local
+        :param name: name of the variable
+        :return: generator of (file path, definition path, expression) in the order of the definitions
+        """
+        if not NAME_REGEX.fullmatch(name):
+            # the name can't be told apart in the index, go through all the references of the type
+            name = ''
+        for leaf_id in sorted(self._references.get((reference_type, name), ())):
+            file_path, container, key, definition_path = self._leaves[leaf_id]
+            yield file_path, definition_path, container[key]
+
+    def update(self, file_path, definition_path):
+        """
+        Index the references of an expression which was changed (e.g. evaluated)
+        :param file_path: file of the expression
+        :param definition_path: '/' separated path of the expression in the file's definitions
+        """
+        leaf_id = self._leaf_ids.get((file_path, definition_path))
+        if leaf_id is None:
+            return
+        _, container, key, _ = self._leaves[leaf_id]
+        self._index_expression(leaf_id, str(container[key]))
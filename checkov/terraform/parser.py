@@ -1,16 +1,39 @@
 import hcl2
 import logging
 import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from os import path
 
-from checkov.common.runners.base_runner import filter_ignored_directories
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.util.parse_cache import parse_cache
+
+
+def _parse_tf_file(tf_file):
+    """
+    Parse a single Terraform file, returning the outcome instead of raising it so it can be sent back from a
+    worker process
+    :param tf_file: path of the Terraform file
+    :return: tuple of (tf_file, tf_definition, parsing error)
+    """
+    try:
+        return tf_file, Parser._parse_tf_definitions(tf_file), None
+    except Exception as e:
+        try:
+            pickle.loads(pickle.dumps(e))
+        except Exception:
+            # some lark exceptions can't be unpickled in the parent process, keep their message only
+            e = Exception(f'{e.__class__.__name__}: {e}')
+        return tf_file, None, e
 
 
 class Parser:
     logger = logging.getLogger(__name__)
 
-    def __init__(self):
+    def __init__(self, parse_workers=1):
         self._parsed_directories = set()
+        self.parse_workers = parse_workers
 
     def _mark_parsed(self, directory):
         self._parsed_directories.add(directory)
@@ -19,6 +42,7 @@ class Parser:
         return directory in self._parsed_directories
 
     @staticmethod
+    @parse_cache.cached(__name__, hcl2.__version__)
     def _parse_tf_definitions(tf_file):
         with(open(tf_file, 'r')) as file:
             file.seek(0)
@@ -31,31 +55,84 @@ class Parser:
                                 named_resource[dynamic_field_name] = dynamic_field_value['for_each']
         return tf_definition
 
-    def hcl2(self, directory, tf_definitions={}, parsing_errors={}):
-        modules_scan = set()
-        for root, d_names, f_names in os.walk(directory):
-            filter_ignored_directories(d_names)
+    def hcl2(self, directory, tf_definitions={}, parsing_errors={}, file_discovery=None):
+        """
+        Parse the Terraform files of a directory, and of the local modules they reference
+        :param file_discovery: FileDiscovery of the directory, to not walk it again
+        """
+        with self._parse_map() as map_func:
+            self._parse_directory(directory, tf_definitions, parsing_errors, map_func, file_discovery)
+
+    def parse_files(self, files, tf_definitions={}, parsing_errors={}):
+        """
+        Parse a batch of Terraform files, without walking their directories
+        :param files: paths of the files to parse, files which are not .tf files are ignored
+        """
+        tf_files = []
+        for file in files:
+            if file.endswith(".tf") and file not in tf_definitions.keys() and file not in tf_files:
+                tf_files.append(file)
+        with self._parse_map() as map_func:
+            self._parse_batch(tf_files, tf_definitions, parsing_errors, map_func)
+
+    @contextmanager
+    def _parse_map(self):
+        """
+        :return: map-like callable to parse files with, either the builtin map or a process pool's map
+        """
+        if self.parse_workers > 1:
+            with ProcessPoolExecutor(max_workers=self.parse_workers) as executor:
+                yield executor.map
+        else:
+            yield map
+
+    def _parse_batch(self, tf_files, tf_definitions, parsing_errors, map_func):
+        """
+        Parse a batch of Terraform files with map_func. Results are collected in the order of tf_files, so the
+        insertion order of tf_definitions is the same whether map_func runs serially or on a process pool.
+        :return: list of (tf_file, tf_definition) of the successfully parsed files
+        """
+        parsed_files = []
+        for tf_file, tf_definition, error in map_func(_parse_tf_file, tf_files):
+            if error:
+                self.logger.debug(f'failed while parsing file {tf_file}', exc_info=error)
+                parsing_errors[tf_file] = error
+                continue
+            if tf_definition:
+                tf_definitions[tf_file] = tf_definition
+            parsed_files.append((tf_file, tf_definition))
+        return parsed_files
+
+    def _parse_directory(self, directory, tf_definitions, parsing_errors, map_func, file_discovery=None):
+        """
+        Parse all the Terraform files under a directory as a single batch, followed by the local modules they
+        reference
+        """
+        tf_files = []
+        file_discovery = file_discovery or FileDiscovery(directory)
+        for root, f_names in file_discovery.walk(directory):
             self._mark_parsed(os.path.abspath(root))
             for file in f_names:
                 if file.endswith(".tf"):
                     tf_file = os.path.join(root, file)
                     if tf_file not in tf_definitions.keys():
-                        try:
-                            tf_definition = self._parse_tf_definitions(tf_file)
-                            if tf_definition:
-                                tf_definitions[tf_file] = tf_definition
-                            for modules in tf_definition.get("module", []):
-                                for module in modules.values():
-                                    relative_path = module['source'][0]
-                                    abs_path = os.path.abspath(os.path.join(root, relative_path))
-                                    if not self._is_parsed(abs_path):
-                                        modules_scan.add(abs_path)
-                        except Exception as e:
-                            self.logger.debug(f'failed while parsing file {tf_file}', exc_info=e)
-                            parsing_errors[tf_file] = e
+                        tf_files.append(tf_file)
+
+        modules_scan = []
+        for tf_file, tf_definition in self._parse_batch(tf_files, tf_definitions, parsing_errors, map_func):
+            try:
+                for modules in tf_definition.get("module", []):
+                    for module in modules.values():
+                        relative_path = module['source'][0]
+                        abs_path = os.path.abspath(os.path.join(os.path.dirname(tf_file), relative_path))
+                        if not self._is_parsed(abs_path) and abs_path not in modules_scan:
+                            modules_scan.append(abs_path)
+            except Exception as e:
+                self.logger.debug(f'failed while parsing file {tf_file}', exc_info=e)
+                parsing_errors[tf_file] = e
         for m in modules_scan:
-            if path.exists(m):
-                self.hcl2(directory=m, tf_definitions=tf_definitions)
+            if path.exists(m) and not self._is_parsed(m):
+                self._parse_directory(m, tf_definitions, parsing_errors, map_func)
 
     def parse_file(self, file, parsing_errors={}):
         if file.endswith(".tf"):
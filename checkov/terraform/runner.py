@@ -1,11 +1,12 @@
 import logging
 import os
+from dataclasses import dataclass
 
 import dpath.util
 
 from checkov.common.output.record import Record
-from checkov.common.output.report import Report
 from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.util.data_path import get_path, walk_leaves
 from checkov.runner_filter import RunnerFilter
 from checkov.terraform.checks.data.registry import data_registry
 from checkov.terraform.checks.module.registry import module_registry
@@ -15,13 +16,24 @@ from checkov.terraform.context_parsers.registry import parser_registry
 from checkov.terraform.evaluation.base_variable_evaluation import BaseVariableEvaluation
 from checkov.terraform.evaluation.evaluation_methods.const_variable_evaluation import ConstVariableEvaluation
 from checkov.terraform.parser import Parser
-# Allow the evaluation of empty variables
+# Allow the evaluation of empty variables (by the checks which use dpath)
 dpath.options.ALLOW_EMPTY_STRING_KEYS = True
 
 TRUE_STRING = "true"
 ONE_STRING = "1"
 FALSE_STRING = "false"
 ZERO_STRING = "0"
+BOOLEAN_STRINGS = {TRUE_STRING: True, ONE_STRING: True, FALSE_STRING: False, ZERO_STRING: False}
+
+
+@dataclass
+class ScannedEntity:
+    block_type: str
+    scanned_file: str
+    entity: dict
+    entity_id: str
+    context: dict
+    evaluations: dict
 
 
 class Runner(BaseRunner):
@@ -31,6 +43,7 @@ class Runner(BaseRunner):
         self.parser = parser
         self.tf_definitions = {}
         self.definitions_context = {}
+        self.entities_evaluations = {}
 
     block_type_registries = {
         'resource': resource_registry,
@@ -39,45 +52,39 @@ class Runner(BaseRunner):
         'module': module_registry,
     }
 
-    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(), collect_skip_comments=True):
-        report = Report(self.check_type)
+    def run_records(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+                    collect_skip_comments=True, file_discovery=None, parsing_errors=None):
         self.tf_definitions = {}
-        parsing_errors = {}
+        file_parsing_errors = {}
         if external_checks_dir:
             for directory in external_checks_dir:
                 resource_registry.load_external_checks(directory, runner_filter)
         if root_folder:
             root_folder = os.path.abspath(root_folder)
-            self.parser.hcl2(directory=root_folder, tf_definitions=self.tf_definitions, parsing_errors=parsing_errors)
-            self.check_tf_definition(report, root_folder, runner_filter, collect_skip_comments)
+            self.parser.hcl2(directory=root_folder, tf_definitions=self.tf_definitions, parsing_errors=file_parsing_errors,
+                             file_discovery=file_discovery)
 
         if files:
+            # Parse all the requested files first, so they are enriched, evaluated and scanned in a single pass
             files = [os.path.abspath(file) for file in files]
-            root_folder = os.path.split(os.path.commonprefix(files))[0]
-            for file in files:
-                if file.endswith(".tf"):
-                    self.tf_definitions[file] = self.parser.parse_file(file=file, parsing_errors=parsing_errors)
-                    self.check_tf_definition(report, root_folder, runner_filter, collect_skip_comments)
+            if not root_folder:
+                root_folder = os.path.split(os.path.commonprefix(files))[0]
+            self.parser.parse_files(files=files, tf_definitions=self.tf_definitions, parsing_errors=file_parsing_errors)
 
-        report.add_parsing_errors(parsing_errors.keys())
+        if parsing_errors is not None:
+            parsing_errors.extend(file_parsing_errors.keys())
 
-        return report
+        if root_folder:
+            yield from self.check_tf_definition(root_folder, runner_filter, collect_skip_comments)
 
     def evaluate_string_booleans(self):
         # Support HCL 0.11 optional boolean syntax - evaluate "true" and "1" to true, "false" and "0" to false
-        for tf_file in self.tf_definitions.keys():
-            for var_path, var_value in dpath.util.search(self.tf_definitions[tf_file], "**",
-                                                         afilter=lambda x: x == TRUE_STRING or x == ONE_STRING,
-                                                         yielded=True):
-                if not var_path.endswith('alias/0'):
-                    dpath.set(self.tf_definitions[tf_file], var_path, True)
-            for var_path, var_value in dpath.util.search(self.tf_definitions[tf_file], "**",
-                                                         afilter=lambda x: x == FALSE_STRING or x == ZERO_STRING,
-                                                         yielded=True):
-                if not var_path.endswith('alias/0'):
-                    dpath.set(self.tf_definitions[tf_file], var_path, False)
-
-    def check_tf_definition(self, report, root_folder, runner_filter, collect_skip_comments=True):
+        for tf_definition in self.tf_definitions.values():
+            for var_path, container, key, var_value in walk_leaves(tf_definition):
+                if isinstance(var_value, str) and var_value in BOOLEAN_STRINGS and var_path[-2:] != ('alias', 0):
+                    container[key] = BOOLEAN_STRINGS[var_value]
+
+    def check_tf_definition(self, root_folder, runner_filter, collect_skip_comments=True):
         definitions_context = {}
         parser_registry.reset_definitions_context()
         for definition in self.tf_definitions.items():
@@ -86,37 +93,66 @@ class Runner(BaseRunner):
         variable_evaluator = ConstVariableEvaluation(root_folder, self.tf_definitions, definitions_context)
         variable_evaluator.evaluate_variables()
         self.tf_definitions, self.definitions_context = variable_evaluator.tf_definitions, variable_evaluator.definitions_context
+        self.entities_evaluations = variable_evaluator.entities_evaluations
+        entities = []
         for full_file_path, definition in self.tf_definitions.items():
             scanned_file = f"/{os.path.relpath(full_file_path, root_folder)}"
             logging.debug(f"Scanning file: {scanned_file}")
             for block_type in definition.keys():
                 if block_type in ['resource', 'data', 'provider', 'module']:
-                    self.run_block(definition[block_type], definitions_context, full_file_path, report, scanned_file,
-                                   block_type, runner_filter)
-
-    def run_block(self, entities, definition_context, full_file_path, report, scanned_file, block_type,
-                  runner_filter=None):
-        registry = self.block_type_registries[block_type]
-        if registry:
-            for entity in entities:
-                entity_evaluations = None
-                context_parser = parser_registry.context_parsers[block_type]
-                definition_path = context_parser.get_entity_context_path(entity)
-                entity_id = ".".join(definition_path)
-                entity_context_path = [block_type] + definition_path
-                for _, entity_context in dpath.search(definition_context[full_file_path], entity_context_path, yielded=True):
-                    entity_lines_range = [entity_context.get('start_line'), entity_context.get('end_line')]
-                    entity_code_lines = entity_context.get('code_lines')
-                    skipped_checks = entity_context.get('skipped_checks')
-                    variables_evaluations = definition_context[full_file_path].get('evaluations')
-                    if variables_evaluations:
-                        entity_evaluations = BaseVariableEvaluation.reduce_entity_evaluations(variables_evaluations,
-                                                                                              entity_context_path)
-                    results = registry.scan(scanned_file, entity, skipped_checks, runner_filter)
-                    for check, check_result in results.items():
-                        record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
-                                        code_block=entity_code_lines, file_path=scanned_file,
-                                        file_line_range=entity_lines_range,
-                                        resource=entity_id, evaluations=entity_evaluations,
-                                        check_class=check.__class__.__module__)
-                        report.add_record(record=record)
+                    entities.extend(self.get_block_entities(definition[block_type], definitions_context,
+                                                            full_file_path, scanned_file, block_type))
+        yield from self.run_entities(entities, runner_filter)
+
+    def get_block_entities(self, entities, definition_context, full_file_path, scanned_file, block_type):
+        """
+        :return: list of the ScannedEntity of the block's entities which have a context
+        """
+        block_entities = []
+        context_parser = parser_registry.context_parsers[block_type]
+        file_evaluations = self.entities_evaluations.get(full_file_path)
+        for entity in entities:
+            entity_evaluations = None
+            definition_path = context_parser.get_entity_context_path(entity)
+            entity_id = ".".join(definition_path)
+            entity_context_path = [block_type] + definition_path
+            if file_evaluations is not None:
+                entity_evaluations = file_evaluations.get(BaseVariableEvaluation.get_entity_key(entity_context_path), {})
+            entity_context = get_path(definition_context[full_file_path], entity_context_path)
+            if entity_context is not None:
+                block_entities.append(ScannedEntity(block_type, scanned_file, entity, entity_id, entity_context,
+                                                    entity_evaluations))
+        return block_entities
+
+    def run_entities(self, entities, runner_filter=None):
+        """
+        Scan the entities and yield their records, in the order of the entities. The entities of each
+        block type are scanned together, so the checks implementing scan_batch scan all the entities of a type at once.
+        :param entities: list of ScannedEntity
+        """
+        entities_results = [None] * len(entities)
+        for block_type, registry in self.block_type_registries.items():
+            indexes = [index for index, entity in enumerate(entities) if entity.block_type == block_type]
+            if not indexes or not registry:
+                continue
+            block_entities = [(entities[index].scanned_file, entities[index].entity,
+                               entities[index].context.get('skipped_checks')) for index in indexes]
+            for index, results in zip(indexes, registry.scan_entities(block_entities, runner_filter)):
+                entities_results[index] = results
+
+        for entity, results in zip(entities, entities_results):
+            if results is None:
+                continue
+            entity_lines_range = [entity.context.get('start_line'), entity.context.get('end_line')]
+            entity_code_lines = entity.context.get('code_lines')
+            results, result_counts = self.split_results(results, runner_filter, entity.scanned_file,
+                                                        entity_lines_range)
+            for check, check_result in results.items():
+                record = Record(check_id=check.id, check_name=check.name, check_result=check_result,
+                                code_block=entity_code_lines, file_path=entity.scanned_file,
+                                file_line_range=entity_lines_range,
+                                resource=entity.entity_id, evaluations=entity.evaluations,
+                                check_class=check.__class__.__module__)
+                yield record
+            if result_counts is not None:
+                yield result_counts
@@ -18,6 +18,8 @@ class TestCfnYaml(unittest.TestCase):
         self.assertEqual(summary['failed'], 0)
         self.assertEqual(summary['skipped'], 1)
         self.assertEqual(summary['parsing_errors'], 0)
+        self.assertEqual(report.skipped_checks[0].check_result['suppress_comment'],
+                         'Ensure all data stored in the RDS is securely encrypted at rest')
 
 if __name__ == '__main__':
     unittest.main()
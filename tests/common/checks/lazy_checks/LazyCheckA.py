@@ -0,0 +1,10 @@
+from tests.common.checks.lazy_checks.base_lazy_check import BaseLazyCheck
+
+
+class LazyCheckA(BaseLazyCheck):
+
+    def __init__(self):
+        super().__init__(id="CKV_LAZY_1", supported_entities=['resource_a', 'resource_b'])
+
+
+check = LazyCheckA()
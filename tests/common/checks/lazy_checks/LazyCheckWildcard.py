@@ -0,0 +1,10 @@
+from tests.common.checks.lazy_checks.base_lazy_check import BaseLazyCheck
+
+
+class LazyCheckWildcard(BaseLazyCheck):
+
+    def __init__(self):
+        super().__init__(id="CKV_LAZY_3", supported_entities=['resource_*'])
+
+
+check = LazyCheckWildcard()
@@ -0,0 +1,3 @@
+from checkov.common.checks.base_check_registry import BaseCheckRegistry
+
+lazy_registry = BaseCheckRegistry(checks_manifest_key='lazy')
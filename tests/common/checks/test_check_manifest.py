@@ -0,0 +1,75 @@
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+from checkov.common.checks import check_manifest
+from checkov.common.checks.check_manifest import CheckManifest, generate_manifest, get_check_manifest
+from checkov.common.checks.check_manifest_data import CHECKS_MANIFEST
+from checkov.runner_filter import RunnerFilter
+
+LAZY_CHECKS_PACKAGE = 'tests.common.checks.lazy_checks'
+LAZY_CHECKS_MANIFEST = [
+    ('CKV_LAZY_1', 'Lazy check CKV_LAZY_1', f'{LAZY_CHECKS_PACKAGE}.LazyCheckA', ('resource_a', 'resource_b')),
+    ('CKV_LAZY_2', 'Lazy check CKV_LAZY_2', f'{LAZY_CHECKS_PACKAGE}.LazyCheckB', ('resource_b',)),
+    ('CKV_LAZY_3', 'Lazy check CKV_LAZY_3', f'{LAZY_CHECKS_PACKAGE}.LazyCheckWildcard', ('resource_*',)),
+]
+
+
+class TestCheckManifest(unittest.TestCase):
+
+    def setUp(self):
+        get_check_manifest(None)
+        patcher = mock.patch.dict(check_manifest._manifests, {'lazy': CheckManifest(LAZY_CHECKS_MANIFEST)})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._unload_lazy_checks()
+        self.addCleanup(self._unload_lazy_checks)
+        self.registry = importlib.import_module(f'{LAZY_CHECKS_PACKAGE}.registry').lazy_registry
+
+    @staticmethod
+    def _unload_lazy_checks():
+        for module in list(sys.modules):
+            if module.startswith(f'{LAZY_CHECKS_PACKAGE}.'):
+                del sys.modules[module]
+
+    @staticmethod
+    def _loaded_checks():
+        return sorted(module.rsplit('.', 1)[1] for module in sys.modules if
+                      module.startswith(f'{LAZY_CHECKS_PACKAGE}.LazyCheck'))
+
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(CHECKS_MANIFEST, generate_manifest(),
+                         f'The check manifest is out of date, regenerate it with {check_manifest.GENERATE_COMMAND}')
+
+    def test_checks_are_loaded_by_entity_type(self):
+        self.assertEqual([], self._loaded_checks())
+
+        checks = self.registry.get_checks('resource_a')
+        self.assertEqual(['CKV_LAZY_1', 'CKV_LAZY_3'], [check.id for check in checks])
+        self.assertEqual(['LazyCheckA', 'LazyCheckWildcard'], self._loaded_checks())
+
+        checks = self.registry.get_checks('resource_b')
+        self.assertEqual(['CKV_LAZY_1', 'CKV_LAZY_2', 'CKV_LAZY_3'], [check.id for check in checks])
+
+    def test_checks_keep_the_manifest_order(self):
+        self.registry.get_checks('resource_b', RunnerFilter(checks=['CKV_LAZY_2']))
+        self.registry.get_checks('resource_a')
+        checks = self.registry.get_checks('resource_b')
+        self.assertEqual(['CKV_LAZY_1', 'CKV_LAZY_2', 'CKV_LAZY_3'], [check.id for check in checks])
+
+    def test_filtered_checks_are_not_loaded(self):
+        checks = self.registry.get_checks('resource_b', RunnerFilter(skip_checks=['CKV_LAZY_1', 'CKV_LAZY_3']))
+        self.assertEqual(['CKV_LAZY_2'], [check.id for check in checks])
+        self.assertEqual(['LazyCheckB'], self._loaded_checks())
+
+    def test_all_checks_are_loaded_on_demand(self):
+        self.assertEqual('CKV_LAZY_2', self.registry.get_check_by_id('CKV_LAZY_2').id)
+        self.assertEqual(['LazyCheckB'], self._loaded_checks())
+
+        self.assertEqual(['resource_a', 'resource_b'], sorted(self.registry.checks))
+        self.assertEqual(['LazyCheckA', 'LazyCheckB', 'LazyCheckWildcard'], self._loaded_checks())
+
+
+if __name__ == '__main__':
+    unittest.main()
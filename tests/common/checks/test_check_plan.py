@@ -0,0 +1,72 @@
+import unittest
+from unittest import mock
+
+from checkov.common.checks.base_check_registry import BaseCheckRegistry
+from checkov.common.checks.check_plan import CheckPlan, get_check_plan
+from checkov.runner_filter import RunnerFilter
+from tests.common.checks.test_base_check_registry import TestCheck
+
+
+class TestCheckPlan(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = BaseCheckRegistry()
+        self.resource_1_check = TestCheck("resource_1", id="CKV_T_1")
+        self.resource_s_check = TestCheck("resource_*", id="CKV_T_2")
+        self.s_check = TestCheck("*", id="CKV_T_3")
+        for check in (self.resource_1_check, self.resource_s_check, self.s_check):
+            self.registry.register(check)
+
+    def test_get_checks(self):
+        check_plan = CheckPlan(RunnerFilter())
+        self.assertEqual((self.resource_1_check, self.resource_s_check, self.s_check),
+                         check_plan.get_checks(self.registry, "resource_1"))
+        self.assertEqual((self.s_check,), check_plan.get_checks(self.registry, "other"))
+
+    def test_get_checks_filtered(self):
+        check_plan = CheckPlan(RunnerFilter(checks="CKV_T_1,CKV_T_3"))
+        self.assertEqual((self.resource_1_check, self.s_check), check_plan.get_checks(self.registry, "resource_1"))
+
+        check_plan = CheckPlan(RunnerFilter(skip_checks=["CKV_T_3"]))
+        self.assertEqual((self.resource_1_check, self.resource_s_check),
+                         check_plan.get_checks(self.registry, "resource_1"))
+
+    def test_get_checks_compiled_once_per_entity_type(self):
+        check_plan = CheckPlan(RunnerFilter())
+        with mock.patch.object(self.registry, "compile_checks",
+                               wraps=self.registry.compile_checks) as compile_checks:
+            checks = check_plan.get_checks(self.registry, "resource_2")
+            self.assertIs(checks, check_plan.get_checks(self.registry, "resource_2"))
+            check_plan.get_checks(self.registry, "resource_3")
+        self.assertEqual(2, compile_checks.call_count)
+
+    def test_should_run_check(self):
+        check_plan = CheckPlan(RunnerFilter(checks=["CKV_T_1"]))
+        self.assertTrue(check_plan.should_run_check("CKV_T_1"))
+        self.assertFalse(check_plan.should_run_check("CKV_T_2"))
+        with mock.patch.object(RunnerFilter, "is_external_check", return_value=True):
+            self.assertTrue(check_plan.should_run_check("CKV_EXT_1"))
+
+        check_plan = CheckPlan(RunnerFilter(skip_checks=["CKV_T_1"]))
+        self.assertFalse(check_plan.should_run_check("CKV_T_1"))
+        self.assertTrue(check_plan.should_run_check("CKV_T_2"))
+
+    def test_namespaces(self):
+        check_plan = CheckPlan(RunnerFilter(checks=["CKV_K8S_1", "default"]))
+        self.assertEqual(frozenset(["default"]), check_plan.allowed_namespaces)
+        self.assertTrue(check_plan.allows_check_ids)
+
+        check_plan = CheckPlan(RunnerFilter(checks=["default"]))
+        self.assertFalse(check_plan.allows_check_ids)
+
+    def test_get_check_plan(self):
+        runner_filter = RunnerFilter()
+        check_plan = get_check_plan(runner_filter)
+        self.assertIsNot(check_plan, get_check_plan(runner_filter))
+
+        runner_filter.check_plan = check_plan
+        self.assertIs(check_plan, get_check_plan(runner_filter))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+from checkov.common.checks.base_check_registry import BaseCheckRegistry
+from checkov.common.checks.conf_columns import ConfColumns, MISSING
+from checkov.common.models.enums import CheckResult
+from checkov.runner_filter import RunnerFilter
+from tests.common.checks.test_base_check_registry import TestCheck
+
+
+class TestBatchCheck(TestCheck):
+
+    def scan_entity_conf(self, conf, entity_type):
+        return CheckResult.PASSED if conf.get("enabled") == [True] else CheckResult.FAILED
+
+    def scan_batch(self, confs):
+        return [CheckResult.PASSED if enabled == [True] else CheckResult.FAILED for enabled in
+                confs.column("enabled")]
+
+
+class TestScanCheck(TestCheck):
+
+    def scan_entity_conf(self, conf, entity_type):
+        return CheckResult.PASSED
+
+
+class TestRegistry(BaseCheckRegistry):
+
+    def extract_entity_details(self, entity):
+        entity_type, entity_name, entity_configuration = entity
+        return entity_type, entity_name, entity_configuration
+
+
+class TestConfColumns(unittest.TestCase):
+
+    def setUp(self):
+        self.confs = ConfColumns([{"name": ["a"], "tags": [{"env": "dev"}]},
+                                  {"name": ["b"]},
+                                  {"tags": [{"env": "prod"}]}], "resource")
+
+    def test_column(self):
+        self.assertEqual([["a"], ["b"], MISSING], self.confs.column("name"))
+        self.assertEqual(["dev", MISSING, "prod"], self.confs.column("tags/0/env"))
+        self.assertEqual(["dev", None, "prod"], self.confs.column(("tags", 0, "env"), None))
+
+    def test_column_extracted_once(self):
+        self.assertIs(self.confs.column("name"), self.confs.column(("name",)))
+
+    def test_select(self):
+        selected = self.confs.select([0, 2])
+        self.assertEqual(2, len(selected))
+        self.assertEqual("resource", selected.entity_type)
+        self.assertEqual([["a"], MISSING], selected.column("name"))
+
+
+class TestScanEntities(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = TestRegistry()
+        self.batch_check = TestBatchCheck("resource_1", "resource_2", id="CKV_T_1")
+        self.scan_check = TestScanCheck("resource_2", id="CKV_T_2")
+        self.registry.register(self.batch_check)
+        self.registry.register(self.scan_check)
+
+    def test_scan_entities_same_as_scan(self):
+        entities = [
+            ("main.tf", ("resource_1", "a", {"enabled": [True]}), None),
+            ("main.tf", ("resource_2", "b", {"enabled": [False]}), None),
+            ("main.tf", ("resource_1", "c", {}), [{"id": "CKV_T_1", "suppress_comment": "no"}]),
+            ("main.tf", ("resource_2", "d", {"enabled": [True]}), [{"id": "CKV_T_2", "suppress_comment": "no"}]),
+        ]
+        entities = [(scanned_file, entity, {skip["id"]: skip for skip in skipped_checks or []}) for
+                    scanned_file, entity, skipped_checks in entities]
+        runner_filter = RunnerFilter()
+        expected = [self.registry.scan(scanned_file, entity, skipped_checks, runner_filter) for
+                    scanned_file, entity, skipped_checks in entities]
+        self.assertEqual(expected, self.registry.scan_entities(entities, runner_filter))
+        self.assertEqual(CheckResult.SKIPPED, expected[2][self.batch_check]["result"])
+        self.assertEqual([self.batch_check, self.scan_check], list(expected[1]))
+
+    def test_scan_batch_wrong_result_count(self):
+        self.batch_check.scan_batch = lambda confs: []
+        with self.assertRaises(ValueError):
+            self.registry.scan_entities([("main.tf", ("resource_1", "a", {}), None)], RunnerFilter())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from checkov.common.comment.suppression_index import SuppressionIndex, parse_skip_comment
+
+file_content = '''resource "aws_s3_bucket" "bucket" {
+  #checkov:skip=CKV_AWS_52
+  #checkov:skip=CKV_AWS_20:The bucket is a public static content host
+  bucket = "my-bucket"
+}
+
+resource "aws_s3_bucket" "other" {
+  # bridgecrew:skip=CKV_AWS_18: Logging is not needed
+  # checkov:skip=CKV_AWS_18:Duplicated
+  bucket = "skip=the-bucket"
+}
+'''
+
+
+class TestSuppressionIndex(unittest.TestCase):
+
+    def setUp(self):
+        file_lines = [(ind + 1, line) for (ind, line) in enumerate(file_content.splitlines(keepends=True))]
+        self.suppression_index = SuppressionIndex(file_lines)
+
+    def test_parse_skip_comment(self):
+        self.assertEqual({'id': 'CKV_AWS_20', 'suppress_comment': 'Public bucket'},
+                         parse_skip_comment('# checkov:skip=CKV_AWS_20:Public bucket'))
+        self.assertEqual({'id': 'CKV_AWS_52', 'suppress_comment': 'No comment provided'},
+                         parse_skip_comment('#checkov:skip=CKV_AWS_52\n'))
+        self.assertIsNone(parse_skip_comment('bucket = "my-bucket"'))
+
+    def test_get_skipped_checks(self):
+        self.assertEqual({
+            'CKV_AWS_52': {'id': 'CKV_AWS_52', 'suppress_comment': 'No comment provided'},
+            'CKV_AWS_20': {'id': 'CKV_AWS_20', 'suppress_comment': 'The bucket is a public static content host'}
+        }, self.suppression_index.get_skipped_checks(1, 5))
+
+    def test_get_skipped_checks_first_comment_wins(self):
+        self.assertEqual({'CKV_AWS_18': {'id': 'CKV_AWS_18', 'suppress_comment': ' Logging is not needed'}},
+                         self.suppression_index.get_skipped_checks(7, 11))
+
+    def test_get_skipped_checks_range(self):
+        self.assertEqual(['CKV_AWS_20'], list(self.suppression_index.get_skipped_checks(3, 3)))
+        self.assertEqual({}, self.suppression_index.get_skipped_checks(4, 7))
+        self.assertEqual({}, self.suppression_index.get_skipped_checks(5, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
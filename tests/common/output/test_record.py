@@ -0,0 +1,73 @@
+import copy
+import pickle
+import unittest
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+
+RECORD_KEYS = ['check_id', 'check_name', 'check_result', 'code_block', 'file_path', 'file_line_range', 'resource',
+               'evaluations', 'check_class']
+
+
+def _create_record(check_result):
+    return Record(check_id='CKV_T_1', check_name='check', check_result=check_result,
+                  code_block=[(1, 'resource "a" "b" {\n')], file_path='/main.tf', file_line_range=[1, 3],
+                  resource='a.b', evaluations=None, check_class='checks.check')
+
+
+class TestRecord(unittest.TestCase):
+
+    def test_compact_record(self):
+        record = _create_record({'result': CheckResult.FAILED})
+        self.assertFalse(hasattr(type(record), '__weakref__'))
+        with self.assertRaises(AttributeError):
+            record.unknown_attribute = 1
+        self.assertIs(CheckResult.FAILED, record.result)
+        self.assertIsNone(record.suppress_comment)
+
+    def test_check_result(self):
+        record = _create_record({'result': CheckResult.FAILED})
+        self.assertEqual({'result': CheckResult.FAILED}, record.check_result)
+        record.check_result = {'result': CheckResult.SKIPPED, 'suppress_comment': 'unused'}
+        self.assertEqual({'result': CheckResult.SKIPPED, 'suppress_comment': 'unused'}, record.check_result)
+        self.assertEqual('unused', record.suppress_comment)
+        self.assertIn('Suppress comment: unused', str(record))
+
+    def test_check_result_written_back(self):
+        record = _create_record({'result': CheckResult.FAILED})
+        check_result = record.check_result
+        check_result['result'] = CheckResult.SKIPPED
+        check_result['suppress_comment'] = 'unused'
+        self.assertIs(CheckResult.SKIPPED, record.result)
+        self.assertEqual('unused', record.suppress_comment)
+        self.assertEqual({'result': CheckResult.SKIPPED, 'suppress_comment': 'unused'}, check_result)
+        check_result.pop('suppress_comment')
+        self.assertIsNone(record.suppress_comment)
+        self.assertEqual(['result'], list(record.check_result))
+        with self.assertRaises(KeyError):
+            check_result['unknown'] = 1
+        with self.assertRaises(KeyError):
+            del check_result['result']
+
+    def test_dict(self):
+        record = _create_record({'result': CheckResult.PASSED})
+        self.assertEqual(RECORD_KEYS, list(record.get_dict()))
+        self.assertEqual(record.get_dict(), vars(record))
+        self.assertIs(dict, type(record.get_dict()['check_result']))
+        # the dicts are copies of the record's attributes
+        vars(record)['check_result']['result'] = CheckResult.FAILED
+        self.assertIs(CheckResult.PASSED, record.result)
+        record.set_guideline('https://guide')
+        self.assertEqual(RECORD_KEYS + ['guideline'], list(record.get_dict()))
+        self.assertEqual('https://guide', record.get_dict()['guideline'])
+
+    def test_pickled_and_copied(self):
+        record = _create_record({'result': CheckResult.SKIPPED, 'suppress_comment': 'unused'})
+        record.set_guideline('https://guide')
+        for record_copy in (pickle.loads(pickle.dumps(record)), copy.copy(record), copy.deepcopy(record)):
+            self.assertEqual(record.get_dict(), record_copy.get_dict())
+        self.assertIs(record.check_id, pickle.loads(pickle.dumps(record)).check_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import unittest
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+from checkov.common.output.record_spool import RecordSpool
+from checkov.common.runners.runner_registry import RunnerRegistry
+from checkov.common.util.banner import banner
+from checkov.cloudformation.runner import Runner as cfn_runner
+from checkov.kubernetes.runner import Runner as k8_runner
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.runner import Runner as tf_runner
+
+
+def _create_record(index):
+    return Record(check_id=f'CKV_T_{index}', check_name='check', check_result={'result': CheckResult.FAILED},
+                  code_block=[(1, 'resource "a" "b" {\n')], file_path='/main.tf', file_line_range=[1, 3],
+                  resource=f'a.b{index}', evaluations={'var.x': {'value': index}}, check_class='checks.check')
+
+
+class TestRecordSpool(unittest.TestCase):
+
+    def test_records_in_order(self):
+        spool = RecordSpool(batch_size=3)
+        records = [_create_record(index) for index in range(8)]
+        spool.extend(records)
+        self.assertEqual(8, len(spool))
+        self.assertEqual([record.get_dict() for record in records], [record.get_dict() for record in spool])
+        # iterated again, and interleaved with another iteration
+        iterator = iter(spool)
+        self.assertEqual(['a.b0', 'a.b1', 'a.b2', 'a.b3'],
+                         [next(iterator).resource for _ in range(4)])
+        self.assertEqual(8, len(list(spool)))
+        self.assertEqual(['a.b4', 'a.b5', 'a.b6', 'a.b7'], [record.resource for record in iterator])
+
+    def test_empty(self):
+        spool = RecordSpool()
+        self.assertEqual(0, len(spool))
+        self.assertFalse(spool)
+        self.assertEqual([], list(spool))
+
+    def test_concatenation(self):
+        spool = RecordSpool(batch_size=1)
+        spool.append(_create_record(0))
+        record = _create_record(1)
+        self.assertEqual(['a.b0', 'a.b1'], [r.resource for r in spool + [record]])
+        self.assertEqual(['a.b1', 'a.b0'], [r.resource for r in [record] + spool])
+
+    def test_spooled_reports(self):
+        test_files_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+                                      'runner_registry', 'example_multi_iac')
+        reports_dicts = []
+        for spool_records in (False, True):
+            runner_registry = RunnerRegistry(banner, RunnerFilter(), tf_runner(), cfn_runner(), k8_runner())
+            runner_registry.spool_records = spool_records
+            reports = runner_registry.run(root_folder=test_files_dir, guidelines={'CKV_AWS_21': 'https://guide'})
+            reports_dicts.append([report.get_dict() for report in reports])
+            if spool_records:
+                self.assertIsInstance(reports[0].passed_checks, RecordSpool)
+        self.assertEqual(reports_dicts[0], reports_dicts[1])
+        self.assertIn('https://guide', [record.get('guideline') for report_dict in reports_dicts[1]
+                                        for record in report_dict['results']['failed_checks']])
+
+
+if __name__ == '__main__':
+    unittest.main()
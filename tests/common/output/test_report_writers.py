@@ -0,0 +1,68 @@
+import io
+import json
+import os
+import unittest
+import warnings
+
+import junit_xml
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+from checkov.common.output.report import Report
+from checkov.common.output.report_writers import JsonReportWriter, JunitXmlReportWriter
+from checkov.common.runners.runner_registry import RunnerRegistry
+from checkov.common.util.banner import banner
+from checkov.cloudformation.runner import Runner as cfn_runner
+from checkov.kubernetes.runner import Runner as k8_runner
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.runner import Runner as tf_runner
+
+
+def _create_report(check_type, resource):
+    report = Report(check_type)
+    for index, result in enumerate([CheckResult.PASSED, CheckResult.FAILED, CheckResult.SKIPPED, CheckResult.FAILED]):
+        check_result = {'result': result}
+        if result == CheckResult.SKIPPED:
+            check_result['suppress_comment'] = 'not <needed>\r\n& "unused"\r'
+        report.add_record(Record(check_id=f'CKV_T_{index % 2}', check_name=f'check {index % 2}',
+                                 check_result=check_result, code_block=[(1, 'resource "a" "b" {\n')],
+                                 file_path='/main.tf', file_line_range=[1, 3], resource=resource, evaluations=None,
+                                 check_class='' if index == 3 else 'checks.check'))
+    report.add_parsing_error('/broken.tf')
+    return report
+
+
+class TestReportWriters(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        test_files_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+                                      'runner_registry', 'example_multi_iac')
+        runner_registry = RunnerRegistry(banner, RunnerFilter(), tf_runner(), cfn_runner(), k8_runner())
+        cls.scan_reports = runner_registry.run(root_folder=test_files_dir)
+        cls.reports = cls.scan_reports + [_create_report('terraform', 'a.b\t<c>\x01é'), Report('empty')]
+
+    def test_json_same_as_dumped(self):
+        for reports in ([], self.reports[:1], self.reports):
+            output = io.StringIO()
+            JsonReportWriter(output).write(reports)
+            self.assertEqual(json.dumps(RunnerRegistry.get_json_output(reports), indent=4), output.getvalue())
+
+    def test_json_report_same_as_dumped(self):
+        for report in self.reports:
+            output = io.StringIO()
+            JsonReportWriter(output).write_report(report)
+            self.assertEqual(report.get_json(), output.getvalue())
+
+    def test_junit_xml_same_as_junit_xml(self):
+        for report in self.reports:
+            output = io.StringIO()
+            JunitXmlReportWriter(output).write(report)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', DeprecationWarning)
+                expected = junit_xml.TestSuite.to_xml_string(report.get_test_suites())
+            self.assertEqual(expected, output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
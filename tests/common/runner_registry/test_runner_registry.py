@@ -1,8 +1,10 @@
+import argparse
 import os
 import unittest
 
 from unittest import mock
 
+from checkov.common.models.enums import CheckResult
 from checkov.common.runners.runner_registry import RunnerRegistry
 from checkov.runner_filter import RunnerFilter
 from checkov.terraform.runner import Runner as tf_runner
@@ -22,6 +24,33 @@ class TestRunnerRegistry(unittest.TestCase):
         for report in reports:
             self.assertGreater(len(report.passed_checks), 1)
 
+    def test_failed_only_results(self):
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        test_files_dir = current_dir + "/example_multi_iac"
+        reports = RunnerRegistry(banner, RunnerFilter(), tf_runner(), cfn_runner(), k8_runner()).run(
+            root_folder=test_files_dir)
+        runner_registry = RunnerRegistry(banner, RunnerFilter(), tf_runner(), cfn_runner(), k8_runner())
+        runner_registry.recorded_results = {CheckResult.FAILED}
+        failed_only_reports = runner_registry.run(root_folder=test_files_dir)
+        self.assertIsNone(runner_registry.runner_filter.recorded_results)
+        for report, failed_only_report in zip(reports, failed_only_reports):
+            self.assertEqual(report.get_summary(), failed_only_report.get_summary())
+            self.assertEqual([record.get_dict() for record in report.failed_checks],
+                             [record.get_dict() for record in failed_only_report.failed_checks])
+            self.assertEqual([], failed_only_report.passed_checks)
+            self.assertFalse(failed_only_report.is_empty())
+
+    def test_recorded_results_of_output(self):
+        def get_recorded_results(output, quiet=False):
+            return RunnerRegistry.get_recorded_results(argparse.Namespace(output=output, quiet=quiet))
+
+        self.assertEqual({CheckResult.FAILED}, get_recorded_results('github_failed_only'))
+        self.assertEqual({CheckResult.FAILED}, get_recorded_results('cli', quiet=True))
+        self.assertEqual({CheckResult.FAILED}, get_recorded_results(None, quiet=True))
+        self.assertIsNone(get_recorded_results('cli'))
+        self.assertIsNone(get_recorded_results('json', quiet=True))
+        self.assertIsNone(get_recorded_results('junitxml', quiet=True))
+
     def test_empty_tf(self):
         current_dir = os.path.dirname(os.path.realpath(__file__))
         test_files_dir = current_dir + "/example_empty_tf"
@@ -0,0 +1,58 @@
+import unittest
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+from checkov.common.output.report import Report
+from checkov.common.runners.base_runner import BaseRunner
+from checkov.common.runners.runner_registry import RunnerRegistry
+from checkov.common.util.banner import banner
+from checkov.runner_filter import RunnerFilter
+
+
+def _create_record(check_id, result):
+    return Record(check_id=check_id, check_name='check', check_result={'result': result},
+                  code_block=[(1, 'resource "a" "b" {\n')], file_path='/main.tf', file_line_range=[1, 3],
+                  resource='a.b', evaluations=None, check_class='checks.check')
+
+
+class CustomRunner(BaseRunner):
+    """
+    Runner implementing run, with the parameters of the runners before run_records
+    """
+    check_type = 'custom'
+
+    def run(self, root_folder, external_checks_dir=None, files=None, runner_filter=RunnerFilter(),
+            collect_skip_comments=True):
+        report = Report(self.check_type)
+        report.add_record(_create_record('CKV_C_1', CheckResult.PASSED))
+        report.add_record(_create_record('CKV_C_2', CheckResult.FAILED))
+        report.add_parsing_error('/broken.tf')
+        return report
+
+
+class TestBaseRunner(unittest.TestCase):
+
+    def test_runner_implementing_run(self):
+        parsing_errors = []
+        records = list(CustomRunner().run_records('.', parsing_errors=parsing_errors))
+        self.assertEqual(['CKV_C_1', 'CKV_C_2'], [record.check_id for record in records])
+        self.assertEqual(['/broken.tf'], parsing_errors)
+
+    def test_registry_runs_runner_implementing_run(self):
+        runner_registry = RunnerRegistry(banner, RunnerFilter(), CustomRunner())
+        reports = runner_registry.run(root_folder=None, files=['/main.tf'], guidelines={'CKV_C_2': 'https://guide'})
+        self.assertEqual(1, len(reports))
+        self.assertEqual(['CKV_C_1'], [record.check_id for record in reports[0].passed_checks])
+        self.assertEqual(['https://guide'], [record.guideline for record in reports[0].failed_checks])
+        self.assertEqual(['/broken.tf'], reports[0].parsing_errors)
+
+    def test_runner_implementing_neither(self):
+        runner = type('Runner', (BaseRunner,), {})()
+        with self.assertRaises(NotImplementedError):
+            runner.run('.')
+        with self.assertRaises(NotImplementedError):
+            list(runner.run_records('.'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import os
+import unittest
+
+from git import Actor, Repo
+
+from checkov.common.runners.diff_scope import DiffScope
+from checkov.common.runners.file_discovery import FileDiscovery
+from checkov.common.runners.runner_registry import RunnerRegistry
+from checkov.common.util.banner import banner
+from checkov.kubernetes.runner import Runner as k8_runner
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.context_parsers.registry import parser_registry
+from checkov.terraform.runner import Runner as tf_runner
+from tests.common.temp_files import make_temp_dir, write_file
+
+buckets = '''resource "aws_s3_bucket" "first" {
+  bucket = var.name
+  acl    = "private"
+}
+
+resource "aws_s3_bucket" "second" {
+  bucket = "second"
+  acl    = "private"
+}
+'''
+
+# the buckets, with the second bucket's acl changed
+public_buckets = buckets.replace('"second"\n  acl    = "private"', '"second"\n  acl    = "public"')
+
+pod = '''apiVersion: v1
+kind: Pod
+metadata:
+  name: pod
+spec:
+  containers:
+    - name: main
+      image: nginx
+'''
+
+diff = '''diff --git a/app/main.tf b/app/main.tf
+index 1111111..2222222 100644
+--- a/app/main.tf
++++ b/app/main.tf
+@@ -8 +8,2 @@ resource "aws_s3_bucket" "second" {
+-  acl    = "private"
++  acl    = "public-read"
++  force_destroy = true
+@@ -12,0 +14 @@ resource "aws_s3_bucket" "second" {
++# comment
+@@ -20,2 +21,0 @@ resource "aws_s3_bucket" "second" {
+-# removed
+-# removed
+diff --git a/app/old.tf b/app/old.tf
+deleted file mode 100644
+--- a/app/old.tf
++++ /dev/null
+@@ -1 +0,0 @@
+-# old
+'''
+
+
+class TestDiffScope(unittest.TestCase):
+
+    def setUp(self):
+        self.repo_dir = make_temp_dir(self)
+        self.repo = Repo.init(self.repo_dir)
+        write_file(self.repo_dir, 'app/main.tf', buckets)
+        write_file(self.repo_dir, 'app/variables.tf', 'variable "name" {\n  default = "first"\n}\n')
+        write_file(self.repo_dir, 'other/main.tf', buckets)
+        write_file(self.repo_dir, 'k8s/pod.yaml', pod)
+        self.repo.index.add(['app/main.tf', 'app/variables.tf', 'other/main.tf', 'k8s/pod.yaml'])
+        author = Actor('test', 'test@example.com')
+        self.repo.index.commit('base', author=author, committer=author)
+        self.repo.create_head('base')
+        parser_registry.reset_definitions_context()
+
+    def tearDown(self):
+        parser_registry.reset_definitions_context()
+
+    def test_parse_diff(self):
+        changed_lines = DiffScope.parse_diff(diff, '/repo')
+        self.assertEqual({'/repo/app/main.tf': [(8, 9), (14, 14), (21, 22)]}, changed_lines)
+
+    def test_parse_diff_quoted_paths(self):
+        quoted_diff = '''--- a/my dir/main.tf\t
++++ b/my dir/main.tf\t
+@@ -2 +2 @@
+--- "a/\\303\\251t\\303\\251.tf"
++++ "b/\\303\\251t\\303\\251.tf"
+@@ -3 +3 @@
+--- "a/quote\\"d\\ttab.tf"
++++ "b/quote\\"d\\ttab.tf"
+@@ -4 +4 @@
+'''
+        changed_lines = DiffScope.parse_diff(quoted_diff, '/repo')
+        self.assertEqual({'/repo/my dir/main.tf': [(2, 2)], '/repo/\u00e9t\u00e9.tf': [(3, 3)],
+                          '/repo/quote"d\ttab.tf': [(4, 4)]}, changed_lines)
+
+    def test_scope_of_paths_git_quotes(self):
+        write_file(self.repo_dir, 'my dir/main.tf', buckets)
+        write_file(self.repo_dir, '\u00e9t\u00e9/main.tf', buckets)
+        self.repo.index.add(['my dir/main.tf', '\u00e9t\u00e9/main.tf'])
+        author = Actor('test', 'test@example.com')
+        self.repo.index.commit('quoted', author=author, committer=author)
+        for path in ('my dir/main.tf', '\u00e9t\u00e9/main.tf'):
+            write_file(self.repo_dir, path, public_buckets)
+
+        diff_scope = DiffScope(self.repo_dir, 'HEAD').load()
+        for path in ('my dir/main.tf', '\u00e9t\u00e9/main.tf'):
+            self.assertEqual([(8, 8)], diff_scope.changed_lines[os.path.join(self.repo_dir, path)])
+        self.assertEqual({os.path.join(self.repo_dir, path) for path in ('my dir/main.tf', '\u00e9t\u00e9/main.tf')},
+                         diff_scope.get_scope(FileDiscovery(self.repo_dir)))
+
+    def test_scope(self):
+        write_file(self.repo_dir, 'app/main.tf', public_buckets)
+        write_file(self.repo_dir, 'k8s/new.yaml', pod)
+        diff_scope = DiffScope(self.repo_dir, 'base').load()
+        scope = diff_scope.get_scope(FileDiscovery(self.repo_dir))
+        self.assertEqual({os.path.join(self.repo_dir, path) for path in
+                          ['app/main.tf', 'app/variables.tf', 'k8s/new.yaml']}, scope)
+        self.assertEqual([(8, 8)], diff_scope.changed_lines[os.path.join(self.repo_dir, 'app/main.tf')])
+        self.assertIsNone(diff_scope.changed_lines[os.path.join(self.repo_dir, 'k8s/new.yaml')])
+
+    def test_serverless_including_a_changed_file(self):
+        write_file(self.repo_dir, 'sls/serverless.yml',
+                   'service: app\nprovider:\n  name: aws\ncustom: ${file(./config.yml)}\n')
+        write_file(self.repo_dir, 'sls/config.yml', 'stage: dev\n')
+        self.repo.index.add(['sls/serverless.yml', 'sls/config.yml'])
+        author = Actor('test', 'test@example.com')
+        self.repo.index.commit('serverless', author=author, committer=author)
+        write_file(self.repo_dir, 'sls/config.yml', 'stage: prod\n')
+
+        diff_scope = DiffScope(self.repo_dir, 'HEAD').load()
+        scope = diff_scope.get_scope(FileDiscovery(self.repo_dir))
+        sls_file = os.path.join(self.repo_dir, 'sls/serverless.yml')
+        self.assertIn(sls_file, scope)
+        self.assertIsNone(diff_scope.changed_lines[sls_file])
+
+    def test_reports_are_limited_to_changed_entities(self):
+        write_file(self.repo_dir, 'app/main.tf', public_buckets)
+        runner_registry = RunnerRegistry(banner, RunnerFilter(), tf_runner(), k8_runner())
+        reports = runner_registry.run(root_folder=self.repo_dir, diff_base='base')
+
+        tf_report, k8_report = reports
+        records = tf_report.passed_checks + tf_report.failed_checks + tf_report.skipped_checks
+        self.assertTrue(records)
+        self.assertEqual({('/app/main.tf', 'aws_s3_bucket.second')},
+                         {(record.file_path, record.resource) for record in records})
+        self.assertFalse(k8_report.passed_checks + k8_report.failed_checks)
+
+
+if __name__ == '__main__':
+    unittest.main()
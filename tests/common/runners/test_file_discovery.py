@@ -0,0 +1,55 @@
+import os
+import unittest
+
+from checkov.common.runners.base_runner import filter_ignored_directories
+from checkov.common.runners.file_discovery import FileDiscovery
+from tests.common.temp_files import make_temp_dir, write_file
+
+
+class TestFileDiscovery(unittest.TestCase):
+
+    def setUp(self):
+        self.root_folder = make_temp_dir(self)
+        for file_path in ['main.tf', 'template.yaml', 'serverless.yml', 'modules/vpc/main.tf', 'modules/vpc/vars.json',
+                          'k8s/deployment.yaml', 'node_modules/package/serverless.yml', 'node_modules/package/index.tf',
+                          '.terraform/modules/module.tf']:
+            write_file(self.root_folder, file_path, '')
+        os.symlink(os.path.join(self.root_folder, 'modules'), os.path.join(self.root_folder, 'linked_modules'))
+
+    def _os_walk_files(self, file_filter, filter_ignored=True):
+        files = []
+        for root, d_names, f_names in os.walk(self.root_folder):
+            if filter_ignored:
+                filter_ignored_directories(d_names)
+            files.extend(os.path.join(root, file) for file in f_names if file_filter(file))
+        return files
+
+    def test_walk(self):
+        expected_walk = []
+        for root, d_names, f_names in os.walk(self.root_folder):
+            filter_ignored_directories(d_names)
+            expected_walk.append((root, f_names))
+        self.assertEqual(expected_walk, FileDiscovery(self.root_folder).walk())
+
+    def test_walk_rebased(self):
+        file_discovery = FileDiscovery(os.path.join(self.root_folder, '.'))
+        self.assertEqual([(self.root_folder, ['main.tf']), (os.path.join(self.root_folder, 'modules/vpc'), ['main.tf'])],
+                         [(root, [file for file in f_names if file.endswith('.tf')]) for root, f_names in
+                          file_discovery.walk(self.root_folder) if root == self.root_folder or root.endswith('vpc')])
+
+    def test_get_files(self):
+        file_discovery = FileDiscovery(self.root_folder)
+        self.assertEqual(self._os_walk_files(lambda file: os.path.splitext(file)[1] in ['.yaml', '.json']),
+                         file_discovery.get_files(extensions=['.yaml', '.json']))
+        self.assertEqual([os.path.join(self.root_folder, 'serverless.yml')],
+                         file_discovery.get_files(names=['serverless.yml']))
+
+    def test_get_files_include_ignored_directories(self):
+        files = FileDiscovery(self.root_folder).get_files(extensions=['.tf', '.yml'], include_ignored_directories=True)
+        self.assertEqual(sorted(self._os_walk_files(lambda file: os.path.splitext(file)[1] in ['.tf', '.yml'],
+                                                    filter_ignored=False)),
+                         sorted(files))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import unittest
+
+from checkov.common.runners.framework_sniffer import FrameworkSniffer, STRICT, AUDIT, OFF
+
+resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources', 'framework_sniffer')
+
+
+def _resource(name):
+    return os.path.join(resources_dir, name)
+
+
+class TestFrameworkSniffer(unittest.TestCase):
+
+    def test_strict(self):
+        sniffer = FrameworkSniffer(STRICT)
+        deployment = _resource('deployment.yaml')
+        template = _resource('template.json')
+        package_lock = _resource('package-lock.json')
+        self.assertTrue(sniffer.may_match(deployment, 'kubernetes'))
+        self.assertFalse(sniffer.may_match(deployment, 'cloudformation'))
+        self.assertTrue(sniffer.may_match(template, 'cloudformation'))
+        self.assertFalse(sniffer.may_match(template, 'arm'))
+        for framework in ['cloudformation', 'kubernetes', 'serverless', 'arm']:
+            self.assertFalse(sniffer.may_match(package_lock, framework))
+        self.assertTrue(sniffer.may_match(package_lock, 'terraform'))
+
+    def test_files_which_cant_be_searched_are_parsed(self):
+        sniffer = FrameworkSniffer(STRICT)
+        self.assertTrue(sniffer.may_match(_resource('utf16.yaml'), 'kubernetes'))
+        self.assertTrue(sniffer.may_match(_resource('missing.yaml'), 'kubernetes'))
+        self.assertFalse(sniffer.may_match(_resource('empty.yaml'), 'kubernetes'))
+
+    def test_audit_and_off(self):
+        escaped = _resource('escaped.json')
+        for mode in [AUDIT, OFF]:
+            self.assertTrue(FrameworkSniffer(mode).may_match(escaped, 'cloudformation'))
+
+        with self.assertLogs('checkov.common.runners.framework_sniffer', level='WARNING') as logs:
+            FrameworkSniffer(AUDIT).audit(escaped, 'cloudformation', True)
+        self.assertEqual(1, len(logs.output))
+        self.assertIn(escaped, logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
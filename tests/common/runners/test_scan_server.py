@@ -0,0 +1,107 @@
+import http.client
+import json
+import os
+import socket
+import threading
+import unittest
+
+from checkov.cloudformation.runner import Runner as cfn_runner
+from checkov.common.runners.runner_registry import RunnerRegistry
+from checkov.common.runners.scan_server import ScanService, create_server, EXIT_CODE_HEADER
+from checkov.common.util.banner import banner
+from checkov.common.util.line_store import line_store
+from checkov.kubernetes.runner import Runner as k8_runner
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.parser import Parser as tf_parser
+from checkov.terraform.runner import Runner as tf_runner
+from tests.common.temp_files import make_temp_dir
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+multi_iac_dir = os.path.realpath(os.path.join(current_dir, '..', 'runner_registry', 'example_multi_iac'))
+
+
+def create_runner_registry(runner_filter):
+    return RunnerRegistry(banner, runner_filter, tf_runner(parser=tf_parser()), cfn_runner(), k8_runner())
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, socket_path):
+        super().__init__('localhost')
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+class TestScanServer(unittest.TestCase):
+
+    def _start(self, address):
+        server = create_server(address, ScanService(create_runner_registry))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    @staticmethod
+    def _request(connection, method, path, body=None):
+        connection.request(method, path, body=json.dumps(body) if body is not None else None)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read()), response.getheader(EXIT_CODE_HEADER)
+
+    def test_scans_are_served_over_http(self):
+        server = self._start('localhost:0')
+        connection = http.client.HTTPConnection('localhost', server.server_address[1])
+
+        status, health, _ = self._request(connection, 'GET', '/health')
+        self.assertEqual(200, status)
+        self.assertEqual('ok', health['status'])
+
+        expected = RunnerRegistry.get_json_output(
+            create_runner_registry(RunnerFilter()).run(root_folder=multi_iac_dir))
+        # the same results are returned by consecutive scans
+        for _ in range(2):
+            status, output, exit_code = self._request(connection, 'POST', '/scan', {'directory': multi_iac_dir})
+            self.assertEqual(200, status)
+            self.assertEqual('1', exit_code)
+            self.assertEqual(json.loads(json.dumps(expected)), output)
+
+        status, output, exit_code = self._request(connection, 'POST', '/scan',
+                                                  {'directory': multi_iac_dir, 'framework': 'kubernetes',
+                                                   'soft_fail': True})
+        self.assertEqual('kubernetes', output['check_type'])
+        self.assertEqual('0', exit_code)
+
+    def test_scanned_files_are_released(self):
+        output, _ = ScanService(create_runner_registry).scan({'directory': multi_iac_dir})
+        self.assertTrue(output)
+        self.assertEqual(0, len(line_store))
+
+    def test_invalid_requests(self):
+        server = self._start('localhost:0')
+        connection = http.client.HTTPConnection('localhost', server.server_address[1])
+        self.assertEqual(400, self._request(connection, 'POST', '/scan', {})[0])
+        self.assertEqual(400, self._request(connection, 'POST', '/scan', {'files': 'main.tf'})[0])
+        status, output, exit_code = self._request(connection, 'POST', '/scan',
+                                                  {'directory': multi_iac_dir, 'framework': 'terrafrom'})
+        self.assertEqual(400, status)
+        self.assertIn('framework', output['error'])
+        self.assertIsNone(exit_code)
+        self.assertEqual(404, self._request(connection, 'POST', '/run', {'directory': multi_iac_dir})[0])
+
+    def test_scans_are_served_over_a_unix_socket(self):
+        socket_dir = make_temp_dir(self)
+        socket_path = os.path.join(socket_dir, 'checkov.sock')
+        self._start(socket_path)
+
+        status, output, _ = self._request(UnixHTTPConnection(socket_path), 'POST', '/scan',
+                                          {'files': [os.path.join(multi_iac_dir, 'k8', 'scope-PASSED.yaml')]})
+        self.assertEqual(200, status)
+        self.assertEqual('kubernetes', output['check_type'])
+
+
+if __name__ == '__main__':
+    unittest.main()
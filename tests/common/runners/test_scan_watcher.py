@@ -0,0 +1,107 @@
+import os
+import unittest
+
+from checkov.common.runners.runner_registry import RunnerRegistry
+from checkov.common.runners.scan_watcher import ScanWatcher
+from checkov.common.util.banner import banner
+from checkov.kubernetes.runner import Runner as k8_runner
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.parser import Parser as tf_parser
+from checkov.terraform.runner import Runner as tf_runner
+from tests.common.temp_files import make_temp_dir, write_file
+
+BUCKET = '''
+resource "aws_s3_bucket" "bucket" {
+  bucket = "watched"
+  acl    = var.acl
+}
+'''
+
+VARIABLES = '''
+variable "acl" {
+  default = "%s"
+}
+'''
+
+POD = '''apiVersion: v1
+kind: Pod
+metadata:
+  name: watched
+spec:
+  containers:
+    - name: app
+      image: nginx:1.19
+'''
+
+
+class TestScanWatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.root_folder = make_temp_dir(self)
+        self.scanned_files = []
+
+        def create_runner_registry(runner_filter):
+            registry = RunnerRegistry(banner, runner_filter, tf_runner(parser=tf_parser()), k8_runner())
+            run = registry.run
+
+            def recording_run(**kwargs):
+                scan_reports = run(**kwargs)
+                self.scanned_files.append(set(registry.file_discovery.get_files(extensions=['.tf', '.yaml'])))
+                return scan_reports
+            registry.run = recording_run
+            return registry
+
+        self.scan_watcher = ScanWatcher(self.root_folder, create_runner_registry, RunnerFilter(checks='CKV_AWS_20'))
+
+    def test_variable_change_rescans_its_folder_only(self):
+        main_file = write_file(self.root_folder, 'app/main.tf', BUCKET)
+        variables_file = write_file(self.root_folder, 'app/variables.tf', VARIABLES % 'private')
+        other_file = write_file(self.root_folder, 'other/main.tf', BUCKET + VARIABLES % 'public-read')
+        scan_reports = self.scan_watcher.scan()
+        self.assertEqual(1, len(scan_reports[0].failed_checks))
+
+        write_file(self.root_folder, 'app/variables.tf', VARIABLES % 'public-read')
+        deltas = self.scan_watcher.rescan({variables_file})
+        self.assertEqual({main_file, variables_file}, self.scanned_files[-1])
+        self.assertEqual(['terraform'], [delta.check_type for delta in deltas if not delta.is_empty()])
+        self.assertEqual([('CKV_AWS_20', '/app/main.tf')],
+                         [(record.check_id, record.file_path) for record in deltas[0].new_failed_checks])
+        self.assertEqual([], deltas[0].fixed_checks)
+
+        os.remove(other_file)
+        deltas = self.scan_watcher.rescan({other_file})
+        self.assertEqual(set(), self.scanned_files[-1])
+        self.assertEqual([], deltas[0].new_failed_checks)
+        self.assertEqual([('CKV_AWS_20', '/other/main.tf')],
+                         [(record.check_id, record.file_path) for record in deltas[0].fixed_checks])
+
+    def test_unchanged_failed_checks_are_not_reported(self):
+        main_file = write_file(self.root_folder, 'main.tf', BUCKET + VARIABLES % 'public-read')
+        self.scan_watcher.scan()
+
+        write_file(self.root_folder, 'main.tf', '\n\n' + BUCKET + VARIABLES % 'public-read')
+        deltas = self.scan_watcher.rescan({main_file})
+        self.assertTrue(all(delta.is_empty() for delta in deltas))
+
+    def test_changes_out_of_the_frameworks_are_not_scanned(self):
+        write_file(self.root_folder, 'main.tf', BUCKET + VARIABLES % 'private')
+        write_file(self.root_folder, 'pod.yaml', POD)
+        self.scan_watcher.scan()
+
+        readme_file = write_file(self.root_folder, 'README.md', 'watched')
+        self.assertEqual([], self.scan_watcher.rescan({readme_file}))
+        self.assertEqual(1, len(self.scanned_files))
+
+    def test_lost_changes_rescan_everything(self):
+        main_file = write_file(self.root_folder, 'main.tf', BUCKET + VARIABLES % 'private')
+        pod_file = write_file(self.root_folder, 'pod.yaml', POD)
+        self.scan_watcher.scan()
+
+        write_file(self.root_folder, 'main.tf', BUCKET + VARIABLES % 'public-read')
+        deltas = self.scan_watcher.rescan(None)
+        self.assertEqual({main_file, pod_file}, self.scanned_files[-1])
+        self.assertEqual(1, sum(len(delta.new_failed_checks) for delta in deltas))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+"""
+Temporary directories of the tests whose files are written or changed while they run (the static files of the tests
+are in their resources directories)
+"""
+import os
+import shutil
+import tempfile
+
+
+def make_temp_dir(test_case):
+    """
+    :param test_case: unittest.TestCase removing the directory when it is cleaned up
+    :return: real path of a new temporary directory
+    """
+    directory = os.path.realpath(tempfile.mkdtemp())
+    test_case.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+    return directory
+
+
+def write_file(directory, relative_path, content):
+    """
+    Write the content (str or bytes) to the file as is, creating its parent directories
+    :return: path of the file
+    """
+    file_path = os.path.join(directory, relative_path)
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    if isinstance(content, bytes):
+        with open(file_path, 'wb') as fp:
+            fp.write(content)
+    else:
+        with open(file_path, 'w', newline='') as fp:
+            fp.write(content)
+    return file_path
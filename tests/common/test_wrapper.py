@@ -0,0 +1,39 @@
+import json
+import unittest
+
+from checkov.common.bridgecrew.wrapper import reduce_scan_reports, _extract_checks_metadata
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+from checkov.common.output.report import Report
+
+
+class TestWrapper(unittest.TestCase):
+
+    def setUp(self):
+        self.report = Report('terraform')
+        for result in (CheckResult.PASSED, CheckResult.FAILED, CheckResult.SKIPPED):
+            check_result = {'result': result}
+            if result == CheckResult.SKIPPED:
+                check_result['suppress_comment'] = 'unused'
+            self.report.add_record(Record(check_id='CKV_T_1', check_name='check', check_result=check_result,
+                                          code_block=[(1, 'resource "a" "b" {\n')], file_path='/main.tf',
+                                          file_line_range=[1, 3], resource='a.b', evaluations=None,
+                                          check_class='checks.check'))
+
+    def test_reduced_scan_reports_are_json(self):
+        reduced_scan_reports = json.loads(json.dumps(reduce_scan_reports([self.report])))
+        checks = reduced_scan_reports['terraform']['checks']
+        self.assertEqual({'result': 'FAILED'}, checks['failed_checks'][0]['check_result'])
+        self.assertEqual({'result': 'SKIPPED', 'suppress_comment': 'unused'},
+                         checks['skipped_checks'][0]['check_result'])
+        self.assertEqual(['check_id', 'check_result', 'resource', 'file_path', 'file_line_range'],
+                         list(checks['passed_checks'][0]))
+
+    def test_checks_metadata_are_json(self):
+        checks_metadata = json.loads(json.dumps(_extract_checks_metadata(self.report, 'repo')))
+        self.assertEqual('repo/main.tf', checks_metadata['CKV_T_1']['file_object_path'])
+        self.assertEqual([[1, 'resource "a" "b" {\n']], checks_metadata['CKV_T_1']['code_block'])
+
+
+if __name__ == '__main__':
+    unittest.main()
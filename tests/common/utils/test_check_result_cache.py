@@ -0,0 +1,98 @@
+import unittest
+from unittest import mock
+
+from checkov.cloudformation.parser.node import dict_node, str_node
+from checkov.common.checks.base_check import BaseCheck
+from checkov.common.models.enums import CheckResult
+from checkov.common.util.check_result_cache import CheckResultCache
+from checkov.version import version
+from tests.common.temp_files import make_temp_dir
+
+
+class BucketVersioningCheck(BaseCheck):
+
+    def __init__(self):
+        super().__init__(name="Bucket versioning", id="CKV_T_1", categories=[], supported_entities=["bucket"],
+                         block_type="resource")
+        self.scanned_confs = []
+
+    def scan_entity_conf(self, conf, entity_type):
+        self.scanned_confs.append(conf)
+        return CheckResult.PASSED if conf.get('versioning') else CheckResult.FAILED
+
+
+class TestCheckResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = make_temp_dir(self)
+        self.check = BucketVersioningCheck()
+
+    def _new_cache(self):
+        cache = CheckResultCache(cache_dir=self.cache_dir)
+        cache.enabled = True
+        return cache
+
+    def test_unchanged_entities_are_not_scanned_again(self):
+        cache = self._new_cache()
+        self.assertEqual(CheckResult.PASSED, cache.get_or_scan(self.check, {'versioning': True}, 'bucket'))
+        self.assertEqual(CheckResult.FAILED, cache.get_or_scan(self.check, {'versioning': False}, 'bucket'))
+        cache.save()
+
+        cache = self._new_cache()
+        self.assertEqual(CheckResult.PASSED, cache.get_or_scan(self.check, {'versioning': True}, 'bucket'))
+        self.assertEqual(CheckResult.FAILED, cache.get_or_scan(self.check, {'versioning': False}, 'bucket'))
+        self.assertEqual(2, len(self.check.scanned_confs))
+
+        cache.get_or_scan(self.check, {'versioning': True}, 'other_bucket')
+        cache.get_or_scan(self.check, {'versioning': 'true'}, 'bucket')
+        cache.get_or_scan(self.check, {'versioning': 1}, 'bucket')
+        self.assertEqual(5, len(self.check.scanned_confs))
+
+    def test_fingerprint_ignores_line_numbers_and_node_classes(self):
+        cache = self._new_cache()
+        cache.get_or_scan(self.check, {'versioning': 'on', '__startline__': 1, '__endline__': 3}, 'bucket')
+        conf = dict_node({'versioning': str_node('on', None, None), '__startline__': 10, '__endline__': 12}, None, None)
+        cache.get_or_scan(self.check, conf, 'bucket')
+        self.assertEqual(1, len(self.check.scanned_confs))
+
+    def test_changed_check_source_or_version_invalidates(self):
+        cache = self._new_cache()
+        cache.get_or_scan(self.check, {'versioning': True}, 'bucket')
+        cache.save()
+
+        cache = self._new_cache()
+        with mock.patch.object(cache, '_get_source_hash', return_value='changed'):
+            cache.get_or_scan(self.check, {'versioning': True}, 'bucket')
+        self.assertEqual(2, len(self.check.scanned_confs))
+        cache.save()
+
+        with mock.patch('checkov.common.util.check_result_cache.version', f'{version}.1'):
+            cache = self._new_cache()
+            cache.get_or_scan(self.check, {'versioning': True}, 'bucket')
+        self.assertEqual(3, len(self.check.scanned_confs))
+
+    def test_least_recently_used_results_are_evicted(self):
+        cache = self._new_cache()
+        for i in range(100):
+            cache.get_or_scan(self.check, {'versioning': i}, 'bucket')
+        cache.save()
+
+        cache = self._new_cache()
+        cache.max_size = 2000
+        cache.get_or_scan(self.check, {'versioning': 99}, 'bucket')
+        cache.save()
+
+        cache = self._new_cache()
+        cache.get_or_scan(self.check, {'versioning': 99}, 'bucket')
+        self.assertEqual(100, len(self.check.scanned_confs))
+        self.assertLess(len(cache._entries), 100)
+
+    def test_disabled(self):
+        cache = CheckResultCache(cache_dir=self.cache_dir)
+        cache.get_or_scan(self.check, {'versioning': True}, 'bucket')
+        cache.get_or_scan(self.check, {'versioning': True}, 'bucket')
+        self.assertEqual(2, len(self.check.scanned_confs))
+
+
+if __name__ == '__main__':
+    unittest.main()
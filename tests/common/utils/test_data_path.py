@@ -0,0 +1,139 @@
+import unittest
+
+import dpath.util
+
+from checkov.common.util.data_path import compile_path, format_path, get_path, new_path, set_path, walk_leaves
+
+
+def _create_definitions(resources_count):
+    return {
+        'resource': [{'aws_s3_bucket': {f'bucket_{i}': {'acl': ['private'], 'versioning': [{'enabled': ['true']}],
+                                                        'tags': [{'Name': f'bucket-{i}'}], '+meta': ['true']}}}
+                     for i in range(resources_count)],
+        'provider': [{'aws': {'region': ['us-east-1'], 'alias': ['true']}}],
+    }
+
+
+class TestDataPath(unittest.TestCase):
+
+    def test_compile_path(self):
+        self.assertEqual(('a', 'b', '0'), compile_path('a/b/0'))
+        self.assertEqual(('a', 'b', '0'), compile_path('/a/b/0'))
+        self.assertEqual(('a', 'b'), compile_path(['a', 'b']))
+        self.assertEqual('a/b/0', format_path(('a', 'b', 0)))
+
+    def test_get_path(self):
+        obj = {'a': [{'b': 1}], '': {'c': 2}}
+        self.assertEqual(1, get_path(obj, 'a/0/b'))
+        self.assertEqual(1, get_path(obj, ('a', 0, 'b')))
+        self.assertEqual(2, get_path(obj, ('', 'c')))
+        self.assertIsNone(get_path(obj, 'a/1/b'))
+        self.assertIsNone(get_path(obj, 'a/x/b'))
+        self.assertIsNone(get_path(obj, 'a/0/b/c'))
+        self.assertEqual('default', get_path(obj, 'b', 'default'))
+
+    def test_set_path(self):
+        obj = {'a': [{'b': 1}, 'c'], 'keys/with/separators': 0}
+        self.assertTrue(set_path(obj, 'a/0/b', 2))
+        self.assertTrue(set_path(obj, 'a/1', 'd'))
+        self.assertFalse(set_path(obj, 'a/0/x', 3))
+        self.assertFalse(set_path(obj, 'a/2', 3))
+        self.assertEqual({'a': [{'b': 2}, 'd'], 'keys/with/separators': 0}, obj)
+
+    def test_new_path(self):
+        obj = {'a': {'b': 1}}
+        new_path(obj, ['a', 'c', 'd'], 2)
+        new_path(obj, 'a/b', 3)
+        new_path(obj, ('e', '*'), 4)
+        self.assertEqual({'a': {'b': 3, 'c': {'d': 2}}, 'e': {'*': 4}}, obj)
+
+    def test_walk_leaves_like_dpath(self):
+        definitions = _create_definitions(3)
+        expected = [(path, value) for path, value in
+                    dpath.util.search(definitions, '**', afilter=lambda x: True, yielded=True)]
+        leaves = [(format_path(path), value) for path, _, _, value in walk_leaves(definitions)]
+        self.assertEqual(expected, leaves)
+
+    def test_walk_leaves_replace(self):
+        definitions = _create_definitions(2)
+        for _, container, key, value in walk_leaves(definitions):
+            if value == 'true':
+                container[key] = True
+        self.assertEqual(True, get_path(definitions, 'resource/1/aws_s3_bucket/bucket_1/versioning/0/enabled/0'))
+        self.assertEqual(True, get_path(definitions, 'provider/0/aws/alias/0'))
+
+
+class TestDataPathLikeDpath(unittest.TestCase):
+    """
+    The accesses of the Terraform runner, context parsers and evaluation, against the dpath calls they replaced
+    """
+
+    resources_count = 50
+
+    def test_get_entity_context(self):
+        context = {'resource': {'aws_s3_bucket': {f'bucket_{i}': {'start_line': i} for i in
+                                                  range(self.resources_count)}}}
+        paths = [['resource', 'aws_s3_bucket', f'bucket_{i}'] for i in range(self.resources_count)]
+
+        def data_path():
+            return [get_path(context, path) for path in paths]
+
+        def dpath_path():
+            return [entity_context for path in paths for _, entity_context in
+                    dpath.search(context, path, yielded=True)]
+
+        self.assertEqual(dpath_path(), data_path())
+
+    def test_new_entity_context(self):
+        paths = [['aws_s3_bucket', f'bucket_{i}', 'start_line'] for i in range(self.resources_count)]
+
+        def data_path():
+            context = {}
+            for path in paths:
+                new_path(context, path, 1)
+            return context
+
+        def dpath_path():
+            context = {}
+            for path in paths:
+                dpath.new(context, path, 1)
+            return context
+
+        self.assertEqual(dpath_path(), data_path())
+
+    def test_set_evaluated_definition(self):
+        paths = [f'resource/{i}/aws_s3_bucket/bucket_{i}/acl/0' for i in range(self.resources_count)]
+
+        def data_path():
+            definitions = _create_definitions(self.resources_count)
+            for path in paths:
+                set_path(definitions, path, 'public')
+            return definitions
+
+        def dpath_path():
+            definitions = _create_definitions(self.resources_count)
+            for path in paths:
+                dpath.set(definitions, path, 'public')
+            return definitions
+
+        self.assertEqual(dpath_path(), data_path())
+
+    def test_evaluate_string_booleans(self):
+        def data_path():
+            definitions = _create_definitions(self.resources_count)
+            for _, container, key, value in walk_leaves(definitions):
+                if value == 'true':
+                    container[key] = True
+            return definitions
+
+        def dpath_path():
+            definitions = _create_definitions(self.resources_count)
+            for path, _ in dpath.util.search(definitions, '**', afilter=lambda x: x == 'true', yielded=True):
+                dpath.set(definitions, path, True)
+            return definitions
+
+        self.assertEqual(dpath_path(), data_path())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import unittest
+from unittest import mock
+
+import yaml
+
+from checkov.cloudformation.parser import cfn_yaml
+from checkov.common.util.document_store import DocumentStore, document_store
+from checkov.common.util.parse_cache import parse_cache
+from checkov.kubernetes.parser import k8_json, k8_yaml
+
+resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources', 'document_store')
+
+
+def _resource(name):
+    return os.path.join(resources_dir, name)
+
+
+class TestDocumentStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = DocumentStore()
+        parse_cache.enabled = False
+
+    def tearDown(self):
+        parse_cache.enabled = True
+
+    def test_files_are_composed_once_per_run_scope(self):
+        file_path = _resource('deployment.yaml')
+        with mock.patch('yaml.compose_all', wraps=yaml.compose_all) as compose_all:
+            with self.store.run_scope():
+                composition = self.store.compose(file_path)
+                self.assertIs(composition, self.store.compose(file_path))
+                self.assertEqual(compose_all.call_count, 1)
+            self.store.compose(file_path)
+            self.store.compose(file_path)
+            self.assertEqual(compose_all.call_count, 3)
+
+    def test_errors_are_raised_for_every_parser(self):
+        file_path = _resource('bad.yaml')
+        with self.store.run_scope():
+            self.assertEqual([], self.store.compose(file_path).nodes)
+            self.assertRaises(yaml.YAMLError, self.store.compose(file_path).get_nodes)
+            self.assertRaises(yaml.YAMLError, self.store.compose(file_path).get_single_node)
+        self.assertRaises(FileNotFoundError, self.store.read, _resource('missing.yaml'))
+
+    def test_single_document(self):
+        file_path = _resource('multi.yaml')
+        composition = self.store.compose(file_path)
+        self.assertEqual(2, len(composition.get_nodes()))
+        self.assertRaises(yaml.composer.ComposerError, composition.get_single_node)
+        self.assertIsNone(self.store.compose(_resource('empty.yaml')).get_single_node())
+
+    def test_parsers_share_the_composition(self):
+        file_path = _resource('deployment.yaml')
+        with mock.patch('yaml.compose_all', wraps=yaml.compose_all) as compose_all:
+            with document_store.run_scope():
+                cfn_template, cfn_lines = cfn_yaml.load(file_path)
+                k8_template, k8_lines = k8_yaml.load(file_path)
+            self.assertEqual(compose_all.call_count, 1)
+        self.assertEqual(cfn_lines, k8_lines)
+        self.assertEqual('Deployment', cfn_template['kind'])
+        self.assertEqual(1, cfn_template['__startline__'])
+        self.assertEqual(6, k8_template[0]['__endline__'])
+        with open(file_path) as fp:
+            self.assertEqual(list(yaml.load_all(fp.read(), Loader=k8_yaml.SafeLineLoader)), k8_template)
+
+    def test_k8_json_matches_wrapped_load(self):
+        for name in ['pod.json', 'pod_list.json', 'pods.json', 'pod_yaml.json']:
+            file_path = _resource(name)
+            self.assertEqual(k8_json.loads(file_path), k8_json.load(file_path)[0], name)
+
+
+if __name__ == '__main__':
+    unittest.main()
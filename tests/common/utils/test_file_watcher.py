@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from checkov.common.util.file_watcher import InotifyFileWatcher, PollingFileWatcher
+from tests.common.temp_files import make_temp_dir, write_file
+
+
+def _inotify_available():
+    # probed on an empty directory, as the watcher watches the directory's whole tree
+    probe_dir = tempfile.mkdtemp()
+    try:
+        InotifyFileWatcher(probe_dir).close()
+        return True
+    except (OSError, AttributeError, TypeError):
+        return False
+    finally:
+        shutil.rmtree(probe_dir)
+
+
+inotify_available = _inotify_available()
+
+
+class FileWatcherTestMixin(object):
+
+    def create_file_watcher(self, root_folder):
+        raise NotImplementedError()
+
+    def setUp(self):
+        self.root_folder = make_temp_dir(self)
+        self.existing_file = write_file(self.root_folder, 'main.tf', 'resource {}')
+        os.makedirs(os.path.join(self.root_folder, '.git'))
+        self.file_watcher = self.create_file_watcher(self.root_folder)
+        self.addCleanup(self.file_watcher.close)
+
+    def test_no_changes(self):
+        self.assertEqual(set(), self.file_watcher.wait_for_changes(timeout=0.1))
+
+    def test_changed_files(self):
+        write_file(self.root_folder, 'main.tf', 'resource "aws_s3_bucket" "bucket" {}')
+        created_file = write_file(self.root_folder, 'module/variables.tf', 'variable {}')
+        write_file(self.root_folder, '.git/index', 'ignored')
+        self.assertEqual({self.existing_file, created_file}, self.file_watcher.wait_for_changes(timeout=2))
+
+    def test_deleted_files(self):
+        os.remove(self.existing_file)
+        self.assertEqual({self.existing_file}, self.file_watcher.wait_for_changes(timeout=2))
+
+
+class TestPollingFileWatcher(FileWatcherTestMixin, unittest.TestCase):
+
+    def create_file_watcher(self, root_folder):
+        return PollingFileWatcher(root_folder, interval=0.05)
+
+    def setUp(self):
+        super().setUp()
+        # the modification times of the rewritten files should differ from the snapshot's
+        os.utime(self.existing_file, ns=(0, 0))
+        self.file_watcher._snapshot = self.file_watcher._take_snapshot()
+
+
+@unittest.skipUnless(inotify_available, 'inotify is not available')
+class TestInotifyFileWatcher(FileWatcherTestMixin, unittest.TestCase):
+
+    def create_file_watcher(self, root_folder):
+        return InotifyFileWatcher(root_folder)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import pickle
+import unittest
+
+from checkov.common.models.enums import CheckResult
+from checkov.common.output.record import Record
+from checkov.common.util.line_store import CodeBlock, FileLines, get_code_block, line_store, read_file_lines
+from tests.common.temp_files import make_temp_dir, write_file
+
+contents = {
+    'lf.tf': 'resource "a" "b" {\n  name = "c"\n}\n',
+    'crlf.tf': 'resource "a" "b" {\r\n  name = "c"\r\n}',
+    'unicode.tf': 'resource "a" "b" {\n  name = "été  "\n}\n\n',
+    'cr.tf': 'resource "a" "b" {\r  name = "c"\r}\n',
+    'empty.tf': '',
+}
+
+
+class TestLineStore(unittest.TestCase):
+
+    def setUp(self):
+        self.files_dir = make_temp_dir(self)
+
+    def test_code_blocks_are_the_sliced_lines(self):
+        for name, content in contents.items():
+            file_lines = read_file_lines(write_file(self.files_dir, name, content))
+            self.assertIsInstance(file_lines, FileLines)
+            lines = list(file_lines)
+            for start in range(-2, len(lines) + 2):
+                for stop in range(-2, len(lines) + 2):
+                    code_block = get_code_block(file_lines, start, stop)
+                    self.assertIsInstance(code_block, CodeBlock)
+                    self.assertEqual(lines[start:stop], code_block.get_lines(), (name, start, stop))
+                    self.assertEqual(len(lines[start:stop]), len(code_block))
+
+    def test_unbound_lines_are_sliced(self):
+        lines = [(1, 'a\n'), (2, 'b\n')]
+        self.assertEqual([(2, 'b\n')], get_code_block(lines, 1, 2))
+
+    def test_file_added_once(self):
+        file_path = write_file(self.files_dir, 'lf.tf', contents['lf.tf'])
+        file_lines = read_file_lines(file_path)
+        self.assertEqual(file_lines.file_id, read_file_lines(file_path).file_id)
+        self.assertIs(file_lines, line_store.bind(file_path, file_lines))
+        self.assertIsNone(line_store.bind(file_path, None))
+
+        write_file(self.files_dir, 'lf.tf', contents['lf.tf'] + '\n')
+        changed_file_lines = read_file_lines(file_path)
+        self.assertNotEqual(file_lines.file_id, changed_file_lines.file_id)
+        self.assertEqual(4, len(get_code_block(changed_file_lines, 0, None)))
+
+    def test_changed_file_keeps_its_read_lines(self):
+        file_path = write_file(self.files_dir, 'lf.tf', contents['lf.tf'])
+        file_lines = read_file_lines(file_path)
+        code_block = get_code_block(file_lines, 0, 3)
+        # the same number of lines and the same size, but a later modification time
+        write_file(self.files_dir, 'lf.tf', contents['lf.tf'].replace('c', 'd'))
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        self.assertEqual(list(file_lines), code_block.get_lines())
+
+    def test_changed_file_read_lines_released(self):
+        file_path = write_file(self.files_dir, 'lf.tf', contents['lf.tf'])
+        code_block = get_code_block(read_file_lines(file_path), 0, 3)
+        write_file(self.files_dir, 'lf.tf', contents['lf.tf'].replace('c', 'd'))
+        stat = os.stat(file_path)
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        with self.assertLogs('checkov.common.util.line_store', level='WARNING'):
+            self.assertEqual('  name = "d"\n', code_block.get_lines()[1][1])
+
+    def test_cleared_store(self):
+        file_lines = read_file_lines(write_file(self.files_dir, 'lf.tf', contents['lf.tf']))
+        code_block = get_code_block(file_lines, 0, 3)
+        line_store.clear()
+        self.assertEqual(0, len(line_store))
+        self.assertEqual([], code_block.get_lines())
+        self.assertEqual(0, len(code_block))
+        # the ids of the cleared files aren't reused
+        cr_file = write_file(self.files_dir, 'cr.tf', contents['cr.tf'])
+        self.assertNotEqual(file_lines.file_id, read_file_lines(cr_file).file_id)
+
+    def test_file_lines_pickled_as_list(self):
+        file_lines = read_file_lines(write_file(self.files_dir, 'lf.tf', contents['lf.tf']))
+        unpickled = pickle.loads(pickle.dumps(file_lines))
+        self.assertIs(list, type(unpickled))
+        self.assertEqual(list(file_lines), unpickled)
+
+    def test_record_code_block(self):
+        file_lines = read_file_lines(write_file(self.files_dir, 'lf.tf', contents['lf.tf']))
+        record = Record(check_id='CKV_T_1', check_name='check', check_result={'result': CheckResult.FAILED},
+                        code_block=get_code_block(file_lines, 0, 3), file_path='/lf.tf', file_line_range=[1, 3],
+                        resource='a.b', evaluations=None, check_class='check')
+        self.assertEqual(list(file_lines), record.code_block)
+        record_dict = record.get_dict()
+        self.assertEqual(['check_id', 'check_name', 'check_result', 'code_block', 'file_path', 'file_line_range',
+                          'resource', 'evaluations', 'check_class'], list(record_dict))
+        self.assertEqual(list(file_lines), record_dict['code_block'])
+        self.assertIn('name = "c"', str(record))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import unittest
+
+from checkov.common.util.parse_cache import ParseCache
+from checkov.cloudformation.parser import cfn_yaml
+from tests.common.temp_files import make_temp_dir, write_file
+
+
+class TestParseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = make_temp_dir(self)
+        self.files_dir = make_temp_dir(self)
+        self.cache = ParseCache(cache_dir=self.cache_dir)
+        self.parse_calls = []
+
+        @self.cache.cached('test_parser')
+        def parse(filename):
+            self.parse_calls.append(filename)
+            with open(filename) as fp:
+                content = fp.read()
+            if content.startswith('error'):
+                raise ValueError(content)
+            return content.upper(), content.splitlines()
+
+        self.parse = parse
+
+    def test_unchanged_file_is_not_parsed_again(self):
+        file_path = write_file(self.files_dir, 'a.yaml', 'key: value')
+        self.assertEqual(self.parse(file_path), ('KEY: VALUE', ['key: value']))
+        self.assertEqual(self.parse(file_path), ('KEY: VALUE', ['key: value']))
+        self.assertEqual(len(self.parse_calls), 1)
+
+    def test_cache_is_content_addressed(self):
+        file_path = write_file(self.files_dir, 'a.yaml', 'key: value')
+        copy_path = write_file(self.files_dir, 'b.yaml', 'key: value')
+        self.parse(file_path)
+        self.assertEqual(self.parse(copy_path), ('KEY: VALUE', ['key: value']))
+        write_file(self.files_dir, 'a.yaml', 'key: other')
+        self.assertEqual(self.parse(file_path), ('KEY: OTHER', ['key: other']))
+        self.assertEqual(self.parse_calls, [file_path, file_path])
+
+    def test_errors_are_cached(self):
+        file_path = write_file(self.files_dir, 'a.yaml', 'error in file')
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                self.parse(file_path)
+        self.assertEqual(len(self.parse_calls), 1)
+
+    def test_disabled_cache(self):
+        file_path = write_file(self.files_dir, 'a.yaml', 'key: value')
+        self.cache.enabled = False
+        self.parse(file_path)
+        self.parse(file_path)
+        self.assertEqual(len(self.parse_calls), 2)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_least_recently_used_entries_are_evicted(self):
+        self.cache.max_size = 1200
+        first_file = write_file(self.files_dir, 'first.yaml', 'a' * 200)
+        self.parse(first_file)
+        for i in range(10):
+            self.parse(write_file(self.files_dir, f'{i}.yaml', str(i) * 200))
+        self.assertLessEqual(sum(size for _, _, size in self.cache._entries()), self.cache.max_size)
+        self.parse(first_file)
+        self.assertEqual(self.parse_calls.count(first_file), 2)
+
+    def test_cfn_template_round_trip(self):
+        template_file = write_file(self.files_dir, 'template.yaml',
+                                   'Resources:\n  Bucket:\n    Type: AWS::S3::Bucket\n')
+        cached_load = self.cache.cached('cfn_yaml')(cfn_yaml.load.__wrapped__)
+        template, template_lines = cached_load(template_file)
+        cached_template, cached_template_lines = cached_load(template_file)
+        self.assertEqual(template, cached_template)
+        self.assertEqual(template_lines, cached_template_lines)
+        self.assertEqual(type(template), type(cached_template))
+        resource_name = next(iter(cached_template['Resources'].keys()))
+        self.assertEqual(resource_name.start_mark.line, next(iter(template['Resources'].keys())).start_mark.line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 import hcl2
 
+from checkov.common.checks.conf_columns import ConfColumns
 from checkov.common.models.enums import CheckResult
 from checkov.terraform.checks.resource.aws.SecurityGroupUnrestrictedIngress22 import check
 
@@ -296,6 +297,63 @@ resource "aws_security_group_rule" "ingress" {
         scan_result = check.scan_resource_conf(conf=resource_conf)
         self.assertEqual(CheckResult.PASSED, scan_result)
 
+    def test_scan_batch_same_as_scan(self):
+        hcl_res = hcl2.loads("""
+resource "aws_security_group_rule" "open" {
+  type        = "ingress"
+  from_port   = 0
+  to_port     = 100
+  cidr_blocks = ["0.0.0.0/0"]
+}
+
+resource "aws_security_group_rule" "private" {
+  type        = "ingress"
+  from_port   = 22
+  to_port     = 22
+  cidr_blocks = ["10.0.0.0/8"]
+}
+
+resource "aws_security_group_rule" "other_port" {
+  type        = "ingress"
+  from_port   = 222
+  to_port     = 222
+  cidr_blocks = ["0.0.0.0/0"]
+}
+
+resource "aws_security_group_rule" "no_cidr" {
+  type                     = "ingress"
+  from_port                = 22
+  to_port                  = 22
+  source_security_group_id = "sg-123456"
+}
+
+resource "aws_security_group_rule" "egress" {
+  type        = "egress"
+  from_port   = 22
+  to_port     = 22
+  cidr_blocks = ["0.0.0.0/0"]
+}
+
+resource "aws_security_group" "sg" {
+  ingress {
+    from_port   = 22
+    to_port     = 22
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+}
+
+resource "aws_security_group" "no_ingress" {
+  name = "sg"
+}
+        """)
+
+        confs = [conf for resource in hcl_res['resource'] for resources in resource.values() for conf in
+                 resources.values()]
+        expected = [check.scan_resource_conf(conf) for conf in confs]
+        self.assertEqual([CheckResult.FAILED, CheckResult.PASSED, CheckResult.PASSED, CheckResult.PASSED,
+                          CheckResult.UNKNOWN, CheckResult.FAILED, CheckResult.PASSED], expected)
+        self.assertEqual(expected, check.scan_batch(ConfColumns(confs, 'aws_security_group_rule')))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,5 @@
 import os
+import sys
 import unittest
 from unittest.mock import patch
 
@@ -35,5 +36,13 @@ class TestRegistry(unittest.TestCase):
         self.assertTrue(external_check_loaded)
         self.registry.checks['aws_s3_bucket'].remove(external_check)
 
+    def test_registry_external_dir_added_to_path_once(self):
+        # a directory without checks (no __init__.py), loaded by consecutive scans
+        external_dir = os.path.dirname(os.path.realpath(__file__)) + "/example_external_dir"
+        self.addCleanup(lambda: sys.path.remove(external_dir) if external_dir in sys.path else None)
+        for _ in range(3):
+            self.registry.load_external_checks(external_dir, RunnerFilter())
+        self.assertEqual(1, sys.path.count(external_dir))
+
 if __name__ == '__main__':
     unittest.main()
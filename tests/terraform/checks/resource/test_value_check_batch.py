@@ -0,0 +1,99 @@
+import unittest
+from unittest import mock
+
+from checkov.common.models.enums import CheckCategories, CheckResult
+from checkov.runner_filter import RunnerFilter
+from checkov.terraform.checks.resource.base_registry import Registry
+from checkov.terraform.checks.resource.base_resource_value_check import BaseResourceValueCheck
+from checkov.terraform.checks.resource.registry import resource_registry
+from checkov.terraform.checks.resource.value_check_batch import ValueCheckBatch
+
+
+class ExampleValueCheck(BaseResourceValueCheck):
+
+    def __init__(self, id, inspected_key, expected_value=True):
+        self.inspected_key = inspected_key
+        self.expected_value = expected_value
+        # the example checks are registered in the tests' registries only
+        with mock.patch.object(resource_registry, "register"):
+            super().__init__(name="Example value check", id=id, categories=[CheckCategories.GENERAL_SECURITY],
+                             supported_resources=['example_resource'])
+
+    def get_inspected_key(self):
+        return self.inspected_key
+
+    def get_expected_value(self):
+        return self.expected_value
+
+
+class ExampleScanningValueCheck(ExampleValueCheck):
+
+    def scan_resource_conf(self, conf):
+        return CheckResult.UNKNOWN
+
+
+class TestValueCheckBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.checks = [
+            ExampleValueCheck("CKV_T_1", "versioning/[0]/enabled"),
+            ExampleValueCheck("CKV_T_2", "versioning/[0]/mfa_delete"),
+            ExampleValueCheck("CKV_T_3", "*_block_device/[0]/encrypted"),
+            ExampleValueCheck("CKV_T_4", "logging/[0]/target_bucket", "logs"),
+            ExampleValueCheck("CKV_T_5", "nested/**/enabled"),
+        ]
+        self.confs = [
+            {},
+            {"versioning": [{"enabled": [True], "mfa_delete": [False]}]},
+            {"versioning": [{"enabled": ["var.enabled"]}], "logging": [{"target_bucket": ["other"]}]},
+            {"root_block_device": [{"encrypted": [True]}], "ebs_block_device": [{"encrypted": [False]}]},
+            {"root_block_device": [{"encrypted": [False]}], "nested": [{"a": [{"enabled": [True]}]}]},
+            {"other": [{"versioning": [{"enabled": [True]}], "target_bucket": ["logs"]}], "+enabled": [True]},
+        ]
+
+    def test_resolve_like_the_checks_alone(self):
+        batch = ValueCheckBatch(self.checks)
+        for conf in self.confs:
+            resolutions = batch.resolve(conf)
+            for check in self.checks:
+                try:
+                    expected_result = check.scan_resource_conf(conf)
+                except Exception as e:
+                    # e.g. a key matching more values, or a '**' key which isn't found (an invalid glob for dpath)
+                    self.assertRaises(type(e), check.scan_key_resolution, resolutions[check])
+                    continue
+                self.assertEqual(expected_result, check.scan_key_resolution(resolutions[check]))
+
+    def test_check_results(self):
+        check = self.checks[0]
+        self.assertEqual(CheckResult.FAILED, check.scan_resource_conf({}))
+        self.assertEqual(CheckResult.PASSED, check.scan_resource_conf(self.confs[1]))
+        self.assertEqual(CheckResult.PASSED, check.scan_resource_conf(self.confs[2]))
+        self.assertEqual(CheckResult.PASSED, check.scan_resource_conf(self.confs[5]))
+        self.assertRaises(ValueError, self.checks[2].scan_resource_conf, self.confs[3])
+        self.assertEqual(CheckResult.FAILED, self.checks[2].scan_resource_conf(self.confs[4]))
+        self.assertEqual(CheckResult.PASSED, self.checks[4].scan_resource_conf(self.confs[4]))
+
+    def test_registry_resolves_once_per_resource(self):
+        registry = Registry()
+        for check in self.checks[:4]:
+            registry.register(check)
+        scanning_check = ExampleScanningValueCheck("CKV_T_6", "enabled")
+        self.assertFalse(scanning_check.is_batched())
+        registry.register(scanning_check)
+
+        entity = {"example_resource": {"example": self.confs[1]}}
+        with mock.patch.object(ValueCheckBatch, "resolve", autospec=True,
+                               side_effect=ValueCheckBatch.resolve) as resolve:
+            results = registry.scan("/main.tf", entity, {}, RunnerFilter())
+        self.assertEqual(1, resolve.call_count)
+        batch = resolve.call_args[0][0]
+        self.assertEqual(self.checks[:4], batch.checks)
+        self.assertEqual({"CKV_T_1": CheckResult.PASSED, "CKV_T_2": CheckResult.FAILED,
+                          "CKV_T_3": CheckResult.FAILED, "CKV_T_4": CheckResult.FAILED,
+                          "CKV_T_6": CheckResult.UNKNOWN},
+                         {check.id: result['result'] for check, result in results.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
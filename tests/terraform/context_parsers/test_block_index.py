@@ -0,0 +1,81 @@
+import unittest
+
+from checkov.terraform.context_parsers.block_index import BlockIndex
+
+file_content = '''resource "aws_s3_bucket" "bucket" {
+  bucket = "my-bucket"
+
+  versioning { enabled = true }
+  logging {
+    target_bucket = "logs"
+  }
+}
+
+provider "aws" {
+  region = "us-east-1"
+}
+
+provider "aws" {
+  alias  = "west"
+  region = "us-west-2"
+}
+
+locals {
+  tags = { Name = "bucket" }
+}
+
+resource "aws_s3_bucket" "unclosed" {
+  bucket = "unclosed"
+'''
+
+
+def _file_lines(content):
+    return [(ind + 1, line) for (ind, line) in enumerate(content.splitlines(keepends=True))]
+
+
+def _scan_end_line(filtered_lines, start_line_num):
+    # end line computation of a block by scanning the file from its start line
+    start_line_idx = [line_num for (line_num, _) in filtered_lines].index(start_line_num)
+    i = 1
+    for (line_num, line) in filtered_lines[start_line_idx + 1:]:
+        if '{' in line:
+            i = i + 1
+        if '}' in line:
+            i = i - 1
+            if i == 0:
+                return line_num
+    return 0
+
+
+class TestBlockIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.block_index = BlockIndex(_file_lines(file_content))
+
+    def test_filtered_lines(self):
+        self.assertEqual((1, 'resource "aws_s3_bucket" "bucket" {'), self.block_index.filtered_lines[0])
+        self.assertNotIn(3, [line_num for (line_num, _) in self.block_index.filtered_lines])
+
+    def test_find_lines(self):
+        self.assertEqual([1, 23], self.block_index.find_lines(['resource', 'aws_s3_bucket']))
+        self.assertEqual([1], self.block_index.find_lines(['resource', 'aws_s3_bucket', 'bucket']))
+        self.assertEqual([10, 14], self.block_index.find_lines(['provider', 'aws']))
+        self.assertEqual([], self.block_index.find_lines(['resource', 'aws_instance']))
+        self.assertEqual(['provider', 'aws', '{'], self.block_index.get_line_tokens(10))
+
+    def test_end_lines(self):
+        self.assertEqual(8, self.block_index.get_end_line(1))
+        self.assertEqual(7, self.block_index.get_end_line(5))
+        self.assertEqual(12, self.block_index.get_end_line(10))
+        self.assertEqual(21, self.block_index.get_end_line(19))
+        self.assertEqual(0, self.block_index.get_end_line(23))
+
+    def test_end_lines_match_scan(self):
+        filtered_lines = self.block_index.filtered_lines
+        for line_num, _ in filtered_lines:
+            self.assertEqual(_scan_end_line(filtered_lines, line_num), self.block_index.get_end_line(line_num),
+                             f'line {line_num}')
+
+
+if __name__ == '__main__':
+    unittest.main()
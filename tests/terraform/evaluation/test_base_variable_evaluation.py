@@ -53,6 +53,23 @@ class TestBaseVariableEvaluation(unittest.TestCase):
         self.assertEqual(BaseVariableEvaluation._generate_evaluation_regex(definition_type2, var_name2),
                          r"((?:\$\{)?var[.]customer_name(?:\})?)")
 
+    def test_map_entities_evaluations(self):
+        bucket_definition = {'definition_name': 'bucket', 'definition_expression': '${var.name}',
+                             'definition_path': 'resource/0/aws_s3_bucket/bucket/bucket/0'}
+        instance_definition = {'definition_name': 'ami', 'definition_expression': '${var.name}',
+                               'definition_path': 'resource/1/aws_instance/instance/ami/0'}
+        variables_evaluations = {'name': {'var_file': '/variables.tf', 'value': 'checkov',
+                                          'definitions': [bucket_definition, instance_definition]}}
+        entities_evaluations = BaseVariableEvaluation.map_entities_evaluations(variables_evaluations)
+
+        bucket_key = BaseVariableEvaluation.get_entity_key(['resource', 'aws_s3_bucket', 'bucket'])
+        instance_key = BaseVariableEvaluation.get_entity_key(['aws_instance', 'instance', 'resource'])
+        self.assertEqual({'name': {'var_file': '/variables.tf', 'value': 'checkov', 'definitions': [bucket_definition]}},
+                         entities_evaluations[bucket_key])
+        self.assertEqual([instance_definition], entities_evaluations[instance_key]['name']['definitions'])
+        # the file's evaluations are left untouched
+        self.assertEqual([bucket_definition, instance_definition], variables_evaluations['name']['definitions'])
+
     def tearDown(self):
         parser_registry.definitions_context = {}
 
@@ -0,0 +1,50 @@
+import copy
+import unittest
+
+from checkov.terraform.evaluation.reference_index import ReferenceIndex
+
+tf_definitions = {
+    '/main.tf': {
+        'resource': [{'aws_s3_bucket': {'bucket': {
+            'bucket': ['${var.name}-${local.suffix}'],
+            'acl': ['private'],
+            'tags': [{'Name': 'var.name_prefix', 'Count': 3}]
+        }}}]
+    },
+    '/other.tf': {
+        'locals': [{'suffix': ['var.other']}]
+    }
+}
+
+
+class TestReferenceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tf_definitions = copy.deepcopy(tf_definitions)
+        self.references = ReferenceIndex(self.tf_definitions)
+
+    def test_find(self):
+        self.assertEqual([
+            ('/main.tf', 'resource/0/aws_s3_bucket/bucket/bucket/0', '${var.name}-${local.suffix}'),
+            ('/main.tf', 'resource/0/aws_s3_bucket/bucket/tags/0/Name', 'var.name_prefix')
+        ], list(self.references.find('var', 'name')))
+        self.assertEqual([('/main.tf', 'resource/0/aws_s3_bucket/bucket/bucket/0', '${var.name}-${local.suffix}')],
+                         list(self.references.find('local', 'suffix')))
+        self.assertEqual([('/other.tf', 'locals/0/suffix/0', 'var.other')], list(self.references.find('var', 'other')))
+        self.assertEqual([], list(self.references.find('local', 'name')))
+
+    def test_update(self):
+        bucket = self.tf_definitions['/main.tf']['resource'][0]['aws_s3_bucket']['bucket']
+        bucket['acl'][0] = '${var.acl}'
+        # only indexed expressions are tracked, acl had no reference
+        self.references.update('/main.tf', 'resource/0/aws_s3_bucket/bucket/acl/0')
+        self.assertEqual([], list(self.references.find('var', 'acl')))
+
+        bucket['bucket'][0] = 'name-${var.acl}'
+        self.references.update('/main.tf', 'resource/0/aws_s3_bucket/bucket/bucket/0')
+        self.assertEqual([('/main.tf', 'resource/0/aws_s3_bucket/bucket/bucket/0', 'name-${var.acl}')],
+                         list(self.references.find('var', 'acl')))
+
+
+if __name__ == '__main__':
+    unittest.main()
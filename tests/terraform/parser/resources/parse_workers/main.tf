@@ -0,0 +1,8 @@
+module "logging" {
+  source = "./module"
+}
+
+resource "aws_s3_bucket" "main" {
+  bucket = "main-bucket"
+  acl    = "private"
+}
@@ -0,0 +1,7 @@
+variable "bucket_name" {
+  default = "module-bucket"
+}
+
+resource "aws_s3_bucket" "module" {
+  bucket = var.bucket_name
+}
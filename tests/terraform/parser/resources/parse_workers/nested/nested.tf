@@ -0,0 +1,3 @@
+resource "aws_s3_bucket" "nested" {
+  bucket = "nested-bucket"
+}
@@ -0,0 +1,35 @@
+import os
+import unittest
+
+from checkov.terraform.parser import Parser
+
+
+class TestParser(unittest.TestCase):
+
+    def setUp(self):
+        self.resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "resources", "parse_workers")
+
+    def _parse(self, parse_workers):
+        tf_definitions = {}
+        parsing_errors = {}
+        Parser(parse_workers=parse_workers).hcl2(directory=self.resources_dir, tf_definitions=tf_definitions,
+                                                 parsing_errors=parsing_errors)
+        return tf_definitions, parsing_errors
+
+    def test_hcl2_parses_local_modules(self):
+        tf_definitions, parsing_errors = self._parse(parse_workers=1)
+        self.assertIn(os.path.join(self.resources_dir, "main.tf"), tf_definitions)
+        self.assertIn(os.path.join(self.resources_dir, "nested", "nested.tf"), tf_definitions)
+        self.assertIn(os.path.join(self.resources_dir, "module", "module.tf"), tf_definitions)
+        self.assertEqual(list(parsing_errors.keys()), [os.path.join(self.resources_dir, "invalid.tf")])
+
+    def test_parse_workers_same_as_serial(self):
+        serial_definitions, serial_errors = self._parse(parse_workers=1)
+        parallel_definitions, parallel_errors = self._parse(parse_workers=3)
+        self.assertEqual(serial_definitions, parallel_definitions)
+        self.assertEqual(list(serial_definitions.keys()), list(parallel_definitions.keys()))
+        self.assertEqual(list(serial_errors.keys()), list(parallel_errors.keys()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,14 @@
 import os
 import unittest
+from unittest import mock
 
 import dpath.util
 
+from checkov.common.models.enums import CheckResult
 from checkov.runner_filter import RunnerFilter
 from checkov.terraform.context_parsers.registry import parser_registry
 from checkov.terraform.runner import Runner
+from tests.common.temp_files import make_temp_dir, write_file
 
 
 class TestRunnerValid(unittest.TestCase):
@@ -279,6 +282,51 @@ class TestRunnerValid(unittest.TestCase):
 
         self.assertEqual(len(result.passed_checks), 2)
 
+    def test_runner_specific_files_single_pass(self):
+        # Regression benchmark for the -f mode: every file must be enriched and scanned exactly once, so the work
+        # stays linear in the number of files instead of re-scanning all previously given files per file.
+        files_count = 30
+        tmp_dir = make_temp_dir(self)
+        files = []
+        for i in range(files_count):
+            content = f'resource "aws_s3_bucket" "bucket_{i}" {{\n  bucket = "bucket-{i}"\n  acl = "private"\n}}\n'
+            files.append(write_file(tmp_dir, f"bucket_{i}.tf", content))
+
+        from checkov.terraform.checks.resource.registry import resource_registry
+        runner_filter = RunnerFilter(checks='CKV_AWS_20')
+        with mock.patch.object(parser_registry, 'enrich_definitions_context',
+                               wraps=parser_registry.enrich_definitions_context) as enrich_mock, \
+                mock.patch.object(resource_registry, 'scan', wraps=resource_registry.scan) as scan_mock:
+            report = Runner().run(root_folder=None, external_checks_dir=None, files=files,
+                                  runner_filter=runner_filter)
+        self.assertEqual(enrich_mock.call_count, files_count)
+        self.assertEqual(scan_mock.call_count, files_count)
+
+        single_file_records = 0
+        for file_path in files:
+            single_file_records += len(Runner().run(root_folder=None, external_checks_dir=None, files=[file_path],
+                                                    runner_filter=runner_filter).passed_checks)
+        self.assertEqual(len(report.passed_checks), files_count)
+        self.assertEqual(len(report.passed_checks), single_file_records)
+        self.assertEqual(len({record.resource for record in report.passed_checks}), files_count)
+
+    def test_runner_records(self):
+        current_dir = os.path.dirname(os.path.realpath(__file__))
+        valid_dir_path = current_dir + "/resources/example"
+        report = Runner().run(root_folder=valid_dir_path, external_checks_dir=None)
+        parsing_errors = []
+        records = Runner().run_records(root_folder=valid_dir_path, external_checks_dir=None,
+                                       parsing_errors=parsing_errors)
+        first_record = next(records)
+        self.assertEqual(report.parsing_errors, parsing_errors)
+        self.assertEqual(1, len(parsing_errors))
+        records = [first_record] + list(records)
+        self.assertEqual(len(report.passed_checks) + len(report.failed_checks) + len(report.skipped_checks),
+                         len(records))
+        self.assertEqual([record.get_dict() for record in report.failed_checks],
+                         [record.get_dict() for record in records
+                          if record.check_result['result'] == CheckResult.FAILED])
+
     def tearDown(self):
         parser_registry.definitions_context = {}
 
@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from checkov.main import get_runners
+
+repository_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+# Modules which are slow to import, and are only needed by some of the runs
+DEFERRED_MODULES = ['boto3', 'botocore', 'urllib3', 'git', 'hcl2', 'lark', 'tabulate', 'http.server',
+                    'checkov.terraform.runner', 'checkov.cloudformation.runner', 'checkov.kubernetes.runner',
+                    'checkov.serverless.runner', 'checkov.arm.runner',
+                    'checkov.common.bridgecrew.platform_integration']
+
+
+class TestMain(unittest.TestCase):
+
+    def test_version_startup_deferred_imports(self):
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c',
+             'import sys; sys.argv = ["checkov", "--version"]; from checkov.main import run; run()'],
+            cwd=repository_root, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+
+        imported_modules = set()
+        for line in process.stderr.splitlines():
+            if line.startswith('import time:') and '|' in line:
+                imported_modules.add(line.split('|')[-1].strip())
+        self.assertIn('checkov.main', imported_modules)
+        self.assertEqual([], [module for module in DEFERRED_MODULES if module in imported_modules])
+
+    def test_runners_of_the_framework_only(self):
+        self.assertEqual(['kubernetes'], [runner.check_type for runner in get_runners('kubernetes')])
+        self.assertEqual(['terraform', 'cloudformation', 'kubernetes', 'serverless', 'arm'],
+                         [runner.check_type for runner in get_runners('all')])
+
+
+if __name__ == '__main__':
+    unittest.main()